@@ -154,8 +154,8 @@ class ListAvailabilityZone(command.Lister):
         network_client = self.app.client_manager.network
         try:
             # Verify that the extension exists.
-            network_client.find_extension('Availability Zone',
-                                          ignore_missing=False)
+            self.app.client_manager.find_network_extension(
+                'Availability Zone', ignore_missing=False)
         except Exception as e:
             LOG.debug('Network availability zone exception: ', e)
             if parsed_args.network:
@@ -0,0 +1,37 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""Common code shared by bulk commands"""
+
+import shlex
+import sys
+
+
+def read_argument_lines(path):
+    """Read a file holding the arguments of one command per line
+
+    Arguments are split like a shell would, empty lines and comments
+    starting with ``#`` are skipped.
+
+    :param path: path of the file, ``-`` to read standard input
+    :returns: a generator of (line number, list of arguments) tuples
+    """
+    if path == '-':
+        lines = sys.stdin.readlines()
+    else:
+        with open(path) as f:
+            lines = f.readlines()
+    for number, line in enumerate(lines, 1):
+        args = shlex.split(line, comments=True)
+        if args:
+            yield number, args
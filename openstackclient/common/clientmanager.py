@@ -15,10 +15,16 @@
 
 """Manage access to the clients, including authenticating when needed."""
 
+import hashlib
 import importlib
+import json
 import logging
+import os
 import sys
+import time
 
+import openstack.exceptions
+from openstack.network.v2 import extension as network_extension
 from osc_lib import clientmanager
 from osc_lib import shell
 import stevedore
@@ -65,6 +71,10 @@ class ClientManager(clientmanager.ClientManager):
         self._insecure = not self.verify
         # store original auth_type
         self._original_auth_type = cli_options.auth_type
+        # network endpoint detection result, computed once per session
+        self._network_endpoint_enabled = None
+        # network extensions, loaded once per session
+        self._network_extensions = None
 
     def setup_auth(self):
         """Set up authentication"""
@@ -113,13 +123,76 @@ class ClientManager(clientmanager.ClientManager):
             raise e
 
     def is_network_endpoint_enabled(self):
-        """Check if the network endpoint is enabled"""
+        """Check if the network endpoint is enabled
+
+        The answer found in the Service Catalog is kept for the rest of the
+        session and persisted in the cache of the cloud (if enabled), so
+        later invocations, including building command parsers before
+        authentication, don't need to look at the catalog again.
+        """
+        if self._network_endpoint_enabled is not None:
+            return self._network_endpoint_enabled
+
+        enabled = self.load_cache('network-endpoint')
+        if enabled is not None:
+            self._network_endpoint_enabled = enabled
+            return enabled
 
         # NOTE(dtroyer): is_service_available() can also return None if
         #                there is no Service Catalog, callers here are
         #                not expecting that so fold None into True to
         #                use Network API by default
-        return self.is_service_available('network') is not False
+        available = self.is_service_available('network')
+        enabled = available is not False
+        if available is not None:
+            self._network_endpoint_enabled = enabled
+            self.save_cache('network-endpoint', enabled)
+        return enabled
+
+    def get_network_extensions(self):
+        """Return the extensions of the Network service
+
+        The extensions are listed once per session and persisted in the
+        cache of the cloud (if enabled) for later invocations.
+
+        :returns: a list of extension dicts
+        """
+        if self._network_extensions is not None:
+            return self._network_extensions
+
+        extensions = self.load_cache('network-extensions')
+        if extensions is None:
+            extensions = [
+                ext.to_dict(computed=False)
+                for ext in self.network.extensions()
+            ]
+            self.save_cache('network-extensions', extensions)
+        self._network_extensions = extensions
+        return extensions
+
+    def find_network_extension(self, name_or_id, ignore_missing=True):
+        """Find a Network service extension by alias or name
+
+        This is a drop-in replacement for the ``find_extension`` call of
+        the network client answered from get_network_extensions().
+
+        :param name_or_id: the alias or name of the extension
+        :param bool ignore_missing: if False, raise
+            :class:`~openstack.exceptions.ResourceNotFound` when the
+            extension is not found instead of returning None
+        :returns: an :class:`~openstack.network.v2.extension.Extension`
+            or None
+        """
+        extensions = self.get_network_extensions()
+        for key in ('alias', 'name'):
+            for ext in extensions:
+                if ext.get(key) == name_or_id:
+                    return network_extension.Extension.existing(**ext)
+
+        if ignore_missing:
+            return None
+        raise openstack.exceptions.ResourceNotFound(
+            "No Extension found for %s" % name_or_id)
 
     def is_compute_endpoint_enabled(self):
         """Check if Compute endpoint is enabled"""
@@ -140,6 +213,84 @@ class ClientManager(clientmanager.ClientManager):
         else:
             return False
 
+    def get_cache_dir(self):
+        """Return the directory used for local caches of the current cloud
+
+        The directory lives below the cache path configured for the cloud
+        (``~/.cache/openstack`` unless overridden in clouds.yaml) and is not
+        created here. Its name is made of the cloud name and a hash of the
+        auth URL, region, project and interface, so that deployments and
+        scopes sharing a cloud name (or none) don't share their caches.
+        """
+        cache_path = (
+            self._cli_options.get_cache_path() or
+            os.path.join('~', '.cache', 'openstack')
+        )
+        auth = self._cli_options.config.get('auth') or {}
+        scope = json.dumps([
+            auth.get('auth_url') or auth.get('endpoint'),
+            self._cli_options.region_name,
+            auth.get('project_id') or auth.get('tenant_id'),
+            auth.get('project_name') or auth.get('tenant_name'),
+            auth.get('project_domain_id'),
+            auth.get('project_domain_name'),
+            self._cli_options.get_interface(),
+        ])
+        cloud = '%s-%s' % (
+            self._cli_options.name or 'envvars',
+            hashlib.sha256(scope.encode('utf-8')).hexdigest()[:16],
+        )
+        return os.path.join(os.path.expanduser(cache_path), 'osc', cloud)
+
+    def _get_cache_expiration(self, name):
+        return self._cli_options.get_cache_resource_expiration(
+            name, default=self._cli_options.get_cache_expiration_time())
+
+    def load_cache(self, name):
+        """Return a value stored with save_cache()
+
+        Values expire after the cache expiration time configured for the
+        cloud, either for ``name`` in ``cache.expiration`` or globally in
+        ``cache.expiration_time``, the cache being disabled by default.
+
+        :param name: the name the value was stored under
+        :returns: the stored value, or None if there is no unexpired value
+        """
+        expiration = self._get_cache_expiration(name)
+        if not expiration:
+            return None
+
+        path = os.path.join(self.get_cache_dir(), name + '.json')
+        try:
+            with open(path) as f:
+                cached = json.load(f)
+        except (IOError, ValueError) as e:
+            LOG.debug('Could not load cached %s: %s', name, e)
+            return None
+
+        if time.time() - cached.get('timestamp', 0) > expiration:
+            LOG.debug('Cached %s expired', name)
+            return None
+        return cached.get('value')
+
+    def save_cache(self, name, value):
+        """Store a JSON serializable value for load_cache()
+
+        Nothing is stored if the cache is disabled for ``name``. Failures
+        to write the cache are not fatal.
+        """
+        if not self._get_cache_expiration(name):
+            return
+
+        cache_dir = self.get_cache_dir()
+        path = os.path.join(cache_dir, name + '.json')
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            with open(path, 'w') as f:
+                json.dump({'timestamp': time.time(), 'value': value}, f)
+        except (IOError, OSError) as e:
+            LOG.debug('Could not save cached %s: %s', name, e)
+
 
 # Plugin Support
 
@@ -0,0 +1,35 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""Helpers to send API requests in parallel"""
+
+import concurrent.futures
+
+
+# Number of requests sent in parallel by bulk operations
+BULK_CONCURRENCY = 8
+
+
+def run_concurrently(func, items, max_workers=BULK_CONCURRENCY):
+    """Call a function on every item using a pool of threads
+
+    :returns: a list of (item, result, exception) tuples in the order of the
+        items, ``exception`` being ``None`` for successful calls
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+        futures = [(item, executor.submit(func, item)) for item in items]
+    results = []
+    for item, future in futures:
+        e = future.exception()
+        results.append((item, None if e else future.result(), e))
+    return results
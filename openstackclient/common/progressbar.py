@@ -55,13 +55,26 @@ class VerboseFileWrapper(_ProgressBarBase):
     wrapped file's read method is called.
     """
 
-    def read(self, *args, **kwargs):
-        data = self._wrapped.read(*args, **kwargs)
-        if data:
-            self._display_progress_bar(len(data))
+    def _advance(self, size_read):
+        if size_read:
+            self._display_progress_bar(size_read)
         else:
             if self._show_progress:
                 # Break to a new line from the progress bar for incoming
                 # output.
                 sys.stdout.write('\n')
+
+    def read(self, *args, **kwargs):
+        data = self._wrapped.read(*args, **kwargs)
+        self._advance(len(data))
         return data
+
+    def readinto(self, buffer):
+        """Read into a pre-allocated, writable bytes-like object
+
+        This avoids allocating a new bytes object for every chunk when the
+        consumer supports it.
+        """
+        size_read = self._wrapped.readinto(buffer)
+        self._advance(size_read)
+        return size_read
@@ -0,0 +1,429 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""Local resource snapshot action implementations"""
+
+import datetime
+import json
+import logging
+import os
+import sqlite3
+
+from osc_lib.cli import parseractions
+from osc_lib.command import command
+from osc_lib import exceptions
+from osc_lib import utils
+
+from openstackclient.i18n import _
+
+
+LOG = logging.getLogger(__name__)
+
+SNAPSHOT_FILE = 'resource-snapshot.db'
+
+
+def _list_servers(client_manager, changes_since=None):
+    search_opts = {'all_tenants': True}
+    if changes_since:
+        search_opts['changes-since'] = changes_since
+    for server in client_manager.compute.servers.list(
+            search_opts=search_opts, limit=-1):
+        yield server.to_dict()
+
+
+def _list_ports(client_manager, changes_since=None):
+    for port in client_manager.network.ports():
+        yield port.to_dict()
+
+
+def _list_networks(client_manager, changes_since=None):
+    for network in client_manager.network.networks():
+        yield network.to_dict()
+
+
+def _list_volumes(client_manager, changes_since=None):
+    for volume in client_manager.volume.volumes.list(
+            search_opts={'all_tenants': True}):
+        yield volume.to_dict()
+
+
+def _list_images(client_manager, changes_since=None):
+    for image in client_manager.image.images():
+        yield image.to_dict()
+
+
+# Resources that can be stored in a snapshot.
+#
+# ``list`` is called with the client manager and, for resources supporting
+# incremental refresh, the time of the previous sync.  ``incremental`` marks
+# resources whose API reports changes (including deletions) since a point
+# in time, all other resources are fully refreshed on every sync.  For
+# those, ``marker`` is the key holding the last update time reported by the
+# service, the next sync starts from the latest one.
+# ``columns`` are the (header, key) pairs displayed by default when listing
+# and ``filters`` map the filter options of the list command to keys.
+RESOURCES = {
+    'server': {
+        'list': _list_servers,
+        'incremental': True,
+        'marker': 'updated',
+        'columns': (
+            ('ID', 'id'),
+            ('Name', 'name'),
+            ('Status', 'status'),
+        ),
+        'filters': {
+            'status': 'status',
+            'project': 'tenant_id',
+            'host': 'OS-EXT-SRV-ATTR:host',
+        },
+    },
+    'port': {
+        'list': _list_ports,
+        'incremental': False,
+        'columns': (
+            ('ID', 'id'),
+            ('Name', 'name'),
+            ('MAC Address', 'mac_address'),
+            ('Status', 'status'),
+        ),
+        'filters': {
+            'status': 'status',
+            'project': 'project_id',
+            'host': 'binding_host_id',
+        },
+    },
+    'network': {
+        'list': _list_networks,
+        'incremental': False,
+        'columns': (
+            ('ID', 'id'),
+            ('Name', 'name'),
+            ('Status', 'status'),
+        ),
+        'filters': {
+            'status': 'status',
+            'project': 'project_id',
+        },
+    },
+    'volume': {
+        'list': _list_volumes,
+        'incremental': False,
+        'columns': (
+            ('ID', 'id'),
+            ('Name', 'name'),
+            ('Status', 'status'),
+            ('Size', 'size'),
+        ),
+        'filters': {
+            'status': 'status',
+            'project': 'os-vol-tenant-attr:tenant_id',
+            'host': 'os-vol-host-attr:host',
+        },
+    },
+    'image': {
+        'list': _list_images,
+        'incremental': False,
+        'columns': (
+            ('ID', 'id'),
+            ('Name', 'name'),
+            ('Status', 'status'),
+        ),
+        'filters': {
+            'status': 'status',
+            'project': 'owner',
+        },
+    },
+}
+
+# Filter options of the list command, applying to the resource types
+# mapping them to a key in RESOURCES
+FILTER_OPTIONS = ('status', 'project', 'host')
+
+
+class SnapshotStore(object):
+    """SQLite backed store of resource listings
+
+    Every resource is kept as a JSON document keyed by resource type and ID,
+    alongside the time of the last sync of each resource type.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.execute(
+            'CREATE TABLE IF NOT EXISTS resources ('
+            'resource TEXT NOT NULL, id TEXT NOT NULL, data TEXT NOT NULL, '
+            'PRIMARY KEY (resource, id))'
+        )
+        self.connection.execute(
+            'CREATE TABLE IF NOT EXISTS syncs ('
+            'resource TEXT PRIMARY KEY, synced_at TEXT NOT NULL)'
+        )
+
+    def close(self):
+        self.connection.close()
+
+    def get_synced_at(self, resource):
+        row = self.connection.execute(
+            'SELECT synced_at FROM syncs WHERE resource = ?', (resource,),
+        ).fetchone()
+        return row[0] if row else None
+
+    def count(self, resource):
+        return self.connection.execute(
+            'SELECT COUNT(*) FROM resources WHERE resource = ?', (resource,),
+        ).fetchone()[0]
+
+    def sync(self, resource, items, synced_at, full=True, marker=None):
+        """Store a listing of a resource type
+
+        :param resource: the resource type
+        :param items: iterable of resource dicts
+        :param synced_at: time the listing was started, as an ISO 8601 string
+        :param full: ``True`` if ``items`` is the complete listing, any
+            stored resource missing from it is removed.  ``False`` if it only
+            holds changes, resources in a ``DELETED`` state are removed.
+        :param marker: key of the items holding their last update time.
+            The latest one is stored as the time of the sync, ``synced_at``
+            is only stored if no item has one.
+        :returns: a tuple of the number of stored and removed resources
+        """
+        stored = removed = 0
+        latest = None
+        with self.connection:
+            if full:
+                self.connection.execute(
+                    'CREATE TEMP TABLE IF NOT EXISTS seen (id TEXT)')
+                self.connection.execute('DELETE FROM seen')
+            for item in items:
+                if marker and item.get(marker):
+                    latest = max(latest or item[marker], item[marker])
+                if not full and item.get('status') == 'DELETED':
+                    removed += self.connection.execute(
+                        'DELETE FROM resources WHERE resource = ? AND id = ?',
+                        (resource, item['id']),
+                    ).rowcount
+                    continue
+                self.connection.execute(
+                    'INSERT OR REPLACE INTO resources (resource, id, data) '
+                    'VALUES (?, ?, ?)',
+                    (resource, item['id'], json.dumps(item, default=str)),
+                )
+                if full:
+                    self.connection.execute(
+                        'INSERT INTO seen (id) VALUES (?)', (item['id'],))
+                stored += 1
+            if full:
+                removed = self.connection.execute(
+                    'DELETE FROM resources WHERE resource = ? AND '
+                    'id NOT IN (SELECT id FROM seen)', (resource,),
+                ).rowcount
+            self.connection.execute(
+                'INSERT OR REPLACE INTO syncs (resource, synced_at) '
+                'VALUES (?, ?)', (resource, latest or synced_at),
+            )
+        return stored, removed
+
+    def list(self, resource):
+        """Return a generator of the stored resource dicts"""
+        cursor = self.connection.execute(
+            'SELECT data FROM resources WHERE resource = ? ORDER BY id',
+            (resource,),
+        )
+        for (data,) in cursor:
+            yield json.loads(data)
+
+
+def _add_snapshot_file_option(parser):
+    parser.add_argument(
+        '--snapshot-file',
+        metavar='<snapshot-file>',
+        help=_('Snapshot file to use (default: %s in the cache '
+               'directory of the cloud)') % SNAPSHOT_FILE,
+    )
+
+
+def _open_store(client_manager, parsed_args):
+    path = parsed_args.snapshot_file
+    if not path:
+        cache_dir = client_manager.get_cache_dir()
+        os.makedirs(cache_dir, exist_ok=True)
+        path = os.path.join(cache_dir, SNAPSHOT_FILE)
+    return SnapshotStore(path)
+
+
+def _match(item, filters):
+    for key, value in filters.items():
+        if key not in item:
+            return False
+        found = item[key]
+        if isinstance(found, bool):
+            found = str(found).lower()
+            value = value.lower()
+        if str(found) != value:
+            return False
+    return True
+
+
+class SyncResourceSnapshot(command.Lister):
+    _description = _("Store resource listings in the local snapshot")
+
+    def get_parser(self, prog_name):
+        parser = super(SyncResourceSnapshot, self).get_parser(prog_name)
+        parser.add_argument(
+            '--resource',
+            metavar='<resource>',
+            action='append',
+            choices=sorted(RESOURCES),
+            help=_('Resource type to sync (repeat option to sync multiple '
+                   'resource types, default: all). The supported options '
+                   'are: %s') % ', '.join(sorted(RESOURCES)),
+        )
+        parser.add_argument(
+            '--full',
+            action='store_true',
+            default=False,
+            help=_('Fully refresh resource types that support incremental '
+                   'refresh'),
+        )
+        _add_snapshot_file_option(parser)
+        return parser
+
+    def take_action(self, parsed_args):
+        store = _open_store(self.app.client_manager, parsed_args)
+
+        data = []
+        try:
+            for resource in parsed_args.resource or sorted(RESOURCES):
+                spec = RESOURCES[resource]
+                changes_since = None
+                if spec['incremental'] and not parsed_args.full:
+                    changes_since = store.get_synced_at(resource)
+                # NOTE: The last update time reported by the service is
+                # stored when there is one so that client clock skew can't
+                # make the next incremental sync miss changes.
+                synced_at = (
+                    changes_since or datetime.datetime.utcnow().isoformat())
+                LOG.debug('Syncing %s (changes since: %s)',
+                          resource, changes_since)
+                items = spec['list'](
+                    self.app.client_manager, changes_since=changes_since)
+                stored, removed = store.sync(
+                    resource, items, synced_at, full=not changes_since,
+                    marker=spec.get('marker'))
+                data.append((
+                    resource,
+                    'incremental' if changes_since else 'full',
+                    stored,
+                    removed,
+                    store.count(resource),
+                ))
+        finally:
+            store.close()
+
+        columns = ('Resource', 'Mode', 'Stored', 'Removed', 'Total')
+        return (columns, data)
+
+
+class ListResourceSnapshot(command.Lister):
+    _description = _("List resources stored in the local snapshot")
+
+    def get_parser(self, prog_name):
+        parser = super(ListResourceSnapshot, self).get_parser(prog_name)
+        parser.add_argument(
+            'resource',
+            metavar='<resource>',
+            choices=sorted(RESOURCES),
+            help=_('Resource type to list. The supported options are: '
+                   '%s') % ', '.join(sorted(RESOURCES)),
+        )
+        parser.add_argument(
+            '--filter',
+            metavar='<key=value>',
+            action=parseractions.KeyValueAction,
+            default={},
+            help=_('Only list resources whose field <key> equals <value> '
+                   '(repeat option to filter on multiple fields)'),
+        )
+        parser.add_argument(
+            '--status',
+            metavar='<status>',
+            help=_('Only list resources with this status'),
+        )
+        parser.add_argument(
+            '--project',
+            metavar='<project-id>',
+            help=_('Only list resources of this project (ID only, the '
+                   'snapshot is queried offline)'),
+        )
+        parser.add_argument(
+            '--host',
+            metavar='<host>',
+            help=_('Only list resources on this host (server, port and '
+                   'volume only)'),
+        )
+        parser.add_argument(
+            '--long',
+            action='store_true',
+            default=False,
+            help=_('List all stored fields in output'),
+        )
+        _add_snapshot_file_option(parser)
+        return parser
+
+    def take_action(self, parsed_args):
+        spec = RESOURCES[parsed_args.resource]
+        filters = dict(parsed_args.filter)
+        for option in FILTER_OPTIONS:
+            value = getattr(parsed_args, option)
+            if value is None:
+                continue
+            if option not in spec['filters']:
+                msg = _("--%(option)s is not supported for %(resource)s "
+                        "snapshots")
+                raise exceptions.CommandError(
+                    msg % {'option': option,
+                           'resource': parsed_args.resource})
+            filters[spec['filters'][option]] = value
+
+        store = _open_store(self.app.client_manager, parsed_args)
+
+        try:
+            if store.get_synced_at(parsed_args.resource) is None:
+                msg = _("No snapshot of %(resource)s found, run "
+                        "'resource snapshot sync --resource %(resource)s' "
+                        "first")
+                raise exceptions.CommandError(
+                    msg % {'resource': parsed_args.resource})
+
+            data = [
+                item for item in store.list(parsed_args.resource)
+                if _match(item, filters)
+            ]
+        finally:
+            store.close()
+
+        if parsed_args.long:
+            keys = set()
+            for item in data:
+                keys.update(item)
+            columns = tuple(sorted(keys))
+            column_headers = columns
+        else:
+            column_headers, columns = zip(*spec['columns'])
+
+        return (
+            column_headers,
+            (utils.get_dict_properties(item, columns) for item in data),
+        )
@@ -15,7 +15,9 @@
 
 """Hypervisor action implementations"""
 
+import collections
 import json
+import logging
 import re
 
 from novaclient import api_versions
@@ -25,9 +27,89 @@ from osc_lib.command import command
 from osc_lib import exceptions
 from osc_lib import utils
 
+from openstackclient.common import concurrency
 from openstackclient.i18n import _
 
 
+LOG = logging.getLogger(__name__)
+
+# Number of hypervisor uptimes fetched in parallel
+UPTIME_CONCURRENCY = 8
+
+
+def _get_aggregate_index(aggregates):
+    """Index the names of the host aggregates by host"""
+    index = collections.defaultdict(list)
+    for aggregate in aggregates:
+        for host in aggregate.hosts:
+            index[host].append(aggregate.name)
+    return index
+
+
+def _get_host_aggregates(aggregate_index, host):
+    """Return the names of the host aggregates of a service host"""
+    # Hypervisors in nova cells are prefixed by "<cell>@"
+    if "@" in host:
+        cell, service_host = host.split('@', 1)
+    else:
+        cell = None
+        service_host = host
+
+    names = aggregate_index.get(service_host, [])
+    if cell:
+        # The host aggregates are also prefixed by "<cell>@"
+        names = [name for name in names if cell in name]
+    return names
+
+
+def _parse_uptime(uptime):
+    """Extract data from an uptime value
+
+    :returns: a dict with the ``host_time``, ``uptime``, ``users`` and
+        ``load_average`` keys, empty if the value can't be parsed
+    """
+    # format: 0 up 0,  0 users,  load average: 0, 0, 0
+    # example: 17:37:14 up  2:33,  3 users,
+    #          load average: 0.33, 0.36, 0.34
+    m = re.match(
+        r"\s*(.+)\sup\s+(.+),\s+(.+)\susers?,\s+load average:\s(.+)",
+        uptime or '')
+    if not m:
+        return {}
+    return {
+        "host_time": m.group(1),
+        "uptime": m.group(2),
+        "users": m.group(3),
+        "load_average": m.group(4),
+    }
+
+
+def _get_uptimes(compute_client, hypervisor_ids):
+    """Fetch the uptime of many hypervisors concurrently
+
+    :returns: a dict mapping hypervisor IDs to their parsed uptime, see
+        ``_parse_uptime``. Hypervisors whose uptime can't be fetched, for
+        instance because their compute service is down, are left out.
+    """
+    results = concurrency.run_concurrently(
+        compute_client.hypervisors.uptime, hypervisor_ids,
+        max_workers=UPTIME_CONCURRENCY)
+
+    uptimes = {}
+    for hypervisor_id, result, e in results:
+        if isinstance(e, nova_exceptions.HTTPNotImplemented):
+            continue
+        if isinstance(e, nova_exceptions.ClientException):
+            LOG.warning(_("Failed to get the uptime of hypervisor "
+                          "%(hypervisor)s: %(e)s"),
+                        {'hypervisor': hypervisor_id, 'e': e})
+            continue
+        if e:
+            raise e
+        uptimes[hypervisor_id] = _parse_uptime(result._info.get('uptime'))
+    return uptimes
+
+
 class ListHypervisor(command.Lister):
     _description = _("List hypervisors")
 
@@ -64,6 +146,16 @@ class ListHypervisor(command.Lister):
             action='store_true',
             help=_("List additional fields in output")
         )
+        parser.add_argument(
+            '--with-aggregates',
+            action='store_true',
+            help=_("List the host aggregates of the hypervisors")
+        )
+        parser.add_argument(
+            '--with-uptime',
+            action='store_true',
+            help=_("List the uptime of the hypervisors")
+        )
         return parser
 
     def take_action(self, parsed_args):
@@ -110,9 +202,35 @@ class ListHypervisor(command.Lister):
         else:
             data = compute_client.hypervisors.list(**list_opts)
 
+        extra_columns = ()
+        extra_data = {}
+        if parsed_args.with_aggregates or parsed_args.with_uptime:
+            data = list(data)
+            extra_data = {s.id: () for s in data}
+
+        if parsed_args.with_aggregates:
+            # Index the aggregates once rather than searching them for
+            # every hypervisor
+            aggregate_index = _get_aggregate_index(
+                compute_client.aggregates.list())
+            extra_columns += ("Aggregates",)
+            for s in data:
+                service = getattr(s, 'service', None) or {}
+                extra_data[s.id] += (format_columns.ListColumn(
+                    _get_host_aggregates(
+                        aggregate_index, service.get('host', ''))),)
+
+        if parsed_args.with_uptime:
+            uptimes = _get_uptimes(compute_client, [s.id for s in data])
+            extra_columns += ("Uptime",)
+            for s in data:
+                extra_data[s.id] += (
+                    uptimes.get(s.id, {}).get('uptime', ''),)
+
         return (
-            columns,
-            (utils.get_item_properties(s, columns) for s in data),
+            columns + extra_columns,
+            (utils.get_item_properties(s, columns) + extra_data.get(s.id, ())
+             for s in data),
         )
 
 
@@ -133,43 +251,14 @@ class ShowHypervisor(command.ShowOne):
         hypervisor = utils.find_resource(compute_client.hypervisors,
                                          parsed_args.hypervisor)._info.copy()
 
-        aggregates = compute_client.aggregates.list()
-        hypervisor["aggregates"] = list()
-        if aggregates:
-            # Hypervisors in nova cells are prefixed by "<cell>@"
-            if "@" in hypervisor['service']['host']:
-                cell, service_host = hypervisor['service']['host'].split(
-                    '@', 1)
-            else:
-                cell = None
-                service_host = hypervisor['service']['host']
-
-            if cell:
-                # The host aggregates are also prefixed by "<cell>@"
-                member_of = [aggregate.name
-                             for aggregate in aggregates
-                             if cell in aggregate.name and
-                             service_host in aggregate.hosts]
-            else:
-                member_of = [aggregate.name
-                             for aggregate in aggregates
-                             if service_host in aggregate.hosts]
-            hypervisor["aggregates"] = member_of
+        aggregate_index = _get_aggregate_index(
+            compute_client.aggregates.list())
+        hypervisor["aggregates"] = _get_host_aggregates(
+            aggregate_index, hypervisor['service']['host'])
 
         try:
             uptime = compute_client.hypervisors.uptime(hypervisor['id'])._info
-            # Extract data from uptime value
-            # format: 0 up 0,  0 users,  load average: 0, 0, 0
-            # example: 17:37:14 up  2:33,  3 users,
-            #          load average: 0.33, 0.36, 0.34
-            m = re.match(
-                r"\s*(.+)\sup\s+(.+),\s+(.+)\susers?,\s+load average:\s(.+)",
-                uptime['uptime'])
-            if m:
-                hypervisor["host_time"] = m.group(1)
-                hypervisor["uptime"] = m.group(2)
-                hypervisor["users"] = m.group(3)
-                hypervisor["load_average"] = m.group(4)
+            hypervisor.update(_parse_uptime(uptime['uptime']))
         except nova_exceptions.HTTPNotImplemented:
             pass
 
@@ -16,11 +16,13 @@
 """Compute v2 Server action implementations"""
 
 import argparse
+import datetime
 import getpass
 import io
 import json
 import logging
 import os
+import time
 
 from cliff import columns as cliff_columns
 import iso8601
@@ -37,6 +39,7 @@ from oslo_utils import strutils
 
 from openstackclient.i18n import _
 from openstackclient.identity import common as identity_common
+from openstackclient.image.v2 import image as image_v2
 from openstackclient.network import common as network_common
 
 
@@ -44,6 +47,9 @@ LOG = logging.getLogger(__name__)
 
 IMAGE_STRING_FOR_BFV = 'N/A (booted from volume)'
 
+# Name under which the image property index is cached
+IMAGE_PROPERTY_INDEX = 'image-property-index'
+
 
 class PowerStateColumn(cliff_columns.FormattableColumn):
     """Generate a formatted string of a server's power state."""
@@ -204,6 +210,99 @@ def boolenv(*vars, default=False):
     return default
 
 
+def _get_image_properties(image):
+    """Return the attributes and properties of an image with string values
+
+    Only string values can match the values given by ``--image-property``.
+    """
+    properties = {}
+    items = list(image.items())
+    if image.properties:
+        items.extend(image.properties.items())
+    for key, value in items:
+        if isinstance(value, str):
+            properties[key] = value
+    return properties
+
+
+def _build_image_property_index(images):
+    """Index image IDs by property and value
+
+    :returns: a dict mapping property names to dicts mapping values to the
+        IDs of the images with this property value, in listing order
+    """
+    index = {}
+    for image in images:
+        for key, value in _get_image_properties(image).items():
+            index.setdefault(key, {}).setdefault(value, []).append(image.id)
+    return index
+
+
+def _match_image_property_index(index, wanted_properties):
+    """Return the IDs of the indexed images with all the wanted properties"""
+    image_ids = None
+    for key, value in wanted_properties.items():
+        matching = index.get(key, {}).get(value, [])
+        if image_ids is None:
+            image_ids = matching
+        else:
+            matching = set(matching)
+            image_ids = [
+                image_id for image_id in image_ids if image_id in matching
+            ]
+    return image_ids or []
+
+
+def _match_image(client_manager, image_client, wanted_properties):
+    """Find the images matching all the wanted properties
+
+    Properties the Image API can filter on are used as filters of the
+    listing. Otherwise images are looked up in an index of the properties
+    of all images, cached for the cloud (if enabled) and rebuilt from a
+    full listing when it is missing, expired or finds no matching image.
+    """
+    def _matches(image):
+        properties = _get_image_properties(image)
+        return all(
+            properties.get(key) == value
+            for key, value in wanted_properties.items()
+        )
+
+    filters = {
+        key: value for key, value in wanted_properties.items()
+        if key in image_v2.PROPERTY_FILTER_CHOICES
+    }
+    if filters:
+        return [
+            image for image in image_client.images(**filters)
+            if _matches(image)
+        ]
+
+    index = client_manager.load_cache(IMAGE_PROPERTY_INDEX)
+    if index is not None:
+        images = []
+        for image_id in _match_image_property_index(
+                index, wanted_properties):
+            try:
+                image = image_client.get_image(image_id)
+            except sdk_exceptions.ResourceNotFound:
+                LOG.debug('Indexed image %s no longer exists', image_id)
+                continue
+            if _matches(image):
+                images.append(image)
+        if images:
+            return images
+
+    images = list(image_client.images())
+    index = _build_image_property_index(images)
+    client_manager.save_cache(IMAGE_PROPERTY_INDEX, index)
+    images_by_id = {image.id: image for image in images}
+    return [
+        images_by_id[image_id]
+        for image_id in _match_image_property_index(index, wanted_properties)
+    ]
+
+
 class AddFixedIP(command.ShowOne):
     _description = _("Add fixed IP address to server")
 
@@ -1264,42 +1363,11 @@ class CreateServer(command.ShowOne):
                         'chosen_one': img_uuid_list[0],
                     })
 
-            def _match_image(image_api, wanted_properties):
-                image_list = image_api.images()
-                images_matched = []
-                for img in image_list:
-                    img_dict = {}
-
-                    # exclude any unhashable entries
-                    img_dict_items = list(img.items())
-                    if img.properties:
-                        img_dict_items.extend(list(img.properties.items()))
-                    for key, value in img_dict_items:
-                        try:
-                            set([key, value])
-                        except TypeError:
-                            if key != 'properties':
-                                LOG.debug(
-                                    'Skipped the \'%s\' attribute. '
-                                    'That cannot be compared. '
-                                    '(image: %s, value: %s)',
-                                    key, img.id, value,
-                                )
-                            pass
-                        else:
-                            img_dict[key] = value
-
-                    if all(
-                        k in img_dict and img_dict[k] == v
-                        for k, v in wanted_properties.items()
-                    ):
-                        images_matched.append(img)
-
-                return images_matched
-
-            images = _match_image(image_client, parsed_args.image_properties)
+            images = _match_image(
+                self.app.client_manager, image_client,
+                parsed_args.image_properties)
             if len(images) > 1:
-                emit_duplicated_warning(images, parsed_args.image_properties)
+                emit_duplicated_warning(images)
             if images:
                 image = images[0]
             else:
@@ -2213,8 +2281,222 @@ class ListServer(command.Lister):
                 '(supported by --os-compute-api-version 2.26 or above)'
             ),
         )
+        parser.add_argument(
+            '--watch',
+            action='store_true',
+            default=False,
+            help=_(
+                'Keep polling for servers changed since the previous poll '
+                'and only display added, changed and deleted servers, with '
+                'the kind of change in an additional "Change" column. '
+                'Not compatible with --marker, --limit and --changes-before'
+            ),
+        )
+        parser.add_argument(
+            '--watch-interval',
+            metavar='<seconds>',
+            type=int,
+            default=10,
+            help=_('Seconds to wait between polls in watch mode '
+                   '(default: 10)'),
+        )
+        parser.add_argument(
+            '--watch-count',
+            metavar='<count>',
+            type=int,
+            default=None,
+            help=_('Number of polls after which watch mode stops '
+                   '(default: poll until interrupted)'),
+        )
         return parser
 
+    def _lookup_names(
+        self, data, images, flavors,
+        images_one_by_one=False, flavors_one_by_one=False,
+    ):
+        """Fill the image and flavor maps used for name lookup
+
+        When looking up one by one, only the images and flavors missing from
+        the maps are fetched.
+        """
+        compute_client = self.app.client_manager.compute
+        image_client = self.app.client_manager.image
+
+        # create a dict that maps image_id to image object, which is used
+        # to display the "Image Name" column. Note that 'image.id' can be
+        # empty for BFV instances and 'image' can be missing entirely if
+        # there are infra failures
+        if images_one_by_one:
+            for i_id in set(
+                s.image['id'] for s in data
+                if s.image and s.image.get('id')
+            ) - set(images):
+                # "Image Name" is not crucial, so we swallow any exceptions
+                try:
+                    images[i_id] = image_client.get_image(i_id)
+                except Exception:
+                    pass
+        else:
+            try:
+                images_list = image_client.images()
+                for i in images_list:
+                    images[i.id] = i
+            except Exception:
+                pass
+
+        # create a dict that maps flavor_id to flavor object, which is used
+        # to display the "Flavor Name" column. Note that 'flavor.id' is not
+        # present on microversion 2.47 or later and 'flavor' won't be
+        # present if there are infra failures
+        if flavors_one_by_one:
+            for f_id in set(
+                s.flavor['id'] for s in data
+                if s.flavor and s.flavor.get('id')
+            ) - set(flavors):
+                # "Flavor Name" is not crucial, so we swallow any
+                # exceptions
+                try:
+                    flavors[f_id] = compute_client.flavors.get(f_id)
+                except Exception:
+                    pass
+        else:
+            try:
+                flavors_list = compute_client.flavors.list(is_public=None)
+                for i in flavors_list:
+                    flavors[i.id] = i
+            except Exception:
+                pass
+
+    def _populate_servers(self, data, images, flavors):
+        """Set the attributes only used for display on server objects"""
+        compute_client = self.app.client_manager.compute
+
+        # Populate image_name, image_id, flavor_name and flavor_id attributes
+        # of server objects so that we can display those columns.
+        for s in data:
+            if compute_client.api_version >= api_versions.APIVersion('2.69'):
+                # NOTE(tssurya): From 2.69, we will have the keys 'flavor'
+                # and 'image' missing in the server response during
+                # infrastructure failure situations.
+                # For those servers with partial constructs we just skip the
+                # processing of the image and flavor informations.
+                if not hasattr(s, 'image') or not hasattr(s, 'flavor'):
+                    continue
+
+            if 'id' in s.image:
+                image = images.get(s.image['id'])
+                if image:
+                    s.image_name = image.name
+                s.image_id = s.image['id']
+            else:
+                # NOTE(melwitt): An server booted from a volume will have no
+                # image associated with it. We fill in the Image Name and ID
+                # with "N/A (booted from volume)" to help users who want to be
+                # able to grep for boot-from-volume servers when using the CLI.
+                s.image_name = IMAGE_STRING_FOR_BFV
+                s.image_id = IMAGE_STRING_FOR_BFV
+
+            if compute_client.api_version < api_versions.APIVersion('2.47'):
+                flavor = flavors.get(s.flavor['id'])
+                if flavor:
+                    s.flavor_name = flavor.name
+                s.flavor_id = s.flavor['id']
+            else:
+                s.flavor_name = s.flavor['original_name']
+
+        # Add a list with security group name as attribute
+        for s in data:
+            if hasattr(s, 'security_groups'):
+                s.security_groups_name = [x["name"] for x in s.security_groups]
+            else:
+                s.security_groups_name = []
+
+    @staticmethod
+    def _format_server(server, columns):
+        return utils.get_item_properties(
+            server, columns,
+            mixed_case_fields=(
+                'OS-EXT-STS:task_state',
+                'OS-EXT-STS:power_state',
+                'OS-EXT-AZ:availability_zone',
+                'OS-EXT-SRV-ATTR:host',
+            ),
+            formatters={
+                'OS-EXT-STS:power_state': PowerStateColumn,
+                'networks': format_columns.DictListColumn,
+                'metadata': format_columns.DictColumn,
+                'security_groups_name': format_columns.ListColumn,
+            },
+        )
+
+    def _watch(self, parsed_args, search_opts, columns, column_headers):
+        """Poll servers changed since the previous poll
+
+        An index of the displayed rows keyed by server ID is kept so that
+        only added, changed and deleted servers are emitted. The rows of
+        every poll but the last are emitted here, those of the last poll
+        are returned to be emitted as the command result.
+        """
+        compute_client = self.app.client_manager.compute
+
+        column_headers = ('Change',) + column_headers
+        index = {}
+        images = {}
+        flavors = {}
+        changes_since = search_opts['changes-since']
+        rows = []
+        polls = 0
+        try:
+            while True:
+                if polls:
+                    self.produce_output(parsed_args, column_headers, rows)
+                    time.sleep(parsed_args.watch_interval)
+
+                poll_started = datetime.datetime.utcnow().isoformat()
+                search_opts['changes-since'] = changes_since
+                LOG.debug('watch search options: %s', search_opts)
+                # Fetch every page, changes-since moves past all of them
+                data = compute_client.servers.list(
+                    search_opts=search_opts, limit=-1)
+
+                if data and not parsed_args.no_name_lookup:
+                    self._lookup_names(
+                        data, images, flavors,
+                        images_one_by_one=True, flavors_one_by_one=True)
+                self._populate_servers(data, images, flavors)
+
+                rows = []
+                for s in data:
+                    if s.status == 'DELETED':
+                        row = index.pop(s.id, None)
+                        if row is not None:
+                            rows.append(('deleted',) + row)
+                        continue
+                    row = self._format_server(s, columns)
+                    if s.id not in index:
+                        rows.append(('added',) + row)
+                    elif index[s.id] != row:
+                        rows.append(('changed',) + row)
+                    index[s.id] = row
+
+                # NOTE: Use the last update time reported by nova so that
+                # client clock skew can't make us miss changes; changes-since
+                # is inclusive and unchanged rows are not emitted again.
+                updated = [
+                    s.updated for s in data if getattr(s, 'updated', None)
+                ]
+                changes_since = max(updated) if updated else (
+                    changes_since or poll_started)
+
+                polls += 1
+                if parsed_args.watch_count and (
+                        polls >= parsed_args.watch_count):
+                    break
+        except KeyboardInterrupt:
+            rows = []
+
+        return (column_headers, rows)
+
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.compute
         identity_client = self.app.client_manager.identity
@@ -2357,6 +2639,23 @@ class ListServer(command.Lister):
                     search_opts['changes-before']
                 )
 
+        if parsed_args.watch and (
+                parsed_args.marker or parsed_args.limit or
+                search_opts['changes-before']):
+            msg = _(
+                '--watch is not compatible with --marker, --limit and '
+                '--changes-before'
+            )
+            raise exceptions.CommandError(msg)
+        if parsed_args.watch and parsed_args.watch_interval < 1:
+            msg = _('--watch-interval must be greater than 0')
+            raise exceptions.CommandError(msg)
+        if parsed_args.watch and (
+                parsed_args.watch_count is not None and
+                parsed_args.watch_count < 0):
+            msg = _('--watch-count must not be negative')
+            raise exceptions.CommandError(msg)
+
         if search_opts['changes-since']:
             try:
                 iso8601.parse_date(search_opts['changes-since'])
@@ -2463,6 +2762,10 @@ class ListServer(command.Lister):
             column_headers = tuple(column_headers)
             columns = tuple(columns)
 
+        if parsed_args.watch:
+            return self._watch(
+                parsed_args, search_opts, columns, column_headers)
+
         if parsed_args.marker:
             # Check if both "--marker" and "--deleted" are used.
             # In that scenario a lookup is not needed as the marker
@@ -2484,110 +2787,19 @@ class ListServer(command.Lister):
         images = {}
         flavors = {}
         if data and not parsed_args.no_name_lookup:
-            # create a dict that maps image_id to image object, which is used
-            # to display the "Image Name" column. Note that 'image.id' can be
-            # empty for BFV instances and 'image' can be missing entirely if
-            # there are infra failures
-            if parsed_args.name_lookup_one_by_one or image_id:
-                for i_id in set(
-                    s.image['id'] for s in data
-                    if s.image and s.image.get('id')
-                ):
-                    # "Image Name" is not crucial, so we swallow any exceptions
-                    try:
-                        images[i_id] = image_client.get_image(i_id)
-                    except Exception:
-                        pass
-            else:
-                try:
-                    images_list = image_client.images()
-                    for i in images_list:
-                        images[i.id] = i
-                except Exception:
-                    pass
-
-            # create a dict that maps flavor_id to flavor object, which is used
-            # to display the "Flavor Name" column. Note that 'flavor.id' is not
-            # present on microversion 2.47 or later and 'flavor' won't be
-            # present if there are infra failures
-            if parsed_args.name_lookup_one_by_one or flavor_id:
-                for f_id in set(
-                    s.flavor['id'] for s in data
-                    if s.flavor and s.flavor.get('id')
-                ):
-                    # "Flavor Name" is not crucial, so we swallow any
-                    # exceptions
-                    try:
-                        flavors[f_id] = compute_client.flavors.get(f_id)
-                    except Exception:
-                        pass
-            else:
-                try:
-                    flavors_list = compute_client.flavors.list(is_public=None)
-                    for i in flavors_list:
-                        flavors[i.id] = i
-                except Exception:
-                    pass
-
-        # Populate image_name, image_id, flavor_name and flavor_id attributes
-        # of server objects so that we can display those columns.
-        for s in data:
-            if compute_client.api_version >= api_versions.APIVersion('2.69'):
-                # NOTE(tssurya): From 2.69, we will have the keys 'flavor'
-                # and 'image' missing in the server response during
-                # infrastructure failure situations.
-                # For those servers with partial constructs we just skip the
-                # processing of the image and flavor informations.
-                if not hasattr(s, 'image') or not hasattr(s, 'flavor'):
-                    continue
-
-            if 'id' in s.image:
-                image = images.get(s.image['id'])
-                if image:
-                    s.image_name = image.name
-                s.image_id = s.image['id']
-            else:
-                # NOTE(melwitt): An server booted from a volume will have no
-                # image associated with it. We fill in the Image Name and ID
-                # with "N/A (booted from volume)" to help users who want to be
-                # able to grep for boot-from-volume servers when using the CLI.
-                s.image_name = IMAGE_STRING_FOR_BFV
-                s.image_id = IMAGE_STRING_FOR_BFV
-
-            if compute_client.api_version < api_versions.APIVersion('2.47'):
-                flavor = flavors.get(s.flavor['id'])
-                if flavor:
-                    s.flavor_name = flavor.name
-                s.flavor_id = s.flavor['id']
-            else:
-                s.flavor_name = s.flavor['original_name']
+            self._lookup_names(
+                data, images, flavors,
+                images_one_by_one=bool(
+                    parsed_args.name_lookup_one_by_one or image_id),
+                flavors_one_by_one=bool(
+                    parsed_args.name_lookup_one_by_one or flavor_id),
+            )
 
-        # Add a list with security group name as attribute
-        for s in data:
-            if hasattr(s, 'security_groups'):
-                s.security_groups_name = [x["name"] for x in s.security_groups]
-            else:
-                s.security_groups_name = []
+        self._populate_servers(data, images, flavors)
 
         table = (
             column_headers,
-            (
-                utils.get_item_properties(
-                    s, columns,
-                    mixed_case_fields=(
-                        'OS-EXT-STS:task_state',
-                        'OS-EXT-STS:power_state',
-                        'OS-EXT-AZ:availability_zone',
-                        'OS-EXT-SRV-ATTR:host',
-                    ),
-                    formatters={
-                        'OS-EXT-STS:power_state': PowerStateColumn,
-                        'networks': format_columns.DictListColumn,
-                        'metadata': format_columns.DictColumn,
-                        'security_groups_name': format_columns.ListColumn,
-                    },
-                ) for s in data
-            ),
+            (self._format_server(s, columns) for s in data),
         )
         return table
 
@@ -12,6 +12,8 @@
 
 """Compute v2 Server Migration action implementations"""
 
+import logging
+import time
 import uuid
 
 from novaclient import api_versions
@@ -19,10 +21,21 @@ from osc_lib.command import command
 from osc_lib import exceptions
 from osc_lib import utils
 
+from openstackclient.common import concurrency
 from openstackclient.i18n import _
 from openstackclient.identity import common as identity_common
 
 
+LOG = logging.getLogger(__name__)
+
+# Migration statuses after which a migration no longer changes without user
+# action; a resize left in 'finished' state waits for a confirm or revert.
+_FINAL_MIGRATION_STATUSES = (
+    'cancelled', 'completed', 'confirmed', 'done', 'error', 'failed',
+    'finished', 'reverted',
+)
+
+
 class ListMigration(command.Lister):
     _description = _("""List server migrations""")
 
@@ -117,9 +130,46 @@ class ListMigration(command.Lister):
             ),
         )
         identity_common.add_user_domain_option_to_parser(parser)
+        parser.add_argument(
+            '--with-server-name',
+            action='store_true',
+            help=_(
+                "Also show the name of the migrated servers, each server "
+                "being looked up once"
+            ),
+        )
+        parser.add_argument(
+            '--watch',
+            action='store_true',
+            help=_(
+                "Poll the migrations until the ones in progress when the "
+                "command starts are over, only fetching and displaying the "
+                "migrations added or changed since the previous poll "
+                "(supported with --os-compute-api-version 2.59 or above)"
+            ),
+        )
+        parser.add_argument(
+            '--watch-interval',
+            metavar='<seconds>',
+            type=int,
+            default=5,
+            help=_("Seconds between two polls with --watch (default: 5)"),
+        )
+        parser.add_argument(
+            '--watch-timeout',
+            metavar='<seconds>',
+            type=int,
+            default=3600,
+            help=_(
+                "Stop polling after this many seconds with --watch even if "
+                "some migrations are still in progress, 0 to never stop "
+                "(default: 3600)"
+            ),
+        )
         return parser
 
-    def print_migrations(self, parsed_args, compute_client, migrations):
+    def print_migrations(self, parsed_args, compute_client, migrations,
+                         server_names=None):
         column_headers = [
             'Source Node', 'Dest Node', 'Source Compute', 'Dest Compute',
             'Dest Host', 'Status', 'Server UUID', 'Old Flavor', 'New Flavor',
@@ -153,11 +203,109 @@ class ListMigration(command.Lister):
                 column_headers.insert(len(column_headers) - 2, "User")
                 columns.insert(len(columns) - 2, "user_id")
 
+        if server_names is None:
+            return (
+                column_headers,
+                (utils.get_item_properties(mig, columns)
+                 for mig in migrations),
+            )
+
+        # Insert server name after server UUID
+        index = columns.index('instance_uuid') + 1
+        column_headers.insert(index, 'Server Name')
         return (
             column_headers,
-            (utils.get_item_properties(mig, columns) for mig in migrations),
+            (utils.get_item_properties(mig, columns[:index]) +
+             (server_names.get(mig.instance_uuid, ''),) +
+             utils.get_item_properties(mig, columns[index:])
+             for mig in migrations),
         )
 
+    @staticmethod
+    def _get_server_names(compute_client, server_ids):
+        """Map the given server IDs to the name of the servers
+
+        The servers are fetched concurrently, those which can't be fetched,
+        such as deleted servers, are mapped to an empty name.
+        """
+        server_names = {}
+        for server_id, server, e in concurrency.run_concurrently(
+                compute_client.servers.get, server_ids):
+            if e is not None:
+                LOG.debug('Failed to get server %s: %s', server_id, e)
+                server_names[server_id] = ''
+            else:
+                server_names[server_id] = server.name
+        return server_names
+
+    @staticmethod
+    def _watch_migrations(compute_client, search_opts, interval, timeout,
+                          emit):
+        """Poll migrations until the ones in progress are over
+
+        The first poll lists the migrations matching ``search_opts``, the
+        following ones only fetch the migrations updated since the most
+        recent update seen so far. An index keyed by migration UUID is kept
+        so that only added and changed migrations are emitted. Only the
+        migrations in progress at the first poll are waited for, and no
+        longer than ``timeout`` seconds if set.
+
+        :param emit: called with the migrations added or changed by every
+            poll but the last
+        :returns: the migrations added or changed by the last poll
+        """
+        migrations = {}
+        opts = dict(search_opts)
+        watched = None
+        deadline = time.time() + timeout if timeout else None
+        changed = None
+        while True:
+            if changed is not None:
+                emit(changed)
+                time.sleep(interval)
+
+            changed = []
+            marker = None
+            while True:
+                page = compute_client.migrations.list(marker=marker, **opts)
+                for migration in page:
+                    previous = migrations.get(migration.uuid)
+                    if previous is None or (
+                            (previous.status, previous.updated_at) !=
+                            (migration.status, migration.updated_at)):
+                        changed.append(migration)
+                    migrations[migration.uuid] = migration
+                if not page:
+                    break
+                marker = page[-1].uuid
+
+            if watched is None:
+                watched = [
+                    migration_uuid
+                    for migration_uuid, migration in migrations.items()
+                    if migration.status not in _FINAL_MIGRATION_STATUSES
+                ]
+            running = [
+                migration_uuid for migration_uuid in watched
+                if migrations[migration_uuid].status not in
+                _FINAL_MIGRATION_STATUSES
+            ]
+            if not running:
+                return changed
+
+            if deadline is not None and time.time() + interval > deadline:
+                LOG.warning(_("Stopped watching after %(timeout)s seconds, "
+                              "%(count)s migrations are still in progress"),
+                            {'timeout': timeout, 'count': len(running)})
+                return changed
+
+            # changes_since is inclusive, the most recently updated
+            # migrations are fetched again which is harmless with the index
+            opts['changes_since'] = max(
+                migration.updated_at or migration.created_at
+                for migration in migrations.values()
+            )
+
     def take_action(self, parsed_args):
         compute_client = self.app.client_manager.compute
         identity_client = self.app.client_manager.identity
@@ -244,9 +392,54 @@ class ListMigration(command.Lister):
                 parsed_args.user_domain,
             ).id
 
-        migrations = compute_client.migrations.list(**search_opts)
+        server_names = None
+        if parsed_args.with_server_name:
+            server_names = {}
+
+        def _print_migrations(migrations):
+            if server_names is not None:
+                server_names.update(self._get_server_names(
+                    compute_client,
+                    dict.fromkeys(
+                        migration.instance_uuid for migration in migrations
+                        if migration.instance_uuid not in server_names)))
+            return self.print_migrations(
+                parsed_args, compute_client, migrations, server_names)
+
+        if parsed_args.watch:
+            if compute_client.api_version < api_versions.APIVersion('2.59'):
+                msg = _(
+                    '--os-compute-api-version 2.59 or greater is required to '
+                    'support the --watch option'
+                )
+                raise exceptions.CommandError(msg)
+
+            # A migration leaving the filtered status or page would never be
+            # seen as finished
+            for option in ('status', 'marker', 'limit', 'changes_before'):
+                if getattr(parsed_args, option):
+                    msg = _(
+                        '--watch cannot be used with the --%s option'
+                    ) % option.replace('_', '-')
+                    raise exceptions.CommandError(msg)
+
+            if parsed_args.watch_interval < 1:
+                msg = _('--watch-interval must be greater than 0')
+                raise exceptions.CommandError(msg)
+            if parsed_args.watch_timeout < 0:
+                msg = _('--watch-timeout must not be negative')
+                raise exceptions.CommandError(msg)
+
+            del search_opts['status']
+            migrations = self._watch_migrations(
+                compute_client, search_opts, parsed_args.watch_interval,
+                parsed_args.watch_timeout,
+                lambda changed: self.produce_output(
+                    parsed_args, *_print_migrations(changed)))
+        else:
+            migrations = compute_client.migrations.list(**search_opts)
 
-        return self.print_migrations(parsed_args, compute_client, migrations)
+        return _print_migrations(migrations)
 
 
 def _get_migration_by_uuid(compute_client, server_id, migration_uuid):
@@ -15,8 +15,11 @@
 
 """Service action implementations"""
 
+import collections
 import logging
+import time
 
+from novaclient import api_versions
 from openstack import utils as sdk_utils
 from osc_lib.command import command
 from osc_lib import exceptions
@@ -27,6 +30,11 @@ from openstackclient.i18n import _
 
 LOG = logging.getLogger(__name__)
 
+# Seconds between two polls of the servers being migrated off a host
+DRAIN_POLL_INTERVAL = 5
+# Server statuses allowing a live migration
+_LIVE_MIGRATION_STATUSES = ('ACTIVE', 'PAUSED')
+
 
 class DeleteService(command.Command):
     _description = _("Delete compute service(s)")
@@ -70,6 +78,261 @@ class DeleteService(command.Command):
             raise exceptions.CommandError(msg)
 
 
+class DrainService(command.Lister):
+    _description = _("Live migrate all the servers off compute host(s)")
+
+    def get_parser(self, prog_name):
+        parser = super(DrainService, self).get_parser(prog_name)
+        parser.add_argument(
+            "host",
+            metavar="<host>",
+            nargs="+",
+            help=_("Compute host(s) to drain")
+        )
+        parser.add_argument(
+            "--target-host",
+            metavar="<host>",
+            action="append",
+            default=[],
+            help=_("Live migrate the servers to this host rather than "
+                   "letting the scheduler pick one (repeat option to spread "
+                   "the servers over multiple hosts) (requires "
+                   "``--os-compute-api-version`` 2.30 or greater)")
+        )
+        parser.add_argument(
+            "--max-per-source",
+            metavar="<count>",
+            type=int,
+            default=2,
+            help=_("Maximum number of concurrent live migrations off each "
+                   "drained host (default: 2)")
+        )
+        parser.add_argument(
+            "--max-per-target",
+            metavar="<count>",
+            type=int,
+            default=None,
+            help=_("Maximum number of concurrent live migrations to each "
+                   "target host, only with --target-host (default: 2)")
+        )
+        parser.add_argument(
+            "--retries",
+            metavar="<count>",
+            type=int,
+            default=2,
+            help=_("Number of times a failed live migration is retried "
+                   "(default: 2)")
+        )
+        parser.add_argument(
+            "--timeout",
+            metavar="<seconds>",
+            type=int,
+            default=3600,
+            help=_("Seconds after which a live migration still in progress "
+                   "is considered failed, 0 to wait forever "
+                   "(default: 3600)")
+        )
+        parser.add_argument(
+            "--block-migration",
+            action="store_true",
+            help=_("Perform block live migrations "
+                   "(auto-configured from --os-compute-api-version 2.25)")
+        )
+        parser.add_argument(
+            "--disable",
+            action="store_true",
+            help=_("Disable the nova-compute service of the drained hosts "
+                   "first, so that no new server is scheduled on them")
+        )
+        return parser
+
+    def _disable_services(self, hosts):
+        compute_client = self.app.client_manager.sdk_connection.compute
+        requires_service_id = (
+            sdk_utils.supports_microversion(compute_client, '2.53'))
+        for host in hosts:
+            service_id = None
+            if requires_service_id:
+                service_id = SetService._find_service_by_host_and_binary(
+                    compute_client, host, 'nova-compute').id
+            compute_client.disable_service(
+                service_id, host, 'nova-compute', 'drained')
+
+    def take_action(self, parsed_args):
+
+        def _show_progress(done, total):
+            self.app.stdout.write('\rProgress: %s/%s' % (done, total))
+            self.app.stdout.flush()
+
+        compute_client = self.app.client_manager.compute
+
+        if parsed_args.max_per_target is None:
+            parsed_args.max_per_target = 2
+        elif not parsed_args.target_host:
+            msg = _("--max-per-target requires --target-host")
+            raise exceptions.CommandError(msg)
+        for option in ('max_per_source', 'max_per_target'):
+            if getattr(parsed_args, option) < 1:
+                msg = _("--%s must be greater than 0") % option.replace(
+                    '_', '-')
+                raise exceptions.CommandError(msg)
+        for option in ('retries', 'timeout'):
+            if getattr(parsed_args, option) < 0:
+                msg = _("--%s must not be negative") % option
+                raise exceptions.CommandError(msg)
+
+        if (parsed_args.target_host and
+                compute_client.api_version < api_versions.APIVersion('2.30')):
+            msg = _('--os-compute-api-version 2.30 or greater is required '
+                    'when using --target-host')
+            raise exceptions.CommandError(msg)
+
+        migrate_kwargs = {}
+        if parsed_args.block_migration:
+            migrate_kwargs['block_migration'] = True
+        elif compute_client.api_version < api_versions.APIVersion('2.25'):
+            migrate_kwargs['block_migration'] = False
+        else:
+            migrate_kwargs['block_migration'] = 'auto'
+        if compute_client.api_version < api_versions.APIVersion('2.25'):
+            migrate_kwargs['disk_over_commit'] = False
+
+        hosts = list(dict.fromkeys(parsed_args.host))
+        if parsed_args.disable:
+            self._disable_services(hosts)
+
+        # Per server: name, source host, target host, attempts and result
+        rows = collections.OrderedDict()
+        queue = collections.deque()
+        for host in hosts:
+            for server in compute_client.servers.list(
+                    search_opts={'host': host, 'all_tenants': True},
+                    limit=-1):
+                rows[server.id] = [server.name, host, '', 0, '']
+                if server.status in _LIVE_MIGRATION_STATUSES:
+                    queue.append(server)
+                else:
+                    rows[server.id][4] = _('skipped (%s)') % server.status
+
+        running = {}
+        started = {}
+        running_sources = collections.Counter()
+        running_targets = collections.Counter()
+
+        def _next_target():
+            free = [
+                t for t in parsed_args.target_host
+                if running_targets[t] < parsed_args.max_per_target
+            ]
+            if not free:
+                return None
+            return min(free, key=lambda t: running_targets[t])
+
+        def _finish(server_id, result):
+            server_row = rows[server_id]
+            running.pop(server_id)
+            started.pop(server_id)
+            running_sources[server_row[1]] -= 1
+            if server_row[2]:
+                running_targets[server_row[2]] -= 1
+            server_row[4] = result
+
+        def _retry_or_fail(server, e, retry_queue):
+            if rows[server.id][3] <= parsed_args.retries:
+                LOG.warning(_("Live migration of server %(server)s failed, "
+                              "retrying: %(e)s"), {'server': server.id,
+                                                   'e': e})
+                retry_queue.append(server)
+                return 'retrying'
+            LOG.error(_("Live migration of server %(server)s failed: "
+                        "%(e)s"), {'server': server.id, 'e': e})
+            return 'failed'
+
+        total = len(queue)
+        while queue or running:
+            # Start the migrations fitting in the per host limits, the
+            # servers which can't start yet are kept in the queue order
+            blocked = collections.deque()
+            while queue:
+                server = queue.popleft()
+                source = rows[server.id][1]
+                target = None
+                if parsed_args.target_host:
+                    target = _next_target()
+                if (running_sources[source] >= parsed_args.max_per_source or
+                        (parsed_args.target_host and target is None)):
+                    blocked.append(server)
+                    continue
+                rows[server.id][2] = target or ''
+                rows[server.id][3] += 1
+                try:
+                    server.live_migrate(host=target, **migrate_kwargs)
+                except Exception as e:
+                    # Retried after the next poll interval, not right away
+                    rows[server.id][4] = _retry_or_fail(server, e, blocked)
+                    continue
+                running[server.id] = server
+                started[server.id] = time.time()
+                running_sources[source] += 1
+                if target:
+                    running_targets[target] += 1
+            queue.extend(blocked)
+
+            if not queue and not running:
+                break
+
+            time.sleep(DRAIN_POLL_INTERVAL)
+
+            # Poll all the servers still on each drained host together
+            sources = {rows[server_id][1] for server_id in running}
+            listed = {}
+            for host in sources:
+                for server in compute_client.servers.list(
+                        search_opts={'host': host, 'all_tenants': True},
+                        limit=-1):
+                    listed[server.id] = server
+            for server_id, server in list(running.items()):
+                current = listed.get(server_id)
+                if current is None:
+                    _finish(server_id, 'migrated')
+                elif current.status == 'ERROR':
+                    _finish(server_id, 'failed')
+                elif (current.status in _LIVE_MIGRATION_STATUSES and
+                        not getattr(current, 'OS-EXT-STS:task_state', None)):
+                    # The migration ended without moving the server
+                    _finish(server_id, '')
+                    rows[server_id][4] = _retry_or_fail(
+                        server, _('server is still on its host'), queue)
+                elif parsed_args.timeout and (
+                        time.time() - started[server_id] >
+                        parsed_args.timeout):
+                    # Not retried, the server may still be migrating
+                    LOG.error(_("Live migration of server %(server)s did "
+                                "not complete within %(timeout)s seconds"),
+                              {'server': server_id,
+                               'timeout': parsed_args.timeout})
+                    _finish(server_id, 'failed')
+            _show_progress(
+                sum(1 for row in rows.values() if row[4] in (
+                    'migrated', 'failed')),
+                total)
+
+        if total:
+            self.app.stdout.write('\n')
+
+        columns = ('ID', 'Name', 'Source Host', 'Target Host', 'Attempts',
+                   'Result')
+        data = [(server_id,) + tuple(row) for server_id, row in rows.items()]
+
+        failed = sum(1 for row in rows.values() if row[4] == 'failed')
+        if failed:
+            self.produce_output(parsed_args, columns, data)
+            msg = _("%(failed)s of %(total)s servers failed to "
+                    "migrate.") % {'failed': failed, 'total': total}
+            raise exceptions.CommandError(msg)
+        return (columns, data)
+
+
 class ListService(command.Lister):
     _description = _("List compute services. Using "
                      "``--os-compute-api-version`` 2.53 or greater will "
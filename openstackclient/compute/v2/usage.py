@@ -16,17 +16,23 @@
 """Usage action implementations"""
 
 import collections
+import concurrent.futures
 import datetime
 import functools
 
 from cliff import columns as cliff_columns
 from novaclient import api_versions
 from osc_lib.command import command
+from osc_lib import exceptions
 from osc_lib import utils
 
 from openstackclient.i18n import _
 
 
+# Maximum number of date windows whose usage is fetched at the same time
+WINDOW_CONCURRENCY = 4
+
+
 # TODO(stephenfin): This exists in a couple of places and should be moved to a
 # common module
 class ProjectColumn(cliff_columns.FormattableColumn):
@@ -92,14 +98,18 @@ def _get_usage_list_marker(usage_list):
     return marker
 
 
-def _merge_usage(usage, next_usage):
-    usage.server_usages.extend(next_usage.server_usages)
+def _merge_usage_totals(usage, next_usage):
     usage.total_hours += next_usage.total_hours
     usage.total_memory_mb_usage += next_usage.total_memory_mb_usage
     usage.total_vcpus_usage += next_usage.total_vcpus_usage
     usage.total_local_gb_usage += next_usage.total_local_gb_usage
 
 
+def _merge_usage(usage, next_usage):
+    usage.server_usages.extend(next_usage.server_usages)
+    _merge_usage_totals(usage, next_usage)
+
+
 def _merge_usage_list(usages, next_usage_list):
     for next_usage in next_usage_list:
         if next_usage.tenant_id in usages:
@@ -108,6 +118,75 @@ def _merge_usage_list(usages, next_usage_list):
             usages[next_usage.tenant_id] = next_usage
 
 
+def _merge_window_usage(usage, next_usage):
+    # A server running across several date windows is in the usage of each
+    # of them, count it once with the hours of all the windows
+    servers = {s['instance_id']: s for s in usage.server_usages}
+    for server_usage in next_usage.server_usages:
+        server = servers.get(server_usage['instance_id'])
+        if server is None:
+            usage.server_usages.append(server_usage)
+        else:
+            server['hours'] = server.get('hours', 0) + server_usage.get(
+                'hours', 0)
+    _merge_usage_totals(usage, next_usage)
+
+
+def _get_windows(start, end, days):
+    """Split a date range into consecutive windows of at most ``days``"""
+    windows = []
+    while start < end:
+        window_end = min(start + datetime.timedelta(days=days), end)
+        windows.append((start, window_end))
+        start = window_end
+    return windows
+
+
+def _list_usage(compute_client, start, end, detailed=True):
+    """List the usage of all the projects over a date range"""
+    if (not detailed or
+            compute_client.api_version < api_versions.APIVersion("2.40")):
+        return compute_client.usage.list(start, end, detailed=detailed)
+
+    # If the number of instances used to calculate the usage is greater
+    # than CONF.api.max_limit, the usage will be split across multiple
+    # requests and the responses will need to be merged back together.
+    usages = collections.OrderedDict()
+    usage_list = compute_client.usage.list(start, end, detailed=True)
+    _merge_usage_list(usages, usage_list)
+    marker = _get_usage_list_marker(usage_list)
+    while marker:
+        next_usage_list = compute_client.usage.list(
+            start, end, detailed=True, marker=marker)
+        marker = _get_usage_list_marker(next_usage_list)
+        if marker:
+            _merge_usage_list(usages, next_usage_list)
+    return list(usages.values())
+
+
+def _list_window_usage(compute_client, windows, detailed=True):
+    """List the usage of all the projects over consecutive date windows
+
+    The windows are fetched concurrently and their usage is merged as they
+    are received, in the order of the windows.
+    """
+    if not windows:
+        return []
+    usages = collections.OrderedDict()
+    merge = _merge_window_usage if detailed else _merge_usage_totals
+    with concurrent.futures.ThreadPoolExecutor(
+            min(WINDOW_CONCURRENCY, len(windows))) as executor:
+        for usage_list in executor.map(
+                lambda w: _list_usage(compute_client, *w, detailed=detailed),
+                windows):
+            for usage in usage_list:
+                if usage.tenant_id in usages:
+                    merge(usages[usage.tenant_id], usage)
+                else:
+                    usages[usage.tenant_id] = usage
+    return list(usages.values())
+
+
 class ListUsage(command.Lister):
     _description = _("List resource usage per project")
 
@@ -126,18 +205,25 @@ class ListUsage(command.Lister):
             default=None,
             help=_("Usage range end date, ex 2012-01-20 (default: tomorrow)")
         )
+        parser.add_argument(
+            "--window-days",
+            metavar="<days>",
+            type=int,
+            default=None,
+            help=_("Split the usage range into windows of <days> days, "
+                   "fetched concurrently and merged together")
+        )
+        parser.add_argument(
+            "--no-server-usages",
+            action="store_true",
+            default=False,
+            help=_("Only fetch the usage totals of each project, without "
+                   "the usage of each server (removes the Servers column, "
+                   "requires --os-compute-api-version 2.39 or below)")
+        )
         return parser
 
     def take_action(self, parsed_args):
-
-        def _format_project(project):
-            if not project:
-                return ""
-            if project in project_cache.keys():
-                return project_cache[project].name
-            else:
-                return project
-
         compute_client = self.app.client_manager.compute
         columns = (
             "tenant_id",
@@ -167,32 +253,41 @@ class ListUsage(command.Lister):
         else:
             end = now + datetime.timedelta(days=1)
 
-        if compute_client.api_version < api_versions.APIVersion("2.40"):
-            usage_list = compute_client.usage.list(start, end, detailed=True)
+        detailed = not parsed_args.no_server_usages
+        if not detailed:
+            # Starting with 2.40 the usage is paginated by server, which
+            # can't be followed without the server usages
+            if compute_client.api_version >= api_versions.APIVersion("2.40"):
+                msg = _(
+                    '--os-compute-api-version 2.39 or below is required to '
+                    'support the --no-server-usages option'
+                )
+                raise exceptions.CommandError(msg)
+            columns = tuple(c for c in columns if c != "server_usages")
+            column_headers = tuple(h for h in column_headers if h != "Servers")
+
+        if parsed_args.window_days is not None:
+            if parsed_args.window_days < 1:
+                msg = _("--window-days must be greater than 0")
+                raise exceptions.CommandError(msg)
+            usage_list = _list_window_usage(
+                compute_client,
+                _get_windows(start, end, parsed_args.window_days),
+                detailed=detailed,
+            )
         else:
-            # If the number of instances used to calculate the usage is greater
-            # than CONF.api.max_limit, the usage will be split across multiple
-            # requests and the responses will need to be merged back together.
-            usages = collections.OrderedDict()
-            usage_list = compute_client.usage.list(start, end, detailed=True)
-            _merge_usage_list(usages, usage_list)
-            marker = _get_usage_list_marker(usage_list)
-            while marker:
-                next_usage_list = compute_client.usage.list(
-                    start, end, detailed=True, marker=marker)
-                marker = _get_usage_list_marker(next_usage_list)
-                if marker:
-                    _merge_usage_list(usages, next_usage_list)
-            usage_list = list(usages.values())
-
-        # Cache the project list
+            usage_list = _list_usage(
+                compute_client, start, end, detailed=detailed)
+
+        # Cache the project list, only project names of tables are displayed
         project_cache = {}
-        try:
-            for p in self.app.client_manager.identity.projects.list():
-                project_cache[p.id] = p
-        except Exception:
-            # Just forget it if there's any trouble
-            pass
+        if parsed_args.formatter == 'table':
+            try:
+                for p in self.app.client_manager.identity.projects.list():
+                    project_cache[p.id] = p
+            except Exception:
+                # Just forget it if there's any trouble
+                pass
 
         if parsed_args.formatter == 'table' and len(usage_list) > 0:
             self.app.stdout.write(_("Usage from %(start)s to %(end)s: \n") % {
@@ -17,9 +17,13 @@
 
 import argparse
 from base64 import b64encode
+from concurrent import futures
+import hashlib
+import json
 import logging
 import os
 import sys
+import threading
 
 import openstack.cloud._utils
 from openstack.image import image_signer
@@ -46,6 +50,13 @@ DEFAULT_DISK_FORMAT = 'raw'
 DISK_CHOICES = ["ami", "ari", "aki", "vhd", "vmdk", "raw", "qcow2", "vhdx",
                 "vdi", "iso", "ploop"]
 MEMBER_STATUS_CHOICES = ["accepted", "pending", "rejected", "all"]
+# Sort keys the Image API can sort on itself
+SORT_KEY_CHOICES = ["name", "status", "container_format", "disk_format",
+                    "size", "id", "created_at", "updated_at"]
+# Properties that map onto a query filter of the Image API
+PROPERTY_FILTER_CHOICES = ["name", "status", "visibility", "owner"]
+# Size of the chunks read from the network and hashed during downloads
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
 
 
 LOG = logging.getLogger(__name__)
@@ -107,6 +118,327 @@ def _get_member_columns(item):
     )
 
 
+def _is_server_sortable(sort):
+    """Check whether all keys of a ``<key>[:<direction>]`` list are
+    supported by the Image API sort parameter"""
+    for sort_item in sort.split(','):
+        key = sort_item.split(':', 1)[0].strip()
+        if key not in SORT_KEY_CHOICES:
+            return False
+    return True
+
+
+def _get_server_sort(sort):
+    """Build the Image API sort parameter from a ``<key>[:<direction>]``
+    list
+
+    The Image API sorts keys without a direction in descending order, they
+    are sorted in ascending order like the client-side sort does.
+    """
+    sort_items = []
+    for sort_item in sort.split(','):
+        key, sep, direction = sort_item.strip().partition(':')
+        sort_items.append('%s:%s' % (key, direction or 'asc'))
+    return ','.join(sort_items)
+
+
+def _filter_images(images, properties):
+    """Filter images on properties as they are received"""
+    for image in images:
+        matched = [image]
+        for attr, value in properties.items():
+            api_utils.simple_filter(
+                matched,
+                attr=attr,
+                value=value,
+                property_field='properties',
+            )
+        if matched:
+            yield image
+
+
+_write_lock = threading.Lock()
+
+
+def _pwrite(fd, data, offset):
+    """Write all of data to fd at offset, without moving the file offset"""
+    data = memoryview(data)
+    while data:
+        if hasattr(os, 'pwrite'):
+            written = os.pwrite(fd, data, offset)
+        else:
+            with _write_lock:
+                os.lseek(fd, offset, os.SEEK_SET)
+                written = os.write(fd, data)
+        data = data[written:]
+        offset += written
+
+
+def _pread(fd, size, offset):
+    """Read size bytes from fd at offset, without moving the file offset"""
+    if hasattr(os, 'pread'):
+        return os.pread(fd, size, offset)
+    with _write_lock:
+        os.lseek(fd, offset, os.SEEK_SET)
+        return os.read(fd, size)
+
+
+def _get_image_hasher(image):
+    """Return a hash object and the expected digest for an image
+
+    The multihash (os_hash_algo/os_hash_value) is preferred over the legacy
+    MD5 checksum. ``(None, None)`` is returned when the image has neither.
+    """
+    if image.hash_algo and image.hash_value:
+        try:
+            return hashlib.new(image.hash_algo), image.hash_value
+        except ValueError:
+            LOG.warning(
+                _("Unsupported hash algorithm %s, using checksum instead"),
+                image.hash_algo,
+            )
+    if image.checksum:
+        return hashlib.md5(), image.checksum
+    return None, None
+
+
+class _HashingFileWrapper(object):
+    """A file wrapper computing hashes of the data as it is read
+
+    Both ``read`` and ``readinto`` are supported, the latter hashing the
+    caller's buffer in place without copying it. Until the data is read in
+    full, seeking back to the start of the file restarts the hashes and any
+    other seek invalidates them. Once it is, the hashes are kept as they are
+    whatever is read next.
+    """
+
+    def __init__(self, wrapped, algorithms=('md5',)):
+        self._wrapped = wrapped
+        self._algorithms = algorithms
+        self._reset()
+
+    def _reset(self):
+        self.hashers = {a: hashlib.new(a) for a in self._algorithms}
+        self.complete = False
+        self.valid = True
+
+    def _update(self, data):
+        if self.complete:
+            return
+        if data:
+            for hasher in self.hashers.values():
+                hasher.update(data)
+        else:
+            self.complete = True
+
+    def hexdigest(self, algorithm='md5'):
+        """Return the hash of the data, or None if not read in full"""
+        if not (self.complete and self.valid):
+            return None
+        return self.hashers[algorithm].hexdigest()
+
+    def read(self, *args, **kwargs):
+        data = self._wrapped.read(*args, **kwargs)
+        self._update(data)
+        return data
+
+    def readinto(self, buffer):
+        size_read = self._wrapped.readinto(buffer)
+        self._update(memoryview(buffer)[:size_read])
+        return size_read
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        position = self._wrapped.seek(offset, whence)
+        if self.complete:
+            return position
+        if position == 0:
+            self._reset()
+        else:
+            self.valid = False
+        return position
+
+    def __getattr__(self, attr):
+        # Forward other attribute access to the wrapped object.
+        return getattr(self._wrapped, attr)
+
+
+def _verify_image_checksum(image_client, image, checksum):
+    """Compare the checksum computed by the Image service with ours
+
+    :returns: the refreshed image
+    """
+    image = image_client.get_image(image.id)
+    if image.checksum and image.checksum != checksum:
+        raise exceptions.CommandError(
+            _("Checksum mismatch for image %(id)s: expected %(expected)s, "
+              "got %(actual)s") %
+            {'id': image.id, 'expected': checksum,
+             'actual': image.checksum}
+        )
+    return image
+
+
+def _download_image_segments(
+    image_client, image, path, parallel, segment_size, resume=False,
+):
+    """Download an image in concurrent segments using HTTP range requests
+
+    Segments are written at their offset in a preallocated file. Completed
+    segments are hashed in order as soon as all the segments before them
+    are complete and recorded in a ``<path>.part`` state file, so that an
+    interrupted download can be resumed.
+
+    :returns: ``False`` if the Image service does not support range
+        requests and nothing was downloaded, ``True`` otherwise
+    :raises: CommandError if a later segment isn't answered with the
+        requested range, the completed segments can then be resumed
+    """
+    size = image.size or 0
+    url = '/images/%s/file' % image.id
+    state_path = path + '.part'
+    segments = [
+        (offset, min(offset + segment_size, size) - 1)
+        for offset in range(0, size, segment_size)
+    ]
+
+    done = set()
+    state = {
+        'image_id': image.id,
+        'size': size,
+        'segment_size': segment_size,
+    }
+    if resume and os.path.exists(state_path) and os.path.exists(path):
+        with open(state_path) as f:
+            previous = json.load(f)
+        if all(previous.get(k) == v for k, v in state.items()):
+            done = set(previous.get('done', []))
+        else:
+            LOG.warning(
+                _("Ignoring state of a different download in %s"),
+                state_path,
+            )
+
+    def _save_state():
+        state['done'] = sorted(done)
+        with open(state_path, 'w') as f:
+            json.dump(state, f)
+
+    def _request(index):
+        start, end = segments[index]
+        return image_client.get(
+            url,
+            headers={'Range': 'bytes=%d-%d' % (start, end)},
+            stream=True,
+        )
+
+    def _is_range(index, response):
+        # The Image service must answer with exactly the requested range,
+        # a full or different range would be written at the wrong offset
+        start, end = segments[index]
+        if response.status_code != 206:
+            return False
+        content_range = response.headers.get('Content-Range', '')
+        unit_range, _sep, total = content_range.partition('/')
+        return (
+            unit_range == 'bytes %d-%d' % (start, end) and
+            total in (str(size), '*')
+        )
+
+    def _write(index, response):
+        start, end = segments[index]
+        offset = start
+        for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+            _pwrite(fd, chunk, offset)
+            offset += len(chunk)
+        if offset != end + 1:
+            raise exceptions.CommandError(
+                _("Incomplete segment %(start)d-%(end)d of image %(id)s") %
+                {'start': start, 'end': end, 'id': image.id}
+            )
+        return index
+
+    def _download(index):
+        response = _request(index)
+        if not _is_range(index, response):
+            response.close()
+            start, end = segments[index]
+            raise exceptions.CommandError(
+                _("Image service did not return segment %(start)d-%(end)d "
+                  "of image %(id)s (status %(status)s, Content-Range "
+                  "%(range)s), use --resume to retry") %
+                {'start': start, 'end': end, 'id': image.id,
+                 'status': response.status_code,
+                 'range': response.headers.get('Content-Range')}
+            )
+        return _write(index, response)
+
+    pending = [i for i in range(len(segments)) if i not in done]
+    first_response = None
+    if pending:
+        # Probe range request support with the first pending segment
+        first_response = _request(pending[0])
+        if not _is_range(pending[0], first_response):
+            first_response.close()
+            # The whole image is downloaded again sequentially
+            if os.path.exists(state_path):
+                os.remove(state_path)
+            return False
+
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        if not done:
+            os.ftruncate(fd, 0)
+        os.ftruncate(fd, size)
+
+        hasher, expected = _get_image_hasher(image)
+        hashed = 0
+
+        def _hash_completed():
+            # Hash the contiguous run of completed segments
+            nonlocal hashed
+            while hashed < len(segments) and hashed in done:
+                start, end = segments[hashed]
+                offset = start
+                while hasher and offset <= end:
+                    chunk = _pread(
+                        fd, min(DOWNLOAD_CHUNK_SIZE, end + 1 - offset),
+                        offset)
+                    hasher.update(chunk)
+                    offset += len(chunk)
+                hashed += 1
+
+        with futures.ThreadPoolExecutor(max_workers=parallel) as executor:
+            jobs = []
+            if pending:
+                jobs.append(executor.submit(
+                    _write, pending[0], first_response))
+                jobs.extend(executor.submit(_download, i)
+                            for i in pending[1:])
+            _hash_completed()
+            try:
+                for job in futures.as_completed(jobs):
+                    done.add(job.result())
+                    _save_state()
+                    _hash_completed()
+            except BaseException:
+                for job in jobs:
+                    job.cancel()
+                raise
+    finally:
+        os.close(fd)
+
+    if os.path.exists(state_path):
+        os.unlink(state_path)
+    if hasher and hasher.hexdigest() != expected:
+        raise exceptions.CommandError(
+            _("Checksum mismatch for image %(id)s: expected %(expected)s, "
+              "got %(actual)s") %
+            {'id': image.id, 'expected': expected,
+             'actual': hasher.hexdigest()}
+        )
+    return True
+
+
 def get_data_file(args):
     if args.file:
         return (open(args.file, 'rb'), args.file)
@@ -423,12 +755,21 @@ class CreateImage(command.ShowOne):
             if filesize is not None:
                 kwargs['validate_checksum'] = False
                 kwargs['data'] = progressbar.VerboseFileWrapper(fp, filesize)
-        elif fname:
+        elif fname and not (parsed_args.sign_key_path or
+                            parsed_args.sign_cert_id):
+            # The SDK stores the owner_specified.openstack.* hashes of the
+            # file and checks for duplicate images
             kwargs['filename'] = fname
         elif fp:
             kwargs['validate_checksum'] = False
             kwargs['data'] = fp
 
+        # The MD5 checksum of the data, computed while the data is read for
+        # signing or for the upload, and compared with the checksum computed
+        # by the Image service once the upload is complete
+        checksum = None
+        upload_data = None
+
         # sign an image using a given local private key file
         if parsed_args.sign_key_path or parsed_args.sign_cert_id:
             if not parsed_args.file:
@@ -467,7 +808,15 @@ class CreateImage(command.ShowOne):
                              "could not be loaded."))
                     raise exceptions.CommandError(msg)
 
-                signature = signer.generate_signature(fp)
+                # Glance verifies the signature when the data is uploaded so
+                # it has to be known beforehand, the hashes are computed
+                # while reading the data for the signature.
+                hashing_fp = _HashingFileWrapper(fp, ('md5', 'sha256'))
+                signature = signer.generate_signature(hashing_fp)
+                checksum = hashing_fp.hexdigest('md5')
+                if checksum:
+                    kwargs['md5'] = checksum
+                    kwargs['sha256'] = hashing_fp.hexdigest('sha256')
                 signature_b64 = b64encode(signature)
                 kwargs['img_signature'] = signature_b64
                 kwargs['img_signature_certificate_uuid'] = sign_cert_id
@@ -498,8 +847,19 @@ class CreateImage(command.ShowOne):
             except TypeError:
                 info['volume_type'] = None
         else:
+            if 'data' in kwargs and not checksum:
+                upload_data = _HashingFileWrapper(kwargs['data'])
+                kwargs['data'] = upload_data
+
             image = image_client.create_image(**kwargs)
 
+            if upload_data is not None:
+                checksum = upload_data.hexdigest()
+            # Imported images are processed asynchronously, the checksum is
+            # not known yet
+            if checksum and not parsed_args.use_import:
+                image = _verify_image_checksum(image_client, image, checksum)
+
         if not info:
             info = _format_image(image)
 
@@ -580,7 +940,11 @@ class ListImage(command.Lister):
             metavar='<key=value>',
             action=parseractions.KeyValueAction,
             help=_('Filter output based on property '
-                   '(repeat option to filter on multiple properties)'),
+                   '(repeat option to filter on multiple properties). '
+                   'Properties supported by the Image API as query '
+                   'filters (%s) are filtered server-side, any other '
+                   'property is filtered while images are received') %
+            ', '.join(PROPERTY_FILTER_CHOICES),
         )
         parser.add_argument(
             '--name',
@@ -642,7 +1006,9 @@ class ListImage(command.Lister):
             default='name:asc',
             help=_("Sort output by selected keys and directions(asc or desc) "
                    "(default: name:asc), multiple keys and directions can be "
-                   "specified separated by comma"),
+                   "specified separated by comma. Sorting is done by the "
+                   "Image API when all keys are one of: %s") %
+            ', '.join(SORT_KEY_CHOICES),
         )
         parser.add_argument(
             "--limit",
@@ -726,22 +1092,29 @@ class ListImage(command.Lister):
             columns = ("ID", "Name", "Status")
             column_headers = columns
 
+        properties = {}
+        if parsed_args.property:
+            for attr, value in parsed_args.property.items():
+                if attr in PROPERTY_FILTER_CHOICES and attr not in kwargs:
+                    kwargs[attr] = value
+                else:
+                    properties[attr] = value
+
+        server_sort = _is_server_sortable(parsed_args.sort)
+        if server_sort:
+            kwargs['sort'] = _get_server_sort(parsed_args.sort)
+
         # List of image data received
         if 'limit' in kwargs:
             # Disable automatic pagination in SDK
             kwargs['paginated'] = False
-        data = list(image_client.images(**kwargs))
+        data = image_client.images(**kwargs)
 
-        if parsed_args.property:
-            for attr, value in parsed_args.property.items():
-                api_utils.simple_filter(
-                    data,
-                    attr=attr,
-                    value=value,
-                    property_field='properties',
-                )
+        if properties:
+            data = _filter_images(data, properties)
 
-        data = utils.sort_items(data, parsed_args.sort, str)
+        if not server_sort:
+            data = utils.sort_items(list(data), parsed_args.sort, str)
 
         return (
             column_headers,
@@ -828,6 +1201,30 @@ class SaveImage(command.Command):
             metavar="<filename>",
             help=_("Downloaded image save filename (default: stdout)"),
         )
+        parser.add_argument(
+            "--parallel",
+            metavar="<count>",
+            type=int,
+            default=None,
+            help=_("Download the image in segments using up to <count> "
+                   "concurrent HTTP range requests and verify its checksum "
+                   "(requires --file)"),
+        )
+        parser.add_argument(
+            "--segment-size",
+            metavar="<size-mb>",
+            type=int,
+            default=64,
+            help=_("Size of the segments of a parallel download, in "
+                   "megabytes (default: 64)"),
+        )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            default=False,
+            help=_("Resume an interrupted parallel download, only "
+                   "downloading the missing segments"),
+        )
         parser.add_argument(
             "image",
             metavar="<image>",
@@ -840,6 +1237,33 @@ class SaveImage(command.Command):
         image = image_client.find_image(parsed_args.image)
 
         output_file = parsed_args.file
+
+        if parsed_args.parallel or parsed_args.resume:
+            if output_file is None:
+                msg = _("--parallel and --resume require --file")
+                raise exceptions.CommandError(msg)
+            if parsed_args.parallel is not None and parsed_args.parallel < 1:
+                msg = _("--parallel must be a positive number")
+                raise exceptions.CommandError(msg)
+            if parsed_args.segment_size < 1:
+                msg = _("--segment-size must be a positive number")
+                raise exceptions.CommandError(msg)
+
+            if _download_image_segments(
+                image_client,
+                image,
+                output_file,
+                parsed_args.parallel or 1,
+                parsed_args.segment_size * 1024 * 1024,
+                resume=parsed_args.resume,
+            ):
+                return
+            LOG.warning(
+                _("Image service does not support range requests, "
+                  "downloading image %s sequentially"),
+                image.id,
+            )
+
         if output_file is None:
             output_file = getattr(sys.stdout, "buffer", sys.stdout)
 
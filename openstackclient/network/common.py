@@ -16,11 +16,17 @@ import contextlib
 import logging
 
 import openstack.exceptions
+from openstack.network.v2 import port as port_resource
+from openstack.network.v2 import security_group as security_group_resource
 from osc_lib.cli import parseractions
 from osc_lib.command import command
 from osc_lib import exceptions
+from osc_lib import utils as common_utils
+from osc_lib.utils import tags as _tag
 
+from openstackclient.common import bulk
 from openstackclient.i18n import _
+from openstackclient.identity import common as identity_common
 from openstackclient.network import utils
 
 
@@ -35,6 +41,11 @@ _required_opt_extensions_map = {
     'security_groups': 'security-groups',
 }
 
+# Default number of resources sent in a single bulk create request
+BULK_CHUNK_SIZE = 100
+# Maximum number of names or IDs used as filter in a single list request
+FILTER_CHUNK_SIZE = 100
+
 _NET_TYPE_NEUTRON = 'neutron'
 _NET_TYPE_COMPUTE = 'nova-network'
 _QUALIFIER_FMT = "%s\n\n*%s*"
@@ -45,16 +56,102 @@ def check_missing_extension_if_error(client_manager, attrs):
     # If specified option requires extension, then try to
     # find out if it exists. If it does not exist,
     # then an exception with the appropriate message
-    # will be thrown from within client.find_extension
+    # will be thrown from within client_manager.find_network_extension
     try:
         yield
     except openstack.exceptions.HttpException:
         for opt, ext in _required_opt_extensions_map.items():
             if opt in attrs:
-                client_manager.find_extension(ext, ignore_missing=False)
+                client_manager.find_network_extension(
+                    ext, ignore_missing=False)
         raise
 
 
+def find_resources(list_method, names_or_ids, by_id=False):
+    """Resolve names or IDs of many resources with few list requests
+
+    Resources are listed with filters holding many values at once, by ID
+    when ``by_id`` is set (the resource must support the ``id`` filter)
+    then by name. Values that cannot be resolved unambiguously this way,
+    including IDs of resources without an ``id`` filter, are left out:
+    callers fall back to the matching ``find_*`` call, which then either
+    finds the resource or reports why it cannot.
+
+    :param list_method: list method of the network client, e.g.
+        ``client.ports``
+    :param names_or_ids: names or IDs of resources
+    :param by_id: whether the resources can be listed by ID
+    :returns: a dict mapping the resolved names or IDs to resources
+    """
+    found = {}
+    pending = list(dict.fromkeys(names_or_ids))
+    filters = ('id', 'name') if by_id else ('name',)
+    for attr in filters:
+        matches = {}
+        for start in range(0, len(pending), FILTER_CHUNK_SIZE):
+            chunk = pending[start:start + FILTER_CHUNK_SIZE]
+            for obj in list_method(**{attr: chunk}):
+                matches.setdefault(getattr(obj, attr), []).append(obj)
+        for value in pending:
+            if len(matches.get(value, [])) == 1:
+                found[value] = matches[value][0]
+        pending = [value for value in pending if value not in found]
+        if not pending:
+            break
+    return found
+
+
+def get_list_fields(resource_type, column_headers, columns, parsed_args,
+                    required=()):
+    """Return the ``fields`` query restricting a listing to shown columns
+
+    Neutron returns whole resources unless the ``fields`` query parameter
+    names the attributes to return. Request only the attributes of the
+    columns selected for output (``--long``, ``-c``) and the ``required``
+    ones, using their server-side names.
+
+    :param resource_type: SDK resource class being listed
+    :param column_headers: headers of the columns of the listing
+    :param columns: SDK attribute names of the columns of the listing
+    :param parsed_args: parsed arguments of the command
+    :param required: SDK attribute names needed whatever the columns
+    :returns: a dict holding the ``fields`` query parameter, to be merged
+        into the query. Empty if the SDK does not accept this parameter for
+        ``resource_type``.
+    """
+    _headers, attrs = common_utils.calculate_header_and_attrs(
+        column_headers, columns, parsed_args)
+    return get_fields_query(resource_type, tuple(attrs) + tuple(required))
+
+
+# SDK resources whose listing accepts the ``fields`` query parameter
+_FIELDS_QUERY_RESOURCES = (
+    port_resource.Port,
+    security_group_resource.SecurityGroup,
+)
+
+
+def get_fields_query(resource_type, attrs):
+    """Return the ``fields`` query restricting a listing to attributes
+
+    :param resource_type: SDK resource class being listed
+    :param attrs: SDK attribute names to request
+    :returns: a dict holding the ``fields`` query parameter, to be merged
+        into the query. Empty if the SDK does not accept this parameter for
+        ``resource_type``.
+    """
+    # The SDK rejects unknown query parameters.
+    if resource_type not in _FIELDS_QUERY_RESOURCES:
+        return {}
+
+    fields = []
+    for attr in attrs:
+        name = getattr(getattr(resource_type, attr, None), 'name', attr)
+        if name not in fields:
+            fields.append(name)
+    return {'fields': tuple(fields)}
+
+
 class NetDetectionMixin(metaclass=abc.ABCMeta):
     """Convenience methods for nova-network vs. neutron decisions.
 
@@ -191,11 +288,12 @@ class NetworkAndComputeDelete(NetworkAndComputeCommand,
     def take_action(self, parsed_args):
         ret = 0
         resources = getattr(parsed_args, self.resource, [])
+        is_network = self.app.client_manager.is_network_endpoint_enabled()
 
         for r in resources:
             self.r = r
             try:
-                if self.app.client_manager.is_network_endpoint_enabled():
+                if is_network:
                     self.take_action_network(self.app.client_manager.network,
                                              parsed_args)
                 else:
@@ -327,3 +425,201 @@ class NeutronUnsetCommandWithExtraArgs(NeutronCommandWithExtraArgs):
                 result[_property['name']] = None
 
         return result
+
+
+class CachedFindProxy(object):
+    """Network client proxy memoizing its ``find_*`` lookups
+
+    Used when converting many resources at once, so that each referenced
+    resource is looked up only once whatever the number of resources
+    referencing it.
+    """
+
+    def __init__(self, client):
+        self._client = client
+        self._found = {}
+
+    def __getattr__(self, name):
+        attr = getattr(self._client, name)
+        if not name.startswith('find_'):
+            return attr
+
+        def find(*args, **kwargs):
+            key = (name, args, tuple(sorted(kwargs.items())))
+            if key not in self._found:
+                self._found[key] = attr(*args, **kwargs)
+            return self._found[key]
+        return find
+
+
+class _BulkClientManager(object):
+
+    def __init__(self, client_manager):
+        self._client_manager = client_manager
+        self.network = CachedFindProxy(client_manager.network)
+
+    def __getattr__(self, name):
+        return getattr(self._client_manager, name)
+
+
+class NeutronBulkCreate(command.Lister, metaclass=abc.ABCMeta):
+    """Neutron Bulk Create
+
+    Lister class for commands creating many resources of one type at once.
+    Each line of the input file holds the arguments of one ``create``
+    command of the resource. All lines are parsed and converted to
+    resource attributes by that ``create`` command, resolving every
+    referenced resource once, before anything is created. Resources are
+    then created with bulk requests, which Neutron accepts or rejects as a
+    whole.
+    """
+
+    # Resource name used in messages, e.g. 'port'
+    resource = None
+    # ShowOne command creating a single resource. It must implement
+    # _get_create_attrs(client_manager, parsed_args).
+    create_command = None
+    # Attributes of the resources shown along their ID
+    columns = ('name',)
+    column_headers = ('Name',)
+
+    @abc.abstractmethod
+    def _bulk_create(self, client, data):
+        """Create resources from a list of attribute dicts
+
+        :return: the created resources, in the order of ``data``
+        """
+
+    def get_parser(self, prog_name):
+        parser = super(NeutronBulkCreate, self).get_parser(prog_name)
+        parser.add_argument(
+            'file',
+            metavar='<file>',
+            help=_("File holding the arguments of one '%(resource)s "
+                   "create' command per line, '-' to read standard "
+                   "input. Empty lines and comments starting with '#' "
+                   "are ignored") % {'resource': self.resource},
+        )
+        parser.add_argument(
+            '--chunk-size',
+            metavar='<chunk-size>',
+            type=int,
+            default=BULK_CHUNK_SIZE,
+            help=_("Number of %(resource)ss created per request "
+                   "(default: %(default)s)") % {
+                       'resource': self.resource,
+                       'default': BULK_CHUNK_SIZE},
+        )
+        return parser
+
+    def _get_rows(self, path):
+        """Parse and convert the lines of a file
+
+        :returns: a list of (line number, parsed arguments, attributes)
+            tuples
+        """
+        create_command = self.create_command(self.app, self.app_args)
+        parser = create_command.get_parser(
+            '%s create' % self.resource)
+        client_manager = _BulkClientManager(self.app.client_manager)
+        projects = {}
+
+        rows = []
+        errors = 0
+        for number, args in bulk.read_argument_lines(path):
+            try:
+                try:
+                    row_args = parser.parse_args(args)
+                except SystemExit:
+                    # argparse already printed the reason
+                    raise exceptions.CommandError(_("Invalid arguments"))
+                # The identity client has no find_* lookups to memoize,
+                # resolve projects here and hide them from the converters.
+                project_id = None
+                if getattr(row_args, 'project', None) is not None:
+                    key = (row_args.project, row_args.project_domain)
+                    if key not in projects:
+                        projects[key] = identity_common.find_project(
+                            self.app.client_manager.identity, *key).id
+                    project_id = projects[key]
+                    row_args.project = None
+                attrs = create_command._get_create_attrs(
+                    client_manager, row_args)
+                if project_id is not None:
+                    attrs['project_id'] = project_id
+            except Exception as e:
+                LOG.error(_("Invalid %(resource)s on line %(line)s: %(e)s"),
+                          {'resource': self.resource, 'line': number, 'e': e})
+                errors += 1
+                continue
+            rows.append((number, row_args, attrs))
+
+        if errors:
+            msg = _("%(errors)s of %(total)s lines are invalid, no "
+                    "%(resource)s created.") % {
+                        'errors': errors,
+                        'total': errors + len(rows),
+                        'resource': self.resource}
+            raise exceptions.CommandError(msg)
+        return rows
+
+    def _create_rows(self, client, rows, chunk_size):
+        """Create the resources of rows with chunked bulk requests
+
+        :returns: a list of (row, resource) tuples in the order of
+            ``rows``, the resource being ``None`` if its creation failed
+        """
+        results = []
+        for start in range(0, len(rows), chunk_size):
+            chunk = rows[start:start + chunk_size]
+            chunk_attrs = [attrs for _number, _args, attrs in chunk]
+            try:
+                with check_missing_extension_if_error(
+                        self.app.client_manager, set().union(*chunk_attrs)):
+                    objs = list(self._bulk_create(client, chunk_attrs))
+            except Exception as e:
+                LOG.error(_("Failed to create %(resource)ss of lines "
+                            "%(first)s to %(last)s: %(e)s"),
+                          {'resource': self.resource, 'first': chunk[0][0],
+                           'last': chunk[-1][0], 'e': e})
+                results.extend((row, None) for row in chunk)
+                continue
+
+            for row, obj in zip(chunk, objs):
+                _number, row_args, attrs = row
+                if 'tags' not in attrs and hasattr(row_args, 'tags'):
+                    # tags cannot be set when created, so tags need to be
+                    # set later.
+                    _tag.update_tags_for_set(client, obj, row_args)
+                results.append((row, obj))
+        return results
+
+    def take_action(self, parsed_args):
+        if parsed_args.chunk_size < 1:
+            msg = _("Chunk size must be a positive number")
+            raise exceptions.CommandError(msg)
+
+        rows = self._get_rows(parsed_args.file)
+        results = self._create_rows(
+            self.app.client_manager.network, rows, parsed_args.chunk_size)
+
+        data = []
+        failed = 0
+        for (number, _args, attrs), obj in results:
+            if obj is None:
+                failed += 1
+            data.append(
+                (number, obj.id if obj is not None else None) +
+                common_utils.get_dict_properties(attrs, self.columns) +
+                ('created' if obj is not None else 'failed',))
+
+        column_headers = ('Line', 'ID') + self.column_headers + ('Result',)
+        if failed:
+            self.produce_output(parsed_args, column_headers, data)
+            msg = _("%(failed)s of %(total)s %(resource)ss failed to "
+                    "create.") % {
+                        'failed': failed,
+                        'total': len(rows),
+                        'resource': self.resource}
+            raise exceptions.CommandError(msg)
+        return (column_headers, data)
@@ -13,14 +13,20 @@
 
 """IP Floating action implementations"""
 
+import logging
+
+from openstack.network.v2 import port as port_resource
 from osc_lib import utils
 from osc_lib.utils import tags as _tag
 
+from openstackclient.common import concurrency
 from openstackclient.i18n import _
 from openstackclient.identity import common as identity_common
 from openstackclient.network import common
 
 
+LOG = logging.getLogger(__name__)
+
 _formatters = {
     'port_details': utils.format_dict,
 }
@@ -177,7 +183,7 @@ class CreateFloatingIP(common.NetworkAndComputeShowOne,
         attrs.update(
             self._parse_extra_properties(parsed_args.extra_properties))
         with common.check_missing_extension_if_error(
-                self.app.client_manager.network, attrs):
+                self.app.client_manager, attrs):
             obj = client.create_ip(**attrs)
 
         # tags cannot be set when created, so tags need to be set later.
@@ -221,6 +227,57 @@ class DeleteFloatingIP(common.NetworkAndComputeDelete):
         client.api.floating_ip_delete(self.r)
 
 
+def _get_server_ids(network_client, floating_ips):
+    """Return the IDs of the servers owning the ports of floating IPs
+
+    The owner of a port is taken from the ``port_details`` of the floating
+    IP when the Network API provides them, the other ports are listed with
+    few requests filtered by many IDs at once.
+
+    :returns: a dict mapping port IDs to server IDs
+    """
+    devices = {}
+    port_ids = []
+    for fip in floating_ips:
+        if not fip.port_id:
+            continue
+        if fip.port_details:
+            devices[fip.port_id] = (fip.port_details.get('device_id'),
+                                    fip.port_details.get('device_owner'))
+        else:
+            port_ids.append(fip.port_id)
+
+    port_ids = list(dict.fromkeys(port_ids))
+    query = common.get_fields_query(
+        port_resource.Port, ('id', 'device_id', 'device_owner'))
+    for start in range(0, len(port_ids), common.FILTER_CHUNK_SIZE):
+        chunk = port_ids[start:start + common.FILTER_CHUNK_SIZE]
+        for port in network_client.ports(id=chunk, **query):
+            devices[port.id] = (port.device_id, port.device_owner)
+
+    return {
+        port_id: device_id
+        for port_id, (device_id, device_owner) in devices.items()
+        if device_id and (device_owner or '').startswith('compute:')
+    }
+
+
+def _get_servers(compute_client, server_ids):
+    """Fetch servers concurrently
+
+    :returns: a dict mapping server IDs to servers, leaving out the servers
+        which could not be fetched
+    """
+    servers = {}
+    for server_id, server, e in concurrency.run_concurrently(
+            compute_client.servers.get, list(dict.fromkeys(server_ids))):
+        if e is not None:
+            LOG.debug('Failed to get server %s: %s', server_id, e)
+        else:
+            servers[server_id] = server
+    return servers
+
+
 class ListFloatingIP(common.NetworkAndComputeLister):
     # TODO(songminglong): Use SDK resource mapped attribute names once
     # the OSC minimum requirements include SDK 1.0
@@ -286,6 +343,13 @@ class ListFloatingIP(common.NetworkAndComputeLister):
         )
         _tag.add_tag_filtering_option_to_parser(
             parser, _('floating IP'), enhance_help=self.enhance_help_neutron)
+        parser.add_argument(
+            '--resolve',
+            action='store_true',
+            default=False,
+            help=self.enhance_help_neutron(
+                _("Also list the server owning the port of each floating IP"))
+        )
 
         return parser
 
@@ -359,11 +423,30 @@ class ListFloatingIP(common.NetworkAndComputeLister):
 
         data = client.ips(**query)
 
-        return (headers,
-                (utils.get_item_properties(
-                    s, columns,
-                    formatters={},
-                ) for s in data))
+        if not parsed_args.resolve:
+            return (headers,
+                    (utils.get_item_properties(
+                        s, columns,
+                        formatters={},
+                    ) for s in data))
+
+        data = list(data)
+        server_ids = _get_server_ids(network_client, data)
+        servers = _get_servers(
+            self.app.client_manager.compute, server_ids.values())
+
+        headers = headers + (
+            'Server ID',
+            'Server Name',
+        )
+        rows = []
+        for s in data:
+            server_id = server_ids.get(s.port_id)
+            server = servers.get(server_id)
+            rows.append(
+                utils.get_item_properties(s, columns, formatters={}) +
+                (server_id or '', server.name if server else ''))
+        return (headers, rows)
 
     def take_action_compute(self, client, parsed_args):
         columns = (
@@ -13,12 +13,17 @@
 
 """IP Availability Info implementations"""
 
+from openstack.network.v2 import network_ip_availability as \
+    ip_availability_resource
+from openstack.network.v2 import subnet as subnet_resource
 from osc_lib.cli import format_columns
 from osc_lib.command import command
 from osc_lib import utils
 
 from openstackclient.i18n import _
 from openstackclient.identity import common as identity_common
+from openstackclient.network import common
+from openstackclient.network.v2 import subnet as subnet_v2
 
 _formatters = {
     'subnet_ip_availability': format_columns.ListDictColumn,
@@ -35,6 +40,14 @@ def _get_columns(item):
     )
 
 
+def _get_utilization(total_ips, used_ips):
+    # Percentage of the allocatable addresses in use, a range without any
+    # allocatable address is reported as fully used.
+    if not total_ips:
+        return 100.0
+    return round(100.0 * used_ips / total_ips, 1)
+
+
 # TODO(ankur-gupta-f): Use the SDK resource mapped attribute names once
 # the OSC minimum requirements include SDK 1.0.
 class ListIPAvailability(command.Lister):
@@ -58,23 +71,81 @@ class ListIPAvailability(command.Lister):
             help=_("List IP availability of given project (name or ID)"),
         )
         identity_common.add_project_domain_option_to_parser(parser)
+        parser.add_argument(
+            '--detail',
+            action='store_true',
+            default=False,
+            help=_("List IP availability and utilization of each subnet "
+                   "with its allocation pools"),
+        )
+        parser.add_argument(
+            '--threshold',
+            metavar='<percent>',
+            type=float,
+            help=_("Flag networks (or subnets with --detail) whose IP "
+                   "utilization is at or above <percent>"),
+        )
         return parser
 
+    def _get_subnet_rows(self, client, filters, data):
+        query = dict(filters)
+        query.update(common.get_fields_query(
+            subnet_resource.Subnet, ('id', 'allocation_pools')))
+        pools = {
+            subnet.id: subnet.allocation_pools
+            for subnet in client.subnets(**query)
+        }
+
+        for net in data:
+            for subnet in net.subnet_ip_availability or []:
+                total_ips = subnet.get('total_ips', 0)
+                used_ips = subnet.get('used_ips', 0)
+                yield (
+                    net.network_id,
+                    net.network_name,
+                    subnet.get('subnet_id'),
+                    subnet.get('subnet_name'),
+                    subnet.get('cidr'),
+                    subnet_v2.AllocationPoolsColumn(
+                        pools.get(subnet.get('subnet_id')) or []),
+                    total_ips,
+                    used_ips,
+                    _get_utilization(total_ips, used_ips),
+                )
+
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
 
-        columns = (
-            'network_id',
-            'network_name',
-            'total_ips',
-            'used_ips',
-        )
-        column_headers = (
-            'Network ID',
-            'Network Name',
-            'Total IPs',
-            'Used IPs',
-        )
+        if parsed_args.detail:
+            columns = (
+                'network_id',
+                'network_name',
+                'subnet_ip_availability',
+            )
+            column_headers = (
+                'Network ID',
+                'Network Name',
+                'Subnet ID',
+                'Subnet Name',
+                'CIDR',
+                'Allocation Pools',
+                'Total IPs',
+                'Used IPs',
+                'Utilization (%)',
+            )
+        else:
+            columns = (
+                'network_id',
+                'network_name',
+                'total_ips',
+                'used_ips',
+            )
+            column_headers = (
+                'Network ID',
+                'Network Name',
+                'Total IPs',
+                'Used IPs',
+            )
 
         filters = {}
         if parsed_args.ip_version:
@@ -88,11 +159,30 @@ class ListIPAvailability(command.Lister):
                 parsed_args.project_domain,
             ).id
             filters['project_id'] = project_id
-        data = client.network_ip_availabilities(**filters)
-        return (column_headers,
-                (utils.get_item_properties(
-                    s, columns,
-                ) for s in data))
+
+        query = dict(filters)
+        query.update(common.get_fields_query(
+            ip_availability_resource.NetworkIPAvailability, columns))
+        data = client.network_ip_availabilities(**query)
+
+        if parsed_args.detail:
+            rows = self._get_subnet_rows(client, filters, list(data))
+        else:
+            rows = (utils.get_item_properties(s, columns) for s in data)
+
+        if parsed_args.threshold is None:
+            return (column_headers, rows)
+
+        if not parsed_args.detail:
+            column_headers = column_headers + ('Utilization (%)',)
+            rows = (
+                row + (_get_utilization(row[2], row[3]),) for row in rows
+            )
+        column_headers = column_headers + ('Above Threshold',)
+        rows = (
+            row + (row[-1] >= parsed_args.threshold,) for row in rows
+        )
+        return (column_headers, rows)
 
 
 class ShowIPAvailability(command.ShowOne):
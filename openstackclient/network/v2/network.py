@@ -14,6 +14,7 @@
 """Network action implementations"""
 
 from cliff import columns as cliff_columns
+from openstack.network.v2 import network as network_resource
 from osc_lib.cli import format_columns
 from osc_lib import utils
 from osc_lib.utils import tags as _tag
@@ -327,16 +328,20 @@ class CreateNetwork(common.NetworkAndComputeShowOne,
         )
         return parser
 
-    def take_action_network(self, client, parsed_args):
-        attrs = _get_attrs_network(self.app.client_manager, parsed_args)
+    def _get_create_attrs(self, client_manager, parsed_args):
+        attrs = _get_attrs_network(client_manager, parsed_args)
         if parsed_args.transparent_vlan:
             attrs['vlan_transparent'] = True
         if parsed_args.no_transparent_vlan:
             attrs['vlan_transparent'] = False
         attrs.update(
             self._parse_extra_properties(parsed_args.extra_properties))
+        return attrs
+
+    def take_action_network(self, client, parsed_args):
+        attrs = self._get_create_attrs(self.app.client_manager, parsed_args)
         with common.check_missing_extension_if_error(
-                self.app.client_manager.network, attrs):
+                self.app.client_manager, attrs):
             obj = client.create_network(**attrs)
 
         # tags cannot be set when created, so tags need to be set later.
@@ -353,6 +358,17 @@ class CreateNetwork(common.NetworkAndComputeShowOne,
         return (display_columns, data)
 
 
+class CreateNetworkBulk(common.NeutronBulkCreate):
+    _description = _("Create networks in bulk from a file of 'network "
+                     "create' arguments")
+
+    resource = 'network'
+    create_command = CreateNetwork
+
+    def _bulk_create(self, client, data):
+        return network_resource.Network.bulk_create(client, data)
+
+
 class DeleteNetwork(common.NetworkAndComputeDelete):
     _description = _("Delete network(s)")
 
@@ -732,7 +748,7 @@ class SetNetwork(common.NeutronCommandWithExtraArgs):
             self._parse_extra_properties(parsed_args.extra_properties))
         if attrs:
             with common.check_missing_extension_if_error(
-                    self.app.client_manager.network, attrs):
+                    self.app.client_manager, attrs):
                 client.update_network(obj, **attrs)
 
         # tags is a subresource and it needs to be updated separately.
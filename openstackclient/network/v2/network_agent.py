@@ -21,10 +21,17 @@ from osc_lib.command import command
 from osc_lib import exceptions
 from osc_lib import utils
 
+from openstackclient.common import concurrency
 from openstackclient.i18n import _
 
 LOG = logging.getLogger(__name__)
 
+# Methods listing the resources hosted by the agents of a type
+_HOSTED_RESOURCES = {
+    'DHCP agent': 'dhcp_agent_hosting_networks',
+    'L3 agent': 'agent_hosted_routers',
+}
+
 
 class AliveColumn(cliff_columns.FormattableColumn):
     def human_readable(self):
@@ -190,6 +197,14 @@ class ListNetworkAgent(command.Lister):
             metavar='<router>',
             help=_('List agents hosting this router (name or ID)')
         )
+        agent_type_group.add_argument(
+            '--with-resources',
+            action='store_true',
+            default=False,
+            help=_("Also list the number of networks hosted by each DHCP "
+                   "agent and of routers hosted by each L3 agent, and its "
+                   "deviation from the mean of the agents of the same type")
+        )
         parser.add_argument(
             '--long',
             action='store_true',
@@ -199,6 +214,46 @@ class ListNetworkAgent(command.Lister):
 
         return parser
 
+    def _get_hosted_resources(self, client, agents):
+        """Count the resources hosted by DHCP and L3 agents concurrently
+
+        :returns: a dict mapping agent IDs to (count, deviation) tuples,
+            the deviation being the percentage of difference with the mean
+            count of the agents of the same type
+        """
+        counts = {}
+
+        def _count(agent):
+            method = getattr(client, _HOSTED_RESOURCES[agent.agent_type])
+            counts[agent.id] = len(list(method(agent)))
+
+        agents = [agent for agent in agents
+                  if agent.agent_type in _HOSTED_RESOURCES]
+        for agent, _result, e in concurrency.run_concurrently(
+                _count, agents):
+            if e is None:
+                continue
+            LOG.warning(_("Failed to list resources hosted by agent "
+                          "%(agent)s: %(e)s"), {'agent': agent.id, 'e': e})
+
+        totals = {}
+        for agent in agents:
+            if agent.id in counts:
+                total = totals.setdefault(agent.agent_type, [0, 0])
+                total[0] += counts[agent.id]
+                total[1] += 1
+
+        result = {}
+        for agent in agents:
+            if agent.id not in counts:
+                continue
+            count = counts[agent.id]
+            total, number = totals[agent.agent_type]
+            mean = float(total) / number
+            deviation = round(100 * (count - mean) / mean) if mean else 0
+            result[agent.id] = (count, deviation)
+        return result
+
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
         columns = (
@@ -254,6 +309,18 @@ class ListNetworkAgent(command.Lister):
                 filters['host'] = parsed_args.host
 
             data = client.agents(**filters)
+
+        if parsed_args.with_resources:
+            data = list(data)
+            hosted = self._get_hosted_resources(client, data)
+            column_headers += ('Hosted Resources', 'Deviation (%)')
+            rows = []
+            for s in data:
+                rows.append(utils.get_item_properties(
+                    s, columns, formatters=_formatters,
+                ) + hosted.get(s.id, ('', '')))
+            return (column_headers, rows)
+
         return (column_headers,
                 (utils.get_item_properties(
                     s, columns, formatters=_formatters,
@@ -165,8 +165,8 @@ class CreateNetworkSegmentRange(command.ShowOne,
         network_client = self.app.client_manager.network
         try:
             # Verify that the extension exists.
-            network_client.find_extension('network-segment-range',
-                                          ignore_missing=False)
+            self.app.client_manager.find_network_extension(
+                'network-segment-range', ignore_missing=False)
         except Exception as e:
             msg = (_('Network segment range create not supported by '
                      'Network API: %(e)s') % {'e': e})
@@ -244,8 +244,8 @@ class DeleteNetworkSegmentRange(command.Command):
         network_client = self.app.client_manager.network
         try:
             # Verify that the extension exists.
-            network_client.find_extension('network-segment-range',
-                                          ignore_missing=False)
+            self.app.client_manager.find_network_extension(
+                'network-segment-range', ignore_missing=False)
         except Exception as e:
             msg = (_('Network segment range delete not supported by '
                      'Network API: %(e)s') % {'e': e})
@@ -310,8 +310,8 @@ class ListNetworkSegmentRange(command.Lister):
         network_client = self.app.client_manager.network
         try:
             # Verify that the extension exists.
-            network_client.find_extension('network-segment-range',
-                                          ignore_missing=False)
+            self.app.client_manager.find_network_extension(
+                'network-segment-range', ignore_missing=False)
         except Exception as e:
             msg = (_('Network segment ranges list not supported by '
                      'Network API: %(e)s') % {'e': e})
@@ -409,8 +409,8 @@ class SetNetworkSegmentRange(common.NeutronCommandWithExtraArgs):
         network_client = self.app.client_manager.network
         try:
             # Verify that the extension exists.
-            network_client.find_extension('network-segment-range',
-                                          ignore_missing=False)
+            self.app.client_manager.find_network_extension(
+                'network-segment-range', ignore_missing=False)
         except Exception as e:
             msg = (_('Network segment range set not supported by '
                      'Network API: %(e)s') % {'e': e})
@@ -451,8 +451,8 @@ class ShowNetworkSegmentRange(command.ShowOne):
         network_client = self.app.client_manager.network
         try:
             # Verify that the extension exists.
-            network_client.find_extension('network-segment-range',
-                                          ignore_missing=False)
+            self.app.client_manager.find_network_extension(
+                'network-segment-range', ignore_missing=False)
         except Exception as e:
             msg = (_('Network segment range show not supported by '
                      'Network API: %(e)s') % {'e': e})
@@ -0,0 +1,218 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""Network topology action implementations"""
+
+from openstack.network.v2 import floating_ip as floating_ip_resource
+from openstack.network.v2 import network as network_resource
+from openstack.network.v2 import port as port_resource
+from openstack.network.v2 import router as router_resource
+from openstack.network.v2 import subnet as subnet_resource
+from osc_lib.command import command
+
+from openstackclient.common import concurrency
+from openstackclient.i18n import _
+from openstackclient.identity import common as identity_common
+from openstackclient.network import common
+
+
+# Resources of a topology, with the client method listing them, the SDK
+# resource class and the attributes needed to link them.
+_RESOURCES = {
+    'router': (
+        'routers',
+        router_resource.Router,
+        ('id', 'name', 'external_gateway_info'),
+    ),
+    'network': (
+        'networks',
+        network_resource.Network,
+        ('id', 'name'),
+    ),
+    'subnet': (
+        'subnets',
+        subnet_resource.Subnet,
+        ('id', 'name', 'network_id'),
+    ),
+    'port': (
+        'ports',
+        port_resource.Port,
+        ('id', 'name', 'network_id', 'device_id', 'device_owner',
+         'fixed_ips'),
+    ),
+    'floating ip': (
+        'ips',
+        floating_ip_resource.FloatingIP,
+        ('id', 'name', 'port_id'),
+    ),
+}
+
+# Device owners of the ports of router interfaces
+_ROUTER_INTERFACE_OWNERS = (
+    'network:router_interface',
+    'network:router_interface_distributed',
+    'network:ha_router_replicated_interface',
+)
+
+
+def _fetch_resources(client, query):
+    """List all the resources of a topology concurrently
+
+    :returns: a dict mapping each resource type to a dict of the resources
+        by ID
+    """
+    def _list(resource):
+        method, resource_type, attrs = _RESOURCES[resource]
+        resource_query = dict(query)
+        resource_query.update(common.get_fields_query(resource_type, attrs))
+        return list(getattr(client, method)(**resource_query))
+
+    resources = {}
+    for resource, result, e in concurrency.run_concurrently(
+            _list, list(_RESOURCES), max_workers=len(_RESOURCES)):
+        if e:
+            raise e
+        resources[resource] = {obj.id: obj for obj in result}
+    return resources
+
+
+def _get_edges(resources):
+    """Link the resources of a topology
+
+    Routers are linked to their external network and interface ports, ports
+    to the subnets of their fixed IPs (or to their network when they have
+    none), subnets to their network and ports to their floating IPs.
+
+    :returns: a list of (source type, source ID, relation, target type,
+        target ID) tuples
+    """
+    edges = []
+    ports = resources['port']
+    routers = resources['router']
+
+    for router in routers.values():
+        gateway = router.external_gateway_info or {}
+        if gateway.get('network_id'):
+            edges.append(('router', router.id, 'gateway',
+                          'network', gateway['network_id']))
+
+    for port in ports.values():
+        if (port.device_id in routers and
+                port.device_owner in _ROUTER_INTERFACE_OWNERS):
+            edges.append(('router', port.device_id, 'interface',
+                          'port', port.id))
+
+    for port in ports.values():
+        subnet_ids = []
+        for fixed_ip in port.fixed_ips or []:
+            if fixed_ip.get('subnet_id') not in subnet_ids:
+                subnet_ids.append(fixed_ip.get('subnet_id'))
+        for subnet_id in subnet_ids:
+            edges.append(('port', port.id, 'fixed ip', 'subnet', subnet_id))
+        if not subnet_ids:
+            edges.append(('port', port.id, 'network',
+                          'network', port.network_id))
+
+    for subnet in resources['subnet'].values():
+        edges.append(('subnet', subnet.id, 'network',
+                      'network', subnet.network_id))
+
+    for floating_ip in resources['floating ip'].values():
+        if floating_ip.port_id:
+            edges.append(('port', floating_ip.port_id, 'floating ip',
+                          'floating ip', floating_ip.id))
+
+    return edges
+
+
+def _get_name(resources, resource, resource_id):
+    obj = resources[resource].get(resource_id)
+    return obj.name if obj is not None and obj.name else ''
+
+
+def _quote_dot(value):
+    value = str(value).replace('\\', '\\\\').replace('"', '\\"')
+    return '"%s"' % value.replace('\n', '\\n')
+
+
+def _write_dot(path, resources, edges):
+    lines = ['digraph topology {']
+    for resource, objs in resources.items():
+        for obj in objs.values():
+            label = '%s\n%s' % (resource, obj.name or obj.id)
+            lines.append('  %s [label=%s];' % (
+                _quote_dot('%s:%s' % (resource, obj.id)), _quote_dot(label)))
+    for source_type, source_id, relation, target_type, target_id in edges:
+        lines.append('  %s -> %s [label=%s];' % (
+            _quote_dot('%s:%s' % (source_type, source_id)),
+            _quote_dot('%s:%s' % (target_type, target_id)),
+            _quote_dot(relation)))
+    lines.append('}')
+    with open(path, 'w') as f:
+        f.write('\n'.join(lines) + '\n')
+
+
+class ShowNetworkTopology(command.Lister):
+    _description = _("Show the links between routers, networks, subnets, "
+                     "ports and floating IPs")
+
+    def get_parser(self, prog_name):
+        parser = super(ShowNetworkTopology, self).get_parser(prog_name)
+        parser.add_argument(
+            '--project',
+            metavar='<project>',
+            help=_("Only show resources of this project (name or ID)"),
+        )
+        identity_common.add_project_domain_option_to_parser(parser)
+        parser.add_argument(
+            '--dot-file',
+            metavar='<dot-file>',
+            help=_("Also write the topology as a graph in the DOT "
+                   "language to this file"),
+        )
+        return parser
+
+    def take_action(self, parsed_args):
+        client = self.app.client_manager.network
+
+        query = {}
+        if parsed_args.project:
+            query['project_id'] = identity_common.find_project(
+                self.app.client_manager.identity,
+                parsed_args.project,
+                parsed_args.project_domain,
+            ).id
+
+        resources = _fetch_resources(client, query)
+        edges = _get_edges(resources)
+
+        if parsed_args.dot_file:
+            _write_dot(parsed_args.dot_file, resources, edges)
+
+        column_headers = (
+            'Source Type',
+            'Source ID',
+            'Source Name',
+            'Relation',
+            'Target Type',
+            'Target ID',
+            'Target Name',
+        )
+        return (column_headers,
+                ((source_type, source_id,
+                  _get_name(resources, source_type, source_id),
+                  relation,
+                  target_type, target_id,
+                  _get_name(resources, target_type, target_id))
+                 for (source_type, source_id, relation,
+                      target_type, target_id) in edges))
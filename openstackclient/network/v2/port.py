@@ -19,6 +19,7 @@ import json
 import logging
 
 from cliff import columns as cliff_columns
+from openstack.network.v2 import port as port_resource
 from osc_lib.cli import format_columns
 from osc_lib.cli import parseractions
 from osc_lib.command import command
@@ -26,6 +27,7 @@ from osc_lib import exceptions
 from osc_lib import utils
 from osc_lib.utils import tags as _tag
 
+from openstackclient.common import concurrency
 from openstackclient.i18n import _
 from openstackclient.identity import common as identity_common
 from openstackclient.network import common
@@ -461,13 +463,13 @@ class CreatePort(command.ShowOne, common.NeutronCommandWithExtraArgs):
         _tag.add_tag_option_to_parser_for_create(parser, _('port'))
         return parser
 
-    def take_action(self, parsed_args):
-        client = self.app.client_manager.network
+    def _get_create_attrs(self, client_manager, parsed_args):
+        client = client_manager.network
         _network = client.find_network(parsed_args.network,
                                        ignore_missing=False)
         parsed_args.network = _network.id
-        _prepare_fixed_ips(self.app.client_manager, parsed_args)
-        attrs = _get_attrs(self.app.client_manager, parsed_args)
+        _prepare_fixed_ips(client_manager, parsed_args)
+        attrs = _get_attrs(client_manager, parsed_args)
 
         if parsed_args.binding_profile is not None:
             attrs['binding:profile'] = parsed_args.binding_profile
@@ -496,9 +498,8 @@ class CreatePort(command.ShowOne, common.NeutronCommandWithExtraArgs):
             attrs['qos_policy_id'] = client.find_qos_policy(
                 parsed_args.qos_policy, ignore_missing=False).id
 
-        set_tags_in_post = bool(
-            client.find_extension('tag-ports-during-bulk-creation'))
-        if set_tags_in_post:
+        if client_manager.find_network_extension(
+                'tag-ports-during-bulk-creation'):
             if parsed_args.no_tag:
                 attrs['tags'] = []
             if parsed_args.tags:
@@ -506,12 +507,17 @@ class CreatePort(command.ShowOne, common.NeutronCommandWithExtraArgs):
 
         attrs.update(
             self._parse_extra_properties(parsed_args.extra_properties))
+        return attrs
+
+    def take_action(self, parsed_args):
+        client = self.app.client_manager.network
+        attrs = self._get_create_attrs(self.app.client_manager, parsed_args)
 
         with common.check_missing_extension_if_error(
-                self.app.client_manager.network, attrs):
+                self.app.client_manager, attrs):
             obj = client.create_port(**attrs)
 
-        if not set_tags_in_post:
+        if 'tags' not in attrs:
             # tags cannot be set when created, so tags need to be set later.
             _tag.update_tags_for_set(client, obj, parsed_args)
 
@@ -521,6 +527,17 @@ class CreatePort(command.ShowOne, common.NeutronCommandWithExtraArgs):
         return (display_columns, data)
 
 
+class CreatePortBulk(common.NeutronBulkCreate):
+    _description = _("Create ports in bulk from a file of 'port create' "
+                     "arguments")
+
+    resource = 'port'
+    create_command = CreatePort
+
+    def _bulk_create(self, client, data):
+        return client.create_ports(data)
+
+
 class DeletePort(command.Command):
     _description = _("Delete port(s)")
 
@@ -536,18 +553,27 @@ class DeletePort(command.Command):
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        result = 0
+        ports = common.find_resources(
+            client.ports, parsed_args.port, by_id=True)
 
-        for port in parsed_args.port:
-            try:
+        def _delete_port(port):
+            if port in ports:
+                obj = ports[port]
+            else:
                 obj = client.find_port(port, ignore_missing=False)
-                client.delete_port(obj)
-            except Exception as e:
-                result += 1
-                LOG.error(_("Failed to delete port with "
-                            "name or ID '%(port)s': %(e)s"),
-                          {'port': port, 'e': e})
-
+            client.delete_port(obj)
+
+        failures = [
+            (port, e) for port, _result, e in concurrency.run_concurrently(
+                _delete_port, parsed_args.port)
+            if e is not None
+        ]
+        for port, e in failures:
+            LOG.error(_("Failed to delete port with "
+                        "name or ID '%(port)s': %(e)s"),
+                      {'port': port, 'e': e})
+
+        result = len(failures)
         if result > 0:
             total = len(parsed_args.port)
             msg = (_("%(result)s of %(total)s ports failed "
@@ -698,7 +724,9 @@ class ListPort(command.Lister):
 
         _tag.get_tag_filtering_args(parsed_args, filters)
 
-        data = network_client.ports(fields=columns, **filters)
+        filters.update(common.get_list_fields(
+            port_resource.Port, column_headers, columns, parsed_args))
+        data = network_client.ports(**filters)
 
         headers, attrs = utils.calculate_header_and_attrs(
             column_headers, columns, parsed_args)
@@ -905,7 +933,7 @@ class SetPort(common.NeutronCommandWithExtraArgs):
 
         if attrs:
             with common.check_missing_extension_if_error(
-                    self.app.client_manager.network, attrs):
+                    self.app.client_manager, attrs):
                 client.update_port(obj, **attrs)
 
         # tags is a subresource and it needs to be updated separately.
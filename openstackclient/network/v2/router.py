@@ -25,6 +25,7 @@ from osc_lib import exceptions
 from osc_lib import utils
 from osc_lib.utils import tags as _tag
 
+from openstackclient.common import concurrency
 from openstackclient.i18n import _
 from openstackclient.identity import common as identity_common
 from openstackclient.network import common
@@ -548,7 +549,8 @@ class ListRouter(command.Lister):
             )
             # availability zone will be available only when
             # router_availability_zone extension is enabled
-            if client.find_extension("router_availability_zone"):
+            if self.app.client_manager.find_network_extension(
+                    "router_availability_zone"):
                 columns = columns + (
                     'availability_zones',
                 )
@@ -580,7 +582,7 @@ class ListRouter(command.Lister):
 
 
 class RemovePortFromRouter(command.Command):
-    _description = _("Remove a port from a router")
+    _description = _("Remove port(s) from a router")
 
     def get_parser(self, prog_name):
         parser = super(RemovePortFromRouter, self).get_parser(prog_name)
@@ -592,19 +594,43 @@ class RemovePortFromRouter(command.Command):
         parser.add_argument(
             'port',
             metavar='<port>',
-            help=_("Port to be removed and deleted (name or ID)")
+            nargs='+',
+            help=_("Port(s) to be removed and deleted (name or ID)")
         )
         return parser
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        port = client.find_port(parsed_args.port, ignore_missing=False)
-        client.remove_interface_from_router(client.find_router(
-            parsed_args.router, ignore_missing=False), port_id=port.id)
+        router = client.find_router(parsed_args.router, ignore_missing=False)
+        ports = common.find_resources(
+            client.ports, parsed_args.port, by_id=True)
+
+        def _remove_port(port):
+            if port in ports:
+                obj = ports[port]
+            else:
+                obj = client.find_port(port, ignore_missing=False)
+            client.remove_interface_from_router(router, port_id=obj.id)
+
+        failures = [
+            (port, e) for port, _result, e in concurrency.run_concurrently(
+                _remove_port, parsed_args.port)
+            if e is not None
+        ]
+        for port, e in failures:
+            LOG.error(_("Failed to remove port with name or ID "
+                        "'%(port)s' from router: %(e)s"),
+                      {'port': port, 'e': e})
+
+        if failures:
+            msg = (_("%(result)s of %(total)s ports failed "
+                     "to remove.") % {'result': len(failures),
+                                      'total': len(parsed_args.port)})
+            raise exceptions.CommandError(msg)
 
 
 class RemoveSubnetFromRouter(command.Command):
-    _description = _("Remove a subnet from a router")
+    _description = _("Remove subnet(s) from a router")
 
     def get_parser(self, prog_name):
         parser = super(RemoveSubnetFromRouter, self).get_parser(prog_name)
@@ -616,18 +642,38 @@ class RemoveSubnetFromRouter(command.Command):
         parser.add_argument(
             'subnet',
             metavar='<subnet>',
-            help=_("Subnet to be removed (name or ID)")
+            nargs='+',
+            help=_("Subnet(s) to be removed (name or ID)")
         )
         return parser
 
     def take_action(self, parsed_args):
         client = self.app.client_manager.network
-        subnet = client.find_subnet(parsed_args.subnet,
-                                    ignore_missing=False)
-        client.remove_interface_from_router(
-            client.find_router(parsed_args.router,
-                               ignore_missing=False),
-            subnet_id=subnet.id)
+        router = client.find_router(parsed_args.router, ignore_missing=False)
+        subnets = common.find_resources(client.subnets, parsed_args.subnet)
+
+        def _remove_subnet(subnet):
+            if subnet in subnets:
+                obj = subnets[subnet]
+            else:
+                obj = client.find_subnet(subnet, ignore_missing=False)
+            client.remove_interface_from_router(router, subnet_id=obj.id)
+
+        failures = [
+            (subnet, e) for subnet, _result, e in concurrency.run_concurrently(
+                _remove_subnet, parsed_args.subnet)
+            if e is not None
+        ]
+        for subnet, e in failures:
+            LOG.error(_("Failed to remove subnet with name or ID "
+                        "'%(subnet)s' from router: %(e)s"),
+                      {'subnet': subnet, 'e': e})
+
+        if failures:
+            msg = (_("%(result)s of %(total)s subnets failed "
+                     "to remove.") % {'result': len(failures),
+                                      'total': len(parsed_args.subnet)})
+            raise exceptions.CommandError(msg)
 
 
 # TODO(yanxing'an): Use the SDK resource mapped attribute names once the
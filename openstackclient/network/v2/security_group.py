@@ -14,16 +14,63 @@
 """Security Group action implementations"""
 
 import argparse
+import logging
 
 from cliff import columns as cliff_columns
 from osc_lib.command import command
+from osc_lib import exceptions
 from osc_lib import utils
 from osc_lib.utils import tags as _tag
 
+from openstackclient.common import concurrency
 from openstackclient.i18n import _
 from openstackclient.identity import common as identity_common
 from openstackclient.network import common
 from openstackclient.network import utils as network_utils
+from openstackclient.network.v2 import security_group_rule
+
+
+LOG = logging.getLogger(__name__)
+
+
+def _get_rule_key(rule):
+    """Return the canonical tuple used to compare security group rules
+
+    :param rule: dict of security group rule attributes, as sent to
+        create a rule
+    """
+    protocol = rule.get('protocol')
+    if protocol is not None:
+        protocol = str(protocol).lower()
+    remote_ip_prefix = rule.get('remote_ip_prefix')
+    # Allowing any address is the same as not restricting the address.
+    if remote_ip_prefix in ('0.0.0.0/0', '::/0'):
+        remote_ip_prefix = None
+    return (
+        rule['security_group_id'],
+        rule.get('direction'),
+        rule.get('ethertype'),
+        protocol,
+        rule.get('port_range_min'),
+        rule.get('port_range_max'),
+        remote_ip_prefix,
+        rule.get('remote_group_id'),
+        rule.get('remote_address_group_id'),
+    )
+
+
+def _get_rule_attrs(obj):
+    return {
+        'security_group_id': obj.security_group_id,
+        'direction': obj.direction,
+        'ethertype': obj.ether_type,
+        'protocol': obj.protocol,
+        'port_range_min': obj.port_range_min,
+        'port_range_max': obj.port_range_max,
+        'remote_ip_prefix': obj.remote_ip_prefix,
+        'remote_group_id': obj.remote_group_id,
+        'remote_address_group_id': obj.remote_address_group_id,
+    }
 
 
 def _format_network_security_group_rules(sg_rules):
@@ -97,6 +144,135 @@ def _get_columns(item):
     )
 
 
+class ApplySecurityGroup(common.NeutronBulkCreate):
+    _description = _("Make the rules of security groups match a file of "
+                     "'security group rule create' arguments. Rules missing "
+                     "from the security groups are created, rules of the "
+                     "security groups missing from the file are deleted. "
+                     "Security groups not referenced in the file are not "
+                     "changed.")
+
+    resource = 'security group rule'
+    create_command = security_group_rule.CreateSecurityGroupRule
+    columns = (
+        'security_group_id',
+        'direction',
+        'ethertype',
+        'protocol',
+        'port_range_min',
+        'port_range_max',
+        'remote_ip_prefix',
+        'remote_group_id',
+    )
+    column_headers = (
+        'Security Group',
+        'Direction',
+        'Ethertype',
+        'IP Protocol',
+        'Port Range Min',
+        'Port Range Max',
+        'IP Range',
+        'Remote Security Group',
+    )
+
+    def _bulk_create(self, client, data):
+        return client.create_security_group_rules(data)
+
+    def get_parser(self, prog_name):
+        parser = super(ApplySecurityGroup, self).get_parser(prog_name)
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            default=False,
+            help=_("Only show the rules that would be created and deleted"),
+        )
+        return parser
+
+    def _get_changes(self, client, rows):
+        wanted = {}
+        for row in rows:
+            attrs = row[2]
+            group_id = attrs['security_group_id']
+            wanted.setdefault(group_id, {})[_get_rule_key(attrs)] = row
+
+        creates = []
+        deletes = []
+        for group_id, group_rows in wanted.items():
+            current = {}
+            for obj in client.security_group_rules(
+                    security_group_id=group_id):
+                current[_get_rule_key(_get_rule_attrs(obj))] = obj
+            creates.extend(
+                row for key, row in group_rows.items() if key not in current)
+            deletes.extend(
+                obj for key, obj in current.items() if key not in group_rows)
+        return creates, deletes
+
+    def take_action(self, parsed_args):
+        if parsed_args.chunk_size < 1:
+            msg = _("Chunk size must be a positive number")
+            raise exceptions.CommandError(msg)
+
+        client = self.app.client_manager.network
+        rows = self._get_rows(parsed_args.file)
+        creates, deletes = self._get_changes(client, rows)
+
+        if parsed_args.dry_run:
+            results = [(row, None) for row in creates]
+            failures = []
+        else:
+            results = self._create_rows(client, creates,
+                                        parsed_args.chunk_size)
+            failures = [
+                (obj, e) for obj, _result, e in concurrency.run_concurrently(
+                    client.delete_security_group_rule, deletes)
+                if e is not None
+            ]
+            for obj, e in failures:
+                LOG.error(_("Failed to delete security group rule with "
+                            "ID '%(rule)s': %(e)s"),
+                          {'rule': obj.id, 'e': e})
+        failed_deletes = set(obj.id for obj, _e in failures)
+
+        data = []
+        failed = len(failures)
+        for (_number, _args, attrs), obj in results:
+            if parsed_args.dry_run:
+                result = 'planned'
+            elif obj is None:
+                result = 'failed'
+                failed += 1
+            else:
+                result = 'created'
+            data.append(
+                ('create', obj.id if obj is not None else None) +
+                utils.get_dict_properties(attrs, self.columns) +
+                (result,))
+        for obj in deletes:
+            if parsed_args.dry_run:
+                result = 'planned'
+            elif obj.id in failed_deletes:
+                result = 'failed'
+            else:
+                result = 'deleted'
+            data.append(
+                ('delete', obj.id) +
+                utils.get_dict_properties(
+                    _get_rule_attrs(obj), self.columns) +
+                (result,))
+
+        column_headers = (
+            ('Action', 'ID') + self.column_headers + ('Result',))
+        if failed:
+            self.produce_output(parsed_args, column_headers, data)
+            msg = _("%(failed)s of %(total)s security group rule changes "
+                    "failed.") % {
+                        'failed': failed,
+                        'total': len(creates) + len(deletes)}
+            raise exceptions.CommandError(msg)
+        return (column_headers, data)
+
+
 # TODO(abhiraut): Use the SDK resource mapped attribute names once the
 # OSC minimum requirements include SDK 1.0.
 class CreateSecurityGroup(common.NetworkAndComputeShowOne,
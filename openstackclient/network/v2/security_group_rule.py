@@ -279,7 +279,8 @@ class CreateSecurityGroupRule(common.NetworkAndComputeShowOne,
         else:
             return False
 
-    def take_action_network(self, client, parsed_args):
+    def _get_create_attrs(self, client_manager, parsed_args):
+        client = client_manager.network
         # Get the security group ID to hold the rule.
         security_group_id = client.find_security_group(
             parsed_args.group,
@@ -349,7 +350,7 @@ class CreateSecurityGroupRule(common.NetworkAndComputeShowOne,
             attrs['remote_ip_prefix'] = '::/0'
         attrs['security_group_id'] = security_group_id
         if parsed_args.project is not None:
-            identity_client = self.app.client_manager.identity
+            identity_client = client_manager.identity
             project_id = identity_common.find_project(
                 identity_client,
                 parsed_args.project,
@@ -359,6 +360,10 @@ class CreateSecurityGroupRule(common.NetworkAndComputeShowOne,
 
         attrs.update(
             self._parse_extra_properties(parsed_args.extra_properties))
+        return attrs
+
+    def take_action_network(self, client, parsed_args):
+        attrs = self._get_create_attrs(self.app.client_manager, parsed_args)
 
         # Create and show the security group rule.
         obj = client.create_security_group_rule(**attrs)
@@ -395,6 +400,35 @@ class CreateSecurityGroupRule(common.NetworkAndComputeShowOne,
         return _format_security_group_rule_show(obj)
 
 
+class CreateSecurityGroupRuleBulk(common.NeutronBulkCreate):
+    _description = _("Create security group rules in bulk from a file of "
+                     "'security group rule create' arguments")
+
+    resource = 'security group rule'
+    create_command = CreateSecurityGroupRule
+    columns = (
+        'security_group_id',
+        'direction',
+        'ethertype',
+        'protocol',
+        'port_range_min',
+        'port_range_max',
+        'remote_ip_prefix',
+    )
+    column_headers = (
+        'Security Group',
+        'Direction',
+        'Ethertype',
+        'IP Protocol',
+        'Port Range Min',
+        'Port Range Max',
+        'IP Range',
+    )
+
+    def _bulk_create(self, client, data):
+        return client.create_security_group_rules(data)
+
+
 class DeleteSecurityGroupRule(common.NetworkAndComputeDelete):
     _description = _("Delete security group rule(s)")
 
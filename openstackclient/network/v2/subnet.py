@@ -17,6 +17,7 @@ import copy
 import logging
 
 from cliff import columns as cliff_columns
+from openstack.network.v2 import subnet as subnet_resource
 from osc_lib.cli import format_columns
 from osc_lib.cli import parseractions
 from osc_lib.command import command
@@ -372,11 +373,15 @@ class CreateSubnet(command.ShowOne, common.NeutronCommandWithExtraArgs):
         _tag.add_tag_option_to_parser_for_create(parser, _('subnet'))
         return parser
 
-    def take_action(self, parsed_args):
-        client = self.app.client_manager.network
-        attrs = _get_attrs(self.app.client_manager, parsed_args)
+    def _get_create_attrs(self, client_manager, parsed_args):
+        attrs = _get_attrs(client_manager, parsed_args)
         attrs.update(
             self._parse_extra_properties(parsed_args.extra_properties))
+        return attrs
+
+    def take_action(self, parsed_args):
+        client = self.app.client_manager.network
+        attrs = self._get_create_attrs(self.app.client_manager, parsed_args)
         obj = client.create_subnet(**attrs)
         # tags cannot be set when created, so tags need to be set later.
         _tag.update_tags_for_set(client, obj, parsed_args)
@@ -385,6 +390,17 @@ class CreateSubnet(command.ShowOne, common.NeutronCommandWithExtraArgs):
         return (display_columns, data)
 
 
+class CreateSubnetBulk(common.NeutronBulkCreate):
+    _description = _("Create subnets in bulk from a file of 'subnet "
+                     "create' arguments")
+
+    resource = 'subnet'
+    create_command = CreateSubnet
+
+    def _bulk_create(self, client, data):
+        return subnet_resource.Subnet.bulk_create(client, data)
+
+
 class DeleteSubnet(command.Command):
     _description = _("Delete subnet(s)")
 
@@ -0,0 +1,42 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+from unittest import mock
+
+import fixtures
+
+from openstackclient.common import bulk
+from openstackclient.tests.unit import utils
+
+
+class TestReadArgumentLines(utils.TestCase):
+
+    def test_read_argument_lines(self):
+        path = self.useFixture(fixtures.TempDir()).path + '/args'
+        with open(path, 'w') as f:
+            f.write('# comment\n'
+                    '--size 1 vol1\n'
+                    '\n'
+                    "--description 'a volume' vol2  # trailing\n")
+
+        self.assertEqual([
+            (2, ['--size', '1', 'vol1']),
+            (4, ['--description', 'a volume', 'vol2']),
+        ], list(bulk.read_argument_lines(path)))
+
+    @mock.patch('sys.stdin')
+    def test_read_argument_lines_stdin(self, mock_stdin):
+        mock_stdin.readlines.return_value = ['vol1\n']
+
+        self.assertEqual(
+            [(1, ['vol1'])], list(bulk.read_argument_lines('-')))
@@ -14,8 +14,13 @@
 #
 
 import copy
+import os
+from unittest import mock
 
+import fixtures
 from keystoneauth1 import token_endpoint
+import openstack.exceptions
+from openstack.network.v2 import extension as network_extension
 from osc_lib.tests import utils as osc_lib_test_utils
 
 from openstackclient.common import clientmanager
@@ -69,3 +74,173 @@ class TestClientManager(osc_lib_test_utils.TestClientManager):
         # This is True because ClientManager.auth_ref returns None in this
         # test; "no service catalog" means use Network API by default now
         self.assertTrue(client_manager.is_network_endpoint_enabled())
+
+    def test_client_manager_cache_dir(self):
+        client_manager = self._make_clientmanager()
+        cache_dir = client_manager.get_cache_dir()
+
+        self.assertEqual(
+            os.path.join(
+                os.path.expanduser('~'), '.cache', 'openstack', 'osc'),
+            os.path.dirname(cache_dir),
+        )
+        self.assertTrue(os.path.basename(cache_dir).startswith(
+            client_manager._cli_options.name + '-'))
+        self.assertEqual(
+            cache_dir, self._make_clientmanager().get_cache_dir())
+
+    def test_client_manager_cache_dir_scoped(self):
+        cache_dir = self._make_clientmanager().get_cache_dir()
+
+        for option, value in (
+                ('auth_url', 'http://other.example.com/identity'),
+                ('project_name', 'other-project')):
+            auth_args = copy.deepcopy(self.default_password_auth)
+            auth_args[option] = value
+            client_manager = self._make_clientmanager(auth_args=auth_args)
+            self.assertNotEqual(cache_dir, client_manager.get_cache_dir())
+
+        client_manager = self._make_clientmanager(
+            config_args={'interface': 'admin'})
+        self.assertNotEqual(cache_dir, client_manager.get_cache_dir())
+
+    def test_client_manager_network_endpoint_detected_once(self):
+        client_manager = self._make_clientmanager()
+
+        with mock.patch.object(
+            client_manager, 'is_service_available', return_value=False,
+        ) as available_mock:
+            self.assertFalse(client_manager.is_network_endpoint_enabled())
+            self.assertFalse(client_manager.is_network_endpoint_enabled())
+
+        available_mock.assert_called_once_with('network')
+
+    def test_client_manager_network_endpoint_cached(self):
+        cache_dir = self.useFixture(fixtures.TempDir()).path
+        client_manager = self._make_clientmanager()
+        self.useFixture(fixtures.MockPatchObject(
+            client_manager, 'get_cache_dir', return_value=cache_dir))
+        self.useFixture(fixtures.MockPatchObject(
+            client_manager, '_get_cache_expiration', return_value=3600))
+
+        with mock.patch.object(
+            client_manager, 'is_service_available', return_value=False,
+        ):
+            self.assertFalse(client_manager.is_network_endpoint_enabled())
+
+        # A new session loads the cached value without the catalog
+        client_manager._network_endpoint_enabled = None
+        with mock.patch.object(
+            client_manager, 'is_service_available',
+        ) as available_mock:
+            self.assertFalse(client_manager.is_network_endpoint_enabled())
+
+        available_mock.assert_not_called()
+
+    def test_client_manager_cache_expired(self):
+        cache_dir = self.useFixture(fixtures.TempDir()).path
+        client_manager = self._make_clientmanager()
+        self.useFixture(fixtures.MockPatchObject(
+            client_manager, 'get_cache_dir', return_value=cache_dir))
+        self.useFixture(fixtures.MockPatchObject(
+            client_manager, '_get_cache_expiration', return_value=60))
+
+        with mock.patch('time.time', return_value=1000):
+            client_manager.save_cache('foo', {'bar': 1})
+        with mock.patch('time.time', return_value=1030):
+            self.assertEqual({'bar': 1}, client_manager.load_cache('foo'))
+        with mock.patch('time.time', return_value=1070):
+            self.assertIsNone(client_manager.load_cache('foo'))
+
+    def test_client_manager_cache_disabled(self):
+        cache_dir = self.useFixture(fixtures.TempDir()).path
+        client_manager = self._make_clientmanager()
+        self.useFixture(fixtures.MockPatchObject(
+            client_manager, 'get_cache_dir', return_value=cache_dir))
+
+        client_manager.save_cache('foo', {'bar': 1})
+
+        self.assertEqual([], os.listdir(cache_dir))
+        self.assertIsNone(client_manager.load_cache('foo'))
+
+    def _mock_network_extensions(self, client_manager):
+        network_mock = mock.Mock()
+        network_mock.extensions.return_value = [
+            network_extension.Extension.existing(
+                alias='router_availability_zone',
+                name='Router Availability Zone',
+            ),
+            network_extension.Extension.existing(
+                alias='availability_zone',
+                name='Availability Zone',
+            ),
+        ]
+        client_manager.network = network_mock
+        return network_mock
+
+    def test_client_manager_find_network_extension(self):
+        client_manager = self._make_clientmanager()
+        network_mock = self._mock_network_extensions(client_manager)
+
+        ext = client_manager.find_network_extension(
+            'router_availability_zone')
+        self.assertEqual('Router Availability Zone', ext.name)
+        ext = client_manager.find_network_extension('Availability Zone')
+        self.assertEqual('availability_zone', ext.alias)
+        self.assertIsNone(client_manager.find_network_extension('qos'))
+        self.assertRaises(
+            openstack.exceptions.ResourceNotFound,
+            client_manager.find_network_extension,
+            'qos', ignore_missing=False)
+
+        network_mock.extensions.assert_called_once_with()
+
+    def test_client_manager_network_extensions_cached(self):
+        cache_dir = self.useFixture(fixtures.TempDir()).path
+        client_manager = self._make_clientmanager()
+        self.useFixture(fixtures.MockPatchObject(
+            client_manager, 'get_cache_dir', return_value=cache_dir))
+        self.useFixture(fixtures.MockPatchObject(
+            client_manager, '_get_cache_expiration', return_value=3600))
+        network_mock = self._mock_network_extensions(client_manager)
+
+        self.assertIsNotNone(
+            client_manager.find_network_extension('availability_zone'))
+
+        # A new session loads the cached extensions without listing them
+        client_manager._network_extensions = None
+        network_mock.extensions.reset_mock()
+        self.assertIsNotNone(
+            client_manager.find_network_extension('availability_zone'))
+
+        network_mock.extensions.assert_not_called()
+
+    def test_client_manager_network_extensions_cached_per_cloud(self):
+        cache_path = self.useFixture(fixtures.TempDir()).path
+        auth_args = copy.deepcopy(self.default_password_auth)
+        auth_args['auth_url'] = 'http://other.example.com/identity'
+        client_managers = [
+            self._make_clientmanager(),
+            self._make_clientmanager(auth_args=auth_args),
+        ]
+        for client_manager in client_managers:
+            client_manager._cli_options._cache_path = cache_path
+            self.useFixture(fixtures.MockPatchObject(
+                client_manager, '_get_cache_expiration', return_value=3600))
+        self._mock_network_extensions(client_managers[0])
+        client_managers[1].network = mock.Mock()
+        client_managers[1].network.extensions.return_value = []
+
+        self.assertIsNotNone(
+            client_managers[0].find_network_extension('availability_zone'))
+        # The other deployment lists its own extensions
+        self.assertIsNone(
+            client_managers[1].find_network_extension('availability_zone'))
+        client_managers[1].network.extensions.assert_called_once_with()
+
+        # Neither cache overwrote the other
+        client_managers[0]._network_extensions = None
+        client_managers[0].network.extensions.reset_mock()
+        self.assertIsNotNone(
+            client_managers[0].find_network_extension('availability_zone'))
+        client_managers[0].network.extensions.assert_not_called()
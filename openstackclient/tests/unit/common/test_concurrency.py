@@ -0,0 +1,31 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+from openstackclient.common import concurrency
+from openstackclient.tests.unit import utils
+
+
+class TestRunConcurrently(utils.TestCase):
+
+    def test_run_concurrently(self):
+        def _double(value):
+            if value < 0:
+                raise ValueError(value)
+            return value * 2
+
+        results = concurrency.run_concurrently(_double, [1, -1, 2])
+
+        self.assertEqual([1, -1, 2], [item for item, _r, _e in results])
+        self.assertEqual([2, None, 4], [r for _i, r, _e in results])
+        self.assertIsNone(results[0][2])
+        self.assertIsInstance(results[1][2], ValueError)
@@ -54,6 +54,23 @@ class TestProgressBarWrapper(utils.TestCase):
         finally:
             sys.stdout = saved_stdout
 
+    def test_readinto_display_progress_bar(self):
+        size = 98304
+        file_obj = io.BytesIO(b'X' * size)
+        saved_stdout = sys.stdout
+        try:
+            sys.stdout = output = FakeTTYStdout()
+            file_obj = progressbar.VerboseFileWrapper(file_obj, size)
+            buffer = bytearray(1024)
+            while file_obj.readinto(buffer):
+                pass
+            self.assertEqual(
+                '[%s>] 100%%\n' % ('=' * 29),
+                output.getvalue()
+            )
+        finally:
+            sys.stdout = saved_stdout
+
 
 class FakeTTYStdout(io.StringIO):
     """A Fake stdout that try to emulate a TTY device as much as possible."""
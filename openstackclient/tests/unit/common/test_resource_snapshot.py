@@ -0,0 +1,238 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+import os
+from unittest import mock
+
+import fixtures
+from osc_lib import exceptions
+
+from openstackclient.common import resource_snapshot
+from openstackclient.tests.unit import utils
+
+
+class FakeResource(object):
+
+    def __init__(self, **attrs):
+        self.attrs = attrs
+
+    def to_dict(self):
+        return dict(self.attrs)
+
+
+class TestResourceSnapshot(utils.TestCommand):
+
+    def setUp(self):
+        super(TestResourceSnapshot, self).setUp()
+
+        self.snapshot_file = os.path.join(
+            self.useFixture(fixtures.TempDir()).path, 'snapshot.db')
+
+        self.app.client_manager.compute = mock.Mock()
+        self.servers_mock = self.app.client_manager.compute.servers
+        self.app.client_manager.network = mock.Mock()
+        self.ports_mock = self.app.client_manager.network.ports
+
+    def _sync(self, *resources, **kwargs):
+        arglist = ['--snapshot-file', self.snapshot_file]
+        for resource in resources:
+            arglist.extend(['--resource', resource])
+        if kwargs.get('full'):
+            arglist.append('--full')
+        cmd = resource_snapshot.SyncResourceSnapshot(self.app, None)
+        parsed_args = self.check_parser(cmd, arglist, [])
+        columns, data = cmd.take_action(parsed_args)
+        return columns, list(data)
+
+    def _list(self, *arglist):
+        arglist = list(arglist) + ['--snapshot-file', self.snapshot_file]
+        cmd = resource_snapshot.ListResourceSnapshot(self.app, None)
+        parsed_args = self.check_parser(cmd, arglist, [])
+        columns, data = cmd.take_action(parsed_args)
+        return columns, list(data)
+
+
+class TestSyncResourceSnapshot(TestResourceSnapshot):
+
+    def test_sync_full(self):
+        self.ports_mock.return_value = [
+            FakeResource(id='p1', name='port1', mac_address='aa',
+                         status='ACTIVE'),
+            FakeResource(id='p2', name='port2', mac_address='bb',
+                         status='DOWN'),
+        ]
+
+        columns, data = self._sync('port')
+
+        self.assertEqual(
+            ('Resource', 'Mode', 'Stored', 'Removed', 'Total'), columns)
+        self.assertEqual([('port', 'full', 2, 0, 2)], data)
+
+        self.ports_mock.return_value = [
+            FakeResource(id='p2', name='port2', mac_address='bb',
+                         status='ACTIVE'),
+        ]
+
+        columns, data = self._sync('port')
+
+        self.assertEqual([('port', 'full', 1, 1, 1)], data)
+
+    def test_sync_incremental(self):
+        self.servers_mock.list.return_value = [
+            FakeResource(id='s1', name='server1', status='ACTIVE'),
+            FakeResource(id='s2', name='server2', status='ACTIVE'),
+        ]
+
+        columns, data = self._sync('server')
+
+        self.assertEqual([('server', 'full', 2, 0, 2)], data)
+        self.servers_mock.list.assert_called_with(
+            search_opts={'all_tenants': True}, limit=-1)
+
+        self.servers_mock.list.return_value = [
+            FakeResource(id='s1', name='server1', status='DELETED'),
+            FakeResource(id='s3', name='server3', status='BUILD'),
+        ]
+
+        columns, data = self._sync('server')
+
+        self.assertEqual([('server', 'incremental', 1, 1, 2)], data)
+        search_opts = self.servers_mock.list.call_args[1]['search_opts']
+        self.assertTrue(search_opts['all_tenants'])
+        self.assertIn('changes-since', search_opts)
+        self.assertEqual(-1, self.servers_mock.list.call_args[1]['limit'])
+
+    def test_sync_incremental_changes_since_updated(self):
+        self.servers_mock.list.return_value = [
+            FakeResource(id='s1', name='server1', status='ACTIVE',
+                         updated='2026-01-01T10:00:00Z'),
+            FakeResource(id='s2', name='server2', status='ACTIVE',
+                         updated='2026-01-01T12:00:00Z'),
+        ]
+        self._sync('server')
+
+        self.servers_mock.list.return_value = []
+        self._sync('server')
+
+        search_opts = self.servers_mock.list.call_args[1]['search_opts']
+        self.assertEqual('2026-01-01T12:00:00Z', search_opts['changes-since'])
+
+        self._sync('server')
+
+        search_opts = self.servers_mock.list.call_args[1]['search_opts']
+        self.assertEqual('2026-01-01T12:00:00Z', search_opts['changes-since'])
+
+    def test_sync_all_pages(self):
+        pages = [
+            [FakeResource(id='s%d' % i, name='server%d' % i, status='ACTIVE')
+             for i in range(3)],
+            [FakeResource(id='s3', name='server3', status='ACTIVE')],
+        ]
+
+        def _list(search_opts, limit=None):
+            # novaclient only follows the next links with limit=-1
+            if limit == -1:
+                return pages[0] + pages[1]
+            return pages[0]
+
+        self.servers_mock.list.side_effect = _list
+
+        columns, data = self._sync('server')
+
+        self.assertEqual([('server', 'full', 4, 0, 4)], data)
+
+    def test_sync_incremental_full(self):
+        self.servers_mock.list.return_value = [
+            FakeResource(id='s1', name='server1', status='ACTIVE'),
+        ]
+        self._sync('server')
+
+        columns, data = self._sync('server', full=True)
+
+        self.assertEqual([('server', 'full', 1, 0, 1)], data)
+        self.servers_mock.list.assert_called_with(
+            search_opts={'all_tenants': True}, limit=-1)
+
+
+class TestListResourceSnapshot(TestResourceSnapshot):
+
+    def setUp(self):
+        super(TestListResourceSnapshot, self).setUp()
+
+        self.ports_mock.return_value = [
+            FakeResource(id='p1', name='port1', mac_address='aa',
+                         status='ACTIVE', admin_state_up=True),
+            FakeResource(id='p2', name='port2', mac_address='bb',
+                         status='DOWN', admin_state_up=False),
+        ]
+        self._sync('port')
+
+    def test_list(self):
+        columns, data = self._list('port')
+
+        self.assertEqual(('ID', 'Name', 'MAC Address', 'Status'), columns)
+        self.assertEqual([
+            ('p1', 'port1', 'aa', 'ACTIVE'),
+            ('p2', 'port2', 'bb', 'DOWN'),
+        ], data)
+
+    def test_list_filter(self):
+        columns, data = self._list(
+            'port', '--filter', 'status=DOWN',
+            '--filter', 'admin_state_up=False')
+
+        self.assertEqual([('p2', 'port2', 'bb', 'DOWN')], data)
+
+    def test_list_filter_options(self):
+        self.ports_mock.return_value = [
+            FakeResource(id='p1', name='port1', mac_address='aa',
+                         status='ACTIVE', project_id='proj1',
+                         binding_host_id='host1'),
+            FakeResource(id='p2', name='port2', mac_address='bb',
+                         status='ACTIVE', project_id='proj2',
+                         binding_host_id='host1'),
+            FakeResource(id='p3', name='port3', mac_address='cc',
+                         status='DOWN', project_id='proj1',
+                         binding_host_id='host2'),
+        ]
+        self._sync('port')
+
+        columns, data = self._list(
+            'port', '--status', 'ACTIVE', '--host', 'host1')
+        self.assertEqual([
+            ('p1', 'port1', 'aa', 'ACTIVE'),
+            ('p2', 'port2', 'bb', 'ACTIVE'),
+        ], data)
+
+        columns, data = self._list(
+            'port', '--project', 'proj1', '--filter', 'name=port3')
+        self.assertEqual([('p3', 'port3', 'cc', 'DOWN')], data)
+
+    def test_list_filter_option_not_supported(self):
+        self.assertRaises(
+            exceptions.CommandError, self._list, 'network', '--host', 'h1')
+
+    def test_list_long(self):
+        columns, data = self._list('port', '--long')
+
+        self.assertEqual(
+            ('admin_state_up', 'id', 'mac_address', 'name', 'status'),
+            columns)
+        self.assertEqual([
+            (True, 'p1', 'aa', 'port1', 'ACTIVE'),
+            (False, 'p2', 'bb', 'port2', 'DOWN'),
+        ], data)
+
+    def test_list_not_synced(self):
+        self.assertRaises(
+            exceptions.CommandError, self._list, 'server')
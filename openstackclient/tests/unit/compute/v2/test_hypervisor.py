@@ -215,6 +215,98 @@ class TestHypervisorList(TestHypervisor):
         self.assertEqual(self.columns_long, columns)
         self.assertEqual(self.data_long, tuple(data))
 
+    def test_hypervisor_list_with_aggregates_and_uptime(self):
+        self.hypervisors[1].service = {'host': 'cell1@bbb', 'id': 2}
+        self.aggregates_mock.list.return_value = [
+            compute_fakes.FakeAggregate.create_one_aggregate(
+                attrs={'name': 'agg1', 'hosts': ['aaa', 'bbb']}),
+            compute_fakes.FakeAggregate.create_one_aggregate(
+                attrs={'name': 'cell1@agg2', 'hosts': ['bbb']}),
+        ]
+        uptimes = {
+            self.hypervisors[0].id: fakes.FakeResource(info={
+                'uptime': ' 01:28:24 up 3 days, 11:15,  1 user, '
+                          ' load average: 0.94, 0.62, 0.50\n',
+            }, loaded=True),
+            self.hypervisors[1].id: nova_exceptions.HTTPNotImplemented(501),
+        }
+
+        def _uptime(hypervisor_id):
+            uptime = uptimes[hypervisor_id]
+            if isinstance(uptime, Exception):
+                raise uptime
+            return uptime
+
+        self.hypervisors_mock.uptime.side_effect = _uptime
+
+        arglist = [
+            '--with-aggregates',
+            '--with-uptime',
+        ]
+        verifylist = [
+            ('with_aggregates', True),
+            ('with_uptime', True),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.aggregates_mock.list.assert_called_once_with()
+        self.assertEqual(2, self.hypervisors_mock.uptime.call_count)
+        self.assertEqual(self.columns + ('Aggregates', 'Uptime'), columns)
+        self.assertEqual((
+            self.data[0] + (
+                format_columns.ListColumn(['agg1']), '3 days, 11:15'),
+            self.data[1] + (format_columns.ListColumn(['cell1@agg2']), ''),
+        ), tuple(data))
+
+    def test_hypervisor_list_with_uptime_service_down(self):
+        self.hypervisors_mock.uptime.side_effect = [
+            fakes.FakeResource(info={
+                'uptime': ' 01:28:24 up 3 days, 11:15,  1 user, '
+                          ' load average: 0.94, 0.62, 0.50\n',
+            }, loaded=True),
+            # Returned by nova when the compute service is down
+            nova_exceptions.BadRequest(400),
+        ]
+
+        arglist = [
+            '--with-uptime',
+        ]
+        verifylist = [
+            ('with_uptime', True),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.assertEqual(2, self.hypervisors_mock.uptime.call_count)
+        self.assertEqual(self.columns + ('Uptime',), columns)
+        uptimes = sorted(row[-1] for row in data)
+        self.assertEqual(['', '3 days, 11:15'], uptimes)
+
+    def test_hypervisor_list_long_with_aggregates(self):
+        self.aggregates_mock.list.return_value = []
+        arglist = [
+            '--long',
+            '--with-aggregates',
+        ]
+        verifylist = [
+            ('long', True),
+            ('with_aggregates', True),
+            ('with_uptime', False),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.hypervisors_mock.uptime.assert_not_called()
+        self.assertEqual(self.columns_long + ('Aggregates',), columns)
+        self.assertEqual((
+            self.data_long[0] + (format_columns.ListColumn([]),),
+            self.data_long[1] + (format_columns.ListColumn([]),),
+        ), tuple(data))
+
     def test_hypervisor_list_with_limit(self):
         self.app.client_manager.compute.api_version = \
             api_versions.APIVersion('2.33')
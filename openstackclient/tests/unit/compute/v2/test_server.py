@@ -3361,6 +3361,122 @@ class TestServerCreate(TestServer):
         self.assertEqual(self.columns, columns)
         self.assertEqual(self.datalist(), data)
 
+    def test_server_create_image_property_filter(self):
+        arglist = [
+            '--image-property', 'visibility=public',
+            '--image-property', 'hypervisor_type=qemu',
+            '--flavor', 'flavor1',
+            '--nic', 'none',
+            self.new_server.name,
+        ]
+        verifylist = [
+            ('image_properties', {'visibility': 'public',
+                                  'hypervisor_type': 'qemu'}),
+            ('server_name', self.new_server.name),
+        ]
+        target_image = image_fakes.create_one_image(
+            {'visibility': 'public', 'hypervisor_type': 'qemu'})
+        another_image = image_fakes.create_one_image(
+            {'visibility': 'public', 'hypervisor_type': 'xen'})
+        self.images_mock.return_value = [another_image, target_image]
+        self.app.client_manager.save_cache = mock.Mock()
+
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+        self.cmd.take_action(parsed_args)
+
+        self.images_mock.assert_called_once_with(visibility='public')
+        self.app.client_manager.save_cache.assert_not_called()
+        self.assertEqual(
+            target_image, self.servers_mock.create.call_args[0][1])
+
+    def test_server_create_image_property_index(self):
+        arglist = [
+            '--image-property', 'hypervisor_type=qemu',
+            '--flavor', 'flavor1',
+            '--nic', 'none',
+            self.new_server.name,
+        ]
+        verifylist = [
+            ('image_properties', {'hypervisor_type': 'qemu'}),
+            ('server_name', self.new_server.name),
+        ]
+        target_image = image_fakes.create_one_image(
+            {'hypervisor_type': 'qemu'})
+        another_image = image_fakes.create_one_image(
+            {'hypervisor_type': 'xen'})
+        self.images_mock.return_value = [another_image, target_image]
+        self.app.client_manager.save_cache = mock.Mock()
+
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+        self.cmd.take_action(parsed_args)
+
+        self.images_mock.assert_called_once_with()
+        self.assertEqual(
+            target_image, self.servers_mock.create.call_args[0][1])
+        name, index = self.app.client_manager.save_cache.call_args[0]
+        self.assertEqual(server.IMAGE_PROPERTY_INDEX, name)
+        self.assertEqual(
+            {'qemu': [target_image.id], 'xen': [another_image.id]},
+            index['hypervisor_type'])
+
+    def test_server_create_image_property_index_cached(self):
+        arglist = [
+            '--image-property', 'hypervisor_type=qemu',
+            '--flavor', 'flavor1',
+            '--nic', 'none',
+            self.new_server.name,
+        ]
+        verifylist = [
+            ('image_properties', {'hypervisor_type': 'qemu'}),
+            ('server_name', self.new_server.name),
+        ]
+        target_image = image_fakes.create_one_image(
+            {'hypervisor_type': 'qemu'})
+        self.app.client_manager.load_cache = mock.Mock(return_value={
+            'hypervisor_type': {
+                'qemu': [target_image.id],
+                'xen': ['another-image-id'],
+            },
+        })
+        self.get_image_mock.return_value = target_image
+
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+        self.cmd.take_action(parsed_args)
+
+        self.app.client_manager.load_cache.assert_called_once_with(
+            server.IMAGE_PROPERTY_INDEX)
+        self.images_mock.assert_not_called()
+        self.get_image_mock.assert_any_call(target_image.id)
+        self.assertEqual(
+            target_image, self.servers_mock.create.call_args[0][1])
+
+    def test_server_create_image_property_index_stale(self):
+        arglist = [
+            '--image-property', 'hypervisor_type=qemu',
+            '--flavor', 'flavor1',
+            '--nic', 'none',
+            self.new_server.name,
+        ]
+        verifylist = [
+            ('image_properties', {'hypervisor_type': 'qemu'}),
+            ('server_name', self.new_server.name),
+        ]
+        target_image = image_fakes.create_one_image(
+            {'hypervisor_type': 'qemu'})
+        self.images_mock.return_value = [target_image]
+        self.app.client_manager.load_cache = mock.Mock(return_value={
+            'hypervisor_type': {'qemu': ['deleted-image-id']},
+        })
+        self.get_image_mock.side_effect = sdk_exceptions.ResourceNotFound
+
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+        self.cmd.take_action(parsed_args)
+
+        self.get_image_mock.assert_any_call('deleted-image-id')
+        self.images_mock.assert_called_once_with()
+        self.assertEqual(
+            target_image, self.servers_mock.create.call_args[0][1])
+
     def test_server_create_with_swap(self):
         arglist = [
             '--image', 'image1',
@@ -4662,6 +4778,120 @@ class TestServerList(_TestServerList):
             'Invalid time value'
         )
 
+    @mock.patch.object(server.time, 'sleep')
+    def test_server_list_watch(self, mock_sleep):
+        for i, s in enumerate(self.servers):
+            s.updated = '2021-01-01T00:00:0%dZ' % i
+        changed = copy.deepcopy(self.servers[0])
+        changed.status = 'SHUTOFF'
+        changed.updated = '2021-01-01T00:01:00Z'
+        deleted = copy.deepcopy(self.servers[1])
+        deleted.status = 'DELETED'
+        deleted.updated = '2021-01-01T00:02:00Z'
+        unchanged = self.servers[2]
+        self.servers_mock.list.side_effect = [
+            self.servers,
+            [changed, deleted, unchanged],
+        ]
+        self.cmd.produce_output = mock.Mock()
+
+        arglist = [
+            '--watch',
+            '--watch-interval', '5',
+            '--watch-count', '2',
+        ]
+        verifylist = [
+            ('watch', True),
+            ('watch_interval', 5),
+            ('watch_count', 2),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.assertEqual(2, self.servers_mock.list.call_count)
+        self.search_opts['changes-since'] = '2021-01-01T00:00:02Z'
+        self.servers_mock.list.assert_called_with(
+            search_opts=self.search_opts, limit=-1)
+        mock_sleep.assert_called_once_with(5)
+        # images and flavors are only looked up once by ID
+        self.images_mock.assert_not_called()
+        self.flavors_mock.list.assert_not_called()
+        self.assertEqual(
+            len(set(s.image['id'] for s in self.servers if s.image)),
+            self.get_image_mock.call_count)
+        self.assertEqual(
+            len(set(s.flavor['id'] for s in self.servers)),
+            self.flavors_mock.get.call_count)
+
+        self.assertEqual(('Change',) + self.columns, columns)
+        self.cmd.produce_output.assert_called_once_with(
+            parsed_args,
+            ('Change',) + self.columns,
+            [('added',) + row for row in self.data],
+        )
+        self.assertEqual(
+            [
+                ('changed', changed.id, changed.name, 'SHUTOFF') +
+                self.data[0][3:],
+                ('deleted',) + self.data[1],
+            ],
+            data,
+        )
+
+    def test_server_list_watch_with_limit(self):
+        arglist = [
+            '--watch',
+            '--limit', '1',
+        ]
+        verifylist = [
+            ('watch', True),
+            ('limit', 1),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        self.assertRaises(
+            exceptions.CommandError,
+            self.cmd.take_action,
+            parsed_args,
+        )
+
+    def test_server_list_watch_invalid_interval(self):
+        arglist = [
+            '--watch',
+            '--watch-interval', '0',
+        ]
+        verifylist = [
+            ('watch', True),
+            ('watch_interval', 0),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        self.assertRaises(
+            exceptions.CommandError,
+            self.cmd.take_action,
+            parsed_args,
+        )
+        self.servers_mock.list.assert_not_called()
+
+    def test_server_list_watch_negative_count(self):
+        arglist = [
+            '--watch',
+            '--watch-count', '-1',
+        ]
+        verifylist = [
+            ('watch', True),
+            ('watch_count', -1),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        self.assertRaises(
+            exceptions.CommandError,
+            self.cmd.take_action,
+            parsed_args,
+        )
+        self.servers_mock.list.assert_not_called()
+
     def test_server_list_with_tag(self):
         self.app.client_manager.compute.api_version = api_versions.APIVersion(
             '2.26')
@@ -281,6 +281,228 @@ class TestListMigrationV259(TestListMigration):
             '--os-compute-api-version 2.59 or greater is required',
             str(ex))
 
+    @mock.patch('time.sleep')
+    def test_server_migration_list_watch(self, sleep_mock):
+        done = compute_fakes.FakeMigration.create_one_migration(attrs={
+            'uuid': self.migrations[0].uuid,
+            'status': 'completed',
+            'updated_at': '2017-01-31T08:05:25.000000',
+        })
+        self.migrations_mock.list.side_effect = [
+            self.migrations[:1], [],
+            [done], [],
+        ]
+        self.cmd.produce_output = mock.Mock()
+        arglist = [
+            '--host', 'host1',
+            '--watch',
+            '--watch-interval', '2',
+        ]
+        verifylist = [
+            ('host', 'host1'),
+            ('watch', True),
+            ('watch_interval', 2),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.migrations_mock.list.assert_has_calls([
+            mock.call(marker=None, host='host1'),
+            mock.call(marker=self.migrations[0].uuid, host='host1'),
+            mock.call(marker=None, host='host1',
+                      changes_since='2017-01-31T08:03:25.000000'),
+            mock.call(marker=done.uuid, host='host1',
+                      changes_since='2017-01-31T08:03:25.000000'),
+        ])
+        sleep_mock.assert_called_once_with(2)
+
+        # The migrations of every poll but the last are emitted right away
+        self.cmd.produce_output.assert_called_once_with(
+            parsed_args, self.MIGRATION_COLUMNS, mock.ANY)
+        self.assertEqual(
+            [common_utils.get_item_properties(
+                self.migrations[0], self.MIGRATION_FIELDS)],
+            list(self.cmd.produce_output.call_args[0][2]))
+        self.assertEqual(self.MIGRATION_COLUMNS, columns)
+        self.assertEqual(
+            (common_utils.get_item_properties(done, self.MIGRATION_FIELDS),),
+            tuple(data))
+
+    @mock.patch('time.sleep')
+    def test_server_migration_list_watch_started(self, sleep_mock):
+        old = compute_fakes.FakeMigration.create_one_migration(
+            attrs={'status': 'completed'})
+        done = compute_fakes.FakeMigration.create_one_migration(attrs={
+            'uuid': self.migrations[0].uuid,
+            'status': 'completed',
+        })
+        new = compute_fakes.FakeMigration.create_one_migration(
+            attrs={'status': 'running'})
+        pages = iter([
+            [old, self.migrations[0]],
+            [done, new],
+        ])
+        self.migrations_mock.list.side_effect = (
+            lambda marker, **kwargs: [] if marker else next(pages))
+        self.cmd.produce_output = mock.Mock()
+        arglist = [
+            '--watch',
+        ]
+        verifylist = [
+            ('watch', True),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+        columns, data = self.cmd.take_action(parsed_args)
+
+        # The migration started while watching is not waited for
+        sleep_mock.assert_called_once_with(5)
+        self.assertEqual(
+            [old.uuid, self.migrations[0].uuid],
+            [row[1] for row in self.cmd.produce_output.call_args[0][2]])
+        self.assertEqual(
+            [done.uuid, new.uuid],
+            [row[1] for row in data])
+
+    @mock.patch('time.sleep')
+    def test_server_migration_list_watch_with_server_name(self, sleep_mock):
+        done = compute_fakes.FakeMigration.create_one_migration(attrs={
+            'uuid': self.migrations[0].uuid,
+            'instance_uuid': self.migrations[0].instance_uuid,
+            'status': 'completed',
+        })
+        pages = iter([self.migrations[:1], [done]])
+        self.migrations_mock.list.side_effect = (
+            lambda marker, **kwargs: [] if marker else next(pages))
+        self.cmd.produce_output = mock.Mock()
+        arglist = [
+            '--watch',
+            '--with-server-name',
+        ]
+        verifylist = [
+            ('watch', True),
+            ('with_server_name', True),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+        columns, data = self.cmd.take_action(parsed_args)
+
+        # The server name is looked up once for both polls
+        self.servers_mock.get.assert_called_once_with(
+            self.migrations[0].instance_uuid)
+        self.assertIn('Server Name', columns)
+        self.assertEqual(
+            [self.server.name],
+            [row[columns.index('Server Name')] for row in data])
+
+    @mock.patch('time.time')
+    @mock.patch('time.sleep')
+    def test_server_migration_list_watch_timeout(self, sleep_mock,
+                                                 time_mock):
+        times = iter([0, 0])
+        time_mock.side_effect = lambda: next(times, 10)
+        self.migrations_mock.list.side_effect = (
+            lambda marker, **kwargs: [] if marker else self.migrations[:1])
+        self.cmd.produce_output = mock.Mock()
+        arglist = [
+            '--watch',
+            '--watch-timeout', '7',
+        ]
+        verifylist = [
+            ('watch', True),
+            ('watch_timeout', 7),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+        columns, data = self.cmd.take_action(parsed_args)
+
+        sleep_mock.assert_called_once_with(5)
+        self.assertEqual(4, self.migrations_mock.list.call_count)
+        self.assertEqual(
+            [self.migrations[0].uuid],
+            [row[1] for row in self.cmd.produce_output.call_args[0][2]])
+        # The unchanged migration is not displayed again
+        self.assertEqual([], list(data))
+
+    def test_server_migration_list_watch_pre_v259(self):
+        self.app.client_manager.compute.api_version = api_versions.APIVersion(
+            '2.58')
+        arglist = [
+            '--watch',
+        ]
+        verifylist = [
+            ('watch', True),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+        ex = self.assertRaises(
+            exceptions.CommandError,
+            self.cmd.take_action,
+            parsed_args)
+        self.assertIn(
+            '--os-compute-api-version 2.59 or greater is required',
+            str(ex))
+
+    def test_server_migration_list_watch_with_status(self):
+        arglist = [
+            '--watch',
+            '--status', 'running',
+        ]
+        verifylist = [
+            ('watch', True),
+            ('status', 'running'),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+        ex = self.assertRaises(
+            exceptions.CommandError,
+            self.cmd.take_action,
+            parsed_args)
+        self.assertIn('--status', str(ex))
+        self.migrations_mock.list.assert_not_called()
+
+    def test_server_migration_list_with_server_name(self):
+        servers = [
+            compute_fakes.FakeServer.create_one_server(
+                attrs={'id': migration.instance_uuid})
+            for migration in self.migrations[:2]
+        ]
+        servers_by_id = {server.id: server for server in servers}
+
+        def _get(server_id):
+            if server_id not in servers_by_id:
+                raise exceptions.NotFound(404)
+            return servers_by_id[server_id]
+
+        self.servers_mock.get.side_effect = _get
+        arglist = [
+            '--with-server-name',
+        ]
+        verifylist = [
+            ('with_server_name', True),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+        columns, data = self.cmd.take_action(parsed_args)
+
+        # Only the servers of the migrations are looked up
+        self.servers_mock.list.assert_not_called()
+        self.servers_mock.get.assert_has_calls([
+            mock.call(migration.instance_uuid)
+            for migration in self.migrations
+        ], any_order=True)
+        self.assertEqual(
+            len(self.migrations), self.servers_mock.get.call_count)
+
+        index = self.MIGRATION_COLUMNS.index('Server UUID') + 1
+        self.assertEqual(
+            self.MIGRATION_COLUMNS[:index] + ['Server Name'] +
+            self.MIGRATION_COLUMNS[index:],
+            columns)
+        names = [servers[0].name, servers[1].name, '']
+        self.assertEqual([
+            common_utils.get_item_properties(
+                migration, self.MIGRATION_FIELDS[:index]) +
+            (name,) +
+            common_utils.get_item_properties(
+                migration, self.MIGRATION_FIELDS[index:])
+            for migration, name in zip(self.migrations, names)
+        ], list(data))
+
 
 class TestListMigrationV266(TestListMigration):
     """Test fetch all migrations by changes-before. """
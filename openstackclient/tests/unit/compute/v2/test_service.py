@@ -112,6 +112,291 @@ class TestServiceDelete(TestService):
         )
 
 
+class TestServiceDrain(TestService):
+
+    def setUp(self):
+        super(TestServiceDrain, self).setUp()
+
+        self.servers_mock = self.app.client_manager.compute.servers
+        self.servers_mock.reset_mock()
+
+        self.servers = compute_fakes.FakeServer.create_servers(
+            attrs={'status': 'ACTIVE', 'OS-EXT-STS:task_state': None},
+            methods={'live_migrate': None},
+        )
+
+        sleep_patcher = mock.patch('time.sleep')
+        self.sleep_mock = sleep_patcher.start()
+        self.addCleanup(sleep_patcher.stop)
+
+        self.cmd = service.DrainService(self.app, None)
+
+    def _set_compute_api_version(self, version):
+        self.app.client_manager.compute.api_version = \
+            api_versions.APIVersion(version)
+
+    def test_service_drain(self):
+        shutoff = compute_fakes.FakeServer.create_one_server(
+            attrs={'status': 'SHUTOFF'})
+        self.servers_mock.list.side_effect = [
+            self.servers + [shutoff],
+            [],
+        ]
+        arglist = ['host1']
+        verifylist = [
+            ('host', ['host1']),
+            ('max_per_source', 2),
+            ('retries', 2),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.servers_mock.list.assert_called_with(
+            search_opts={'host': 'host1', 'all_tenants': True}, limit=-1)
+        self.assertEqual(2, self.servers_mock.list.call_count)
+        for server in self.servers:
+            server.live_migrate.assert_called_once_with(
+                host=None, block_migration=False, disk_over_commit=False)
+        self.assertEqual(
+            ('ID', 'Name', 'Source Host', 'Target Host', 'Attempts',
+             'Result'), columns)
+        self.assertEqual([
+            (self.servers[0].id, self.servers[0].name, 'host1', '', 1,
+             'migrated'),
+            (self.servers[1].id, self.servers[1].name, 'host1', '', 1,
+             'migrated'),
+            (shutoff.id, shutoff.name, 'host1', '', 0, 'skipped (SHUTOFF)'),
+        ], list(data))
+        self.sdk_client.disable_service.assert_not_called()
+
+    def test_service_drain_max_per_source(self):
+        self.servers_mock.list.side_effect = [
+            self.servers,
+            self.servers[1:],
+            [],
+        ]
+        arglist = ['host1', '--max-per-source', '1']
+        verifylist = [
+            ('host', ['host1']),
+            ('max_per_source', 1),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.assertEqual(3, self.servers_mock.list.call_count)
+        self.assertEqual(
+            ['migrated', 'migrated'], [row[5] for row in data])
+
+    def test_service_drain_retry(self):
+        self.servers_mock.list.side_effect = [
+            self.servers[:1],
+            self.servers[:1],
+            [],
+        ]
+        arglist = ['host1', '--retries', '1']
+        verifylist = [
+            ('retries', 1),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.assertEqual(2, self.servers[0].live_migrate.call_count)
+        self.assertEqual([
+            (self.servers[0].id, self.servers[0].name, 'host1', '', 2,
+             'migrated'),
+        ], list(data))
+
+    def test_service_drain_retry_submit(self):
+        calls = mock.Mock()
+        calls.attach_mock(self.servers[0].live_migrate, 'live_migrate')
+        calls.attach_mock(self.sleep_mock, 'sleep')
+        self.servers[0].live_migrate.side_effect = [Exception('error'), None]
+        self.servers_mock.list.side_effect = [
+            self.servers[:1],
+            [],
+        ]
+        arglist = ['host1']
+        verifylist = [
+            ('host', ['host1']),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        # The failed submit is only retried after a poll interval
+        self.assertEqual([
+            mock.call.live_migrate(
+                host=None, block_migration=False, disk_over_commit=False),
+            mock.call.sleep(service.DRAIN_POLL_INTERVAL),
+            mock.call.live_migrate(
+                host=None, block_migration=False, disk_over_commit=False),
+            mock.call.sleep(service.DRAIN_POLL_INTERVAL),
+        ], calls.mock_calls)
+        self.assertEqual([
+            (self.servers[0].id, self.servers[0].name, 'host1', '', 2,
+             'migrated'),
+        ], list(data))
+
+    def test_service_drain_retry_exhausted(self):
+        self.servers[0].live_migrate.side_effect = Exception('error')
+        self.servers_mock.list.return_value = self.servers[:1]
+        self.cmd.produce_output = mock.Mock()
+        arglist = ['host1', '--retries', '1']
+        verifylist = [
+            ('retries', 1),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        ex = self.assertRaises(exceptions.CommandError,
+                               self.cmd.take_action,
+                               parsed_args)
+
+        self.assertEqual('1 of 1 servers failed to migrate.', str(ex))
+        self.assertEqual(2, self.servers[0].live_migrate.call_count)
+        self.sleep_mock.assert_called_once_with(service.DRAIN_POLL_INTERVAL)
+
+    def test_service_drain_error(self):
+        errored = compute_fakes.FakeServer.create_one_server(
+            attrs={'id': self.servers[0].id, 'status': 'ERROR'})
+        self.servers_mock.list.side_effect = [
+            self.servers[:1],
+            [errored],
+        ]
+        self.cmd.produce_output = mock.Mock()
+        arglist = ['host1']
+        verifylist = [
+            ('host', ['host1']),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        ex = self.assertRaises(exceptions.CommandError,
+                               self.cmd.take_action,
+                               parsed_args)
+
+        self.assertEqual('1 of 1 servers failed to migrate.', str(ex))
+        self.servers[0].live_migrate.assert_called_once()
+        self.cmd.produce_output.assert_called_once_with(
+            parsed_args,
+            ('ID', 'Name', 'Source Host', 'Target Host', 'Attempts',
+             'Result'),
+            [(self.servers[0].id, self.servers[0].name, 'host1', '', 1,
+              'failed')])
+
+    @mock.patch('time.time')
+    def test_service_drain_timeout(self, time_mock):
+        time_mock.return_value = 0
+
+        def _sleep(seconds):
+            time_mock.return_value += seconds
+
+        self.sleep_mock.side_effect = _sleep
+        migrating = compute_fakes.FakeServer.create_one_server(
+            attrs={'id': self.servers[0].id, 'status': 'MIGRATING',
+                   'OS-EXT-STS:task_state': 'migrating'})
+        self.servers_mock.list.side_effect = [
+            self.servers[:1],
+            [migrating],
+            [migrating],
+        ]
+        self.cmd.produce_output = mock.Mock()
+        arglist = ['host1', '--timeout', '8']
+        verifylist = [
+            ('timeout', 8),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        ex = self.assertRaises(exceptions.CommandError,
+                               self.cmd.take_action,
+                               parsed_args)
+
+        self.assertEqual('1 of 1 servers failed to migrate.', str(ex))
+        self.servers[0].live_migrate.assert_called_once()
+        self.assertEqual(3, self.servers_mock.list.call_count)
+
+    def test_service_drain_target_host(self):
+        self._set_compute_api_version('2.30')
+        self.servers_mock.list.side_effect = [
+            self.servers,
+            [],
+        ]
+        arglist = [
+            'host1',
+            '--target-host', 'host2',
+            '--target-host', 'host3',
+            '--max-per-target', '1',
+        ]
+        verifylist = [
+            ('target_host', ['host2', 'host3']),
+            ('max_per_target', 1),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.servers[0].live_migrate.assert_called_once_with(
+            host='host2', block_migration='auto')
+        self.servers[1].live_migrate.assert_called_once_with(
+            host='host3', block_migration='auto')
+        self.assertEqual(['host2', 'host3'], [row[3] for row in data])
+
+    def test_service_drain_target_host_pre_v230(self):
+        self._set_compute_api_version('2.29')
+        arglist = ['host1', '--target-host', 'host2']
+        verifylist = [
+            ('target_host', ['host2']),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        ex = self.assertRaises(exceptions.CommandError,
+                               self.cmd.take_action,
+                               parsed_args)
+        self.assertIn('--os-compute-api-version 2.30', str(ex))
+        self.servers_mock.list.assert_not_called()
+
+    def test_service_drain_max_per_target_without_target_host(self):
+        arglist = ['host1', '--max-per-target', '1']
+        verifylist = [
+            ('max_per_target', 1),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        ex = self.assertRaises(exceptions.CommandError,
+                               self.cmd.take_action,
+                               parsed_args)
+        self.assertIn('--target-host', str(ex))
+        self.servers_mock.list.assert_not_called()
+
+    def test_service_drain_invalid_max(self):
+        arglist = ['host1', '--max-per-source', '0']
+        verifylist = [
+            ('max_per_source', 0),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        self.assertRaises(exceptions.CommandError,
+                          self.cmd.take_action,
+                          parsed_args)
+
+    @mock.patch.object(sdk_utils, 'supports_microversion')
+    def test_service_drain_disable(self, sm_mock):
+        sm_mock.return_value = False
+        self.servers_mock.list.return_value = []
+        arglist = ['host1', '--disable']
+        verifylist = [
+            ('disable', True),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.sdk_client.disable_service.assert_called_once_with(
+            None, 'host1', 'nova-compute', 'drained')
+        self.assertEqual([], list(data))
+
+
 class TestServiceList(TestService):
 
     service = compute_fakes.FakeService.create_one_service()
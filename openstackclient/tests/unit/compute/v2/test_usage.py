@@ -15,6 +15,7 @@ import datetime
 from unittest import mock
 
 from novaclient import api_versions
+from osc_lib import exceptions
 
 from openstackclient.compute.v2 import usage as usage_cmds
 from openstackclient.tests.unit.compute.v2 import fakes as compute_fakes
@@ -130,6 +131,110 @@ class TestUsageList(TestUsage):
         self.assertCountEqual(self.columns, columns)
         self.assertCountEqual(tuple(self.data), tuple(data))
 
+    def _window_usages(self, instance_ids):
+        return [compute_fakes.FakeUsage.create_one_usage(attrs={
+            'tenant_id': self.project.id,
+            'total_hours': 1.0,
+            'server_usages': [
+                {'instance_id': instance_id, 'hours': 1.0}
+                for instance_id in instance_ids
+            ],
+        })]
+
+    def test_usage_list_window_days(self):
+        arglist = [
+            '--start', '2016-11-01',
+            '--end', '2016-11-11',
+            '--window-days', '4',
+        ]
+        verifylist = [
+            ('start', '2016-11-01'),
+            ('end', '2016-11-11'),
+            ('window_days', 4),
+        ]
+        windows = {
+            datetime.datetime(2016, 11, 1): self._window_usages(['s1']),
+            datetime.datetime(2016, 11, 5): self._window_usages(['s1', 's2']),
+            datetime.datetime(2016, 11, 9): self._window_usages(['s2']),
+        }
+        self.usage_mock.list.side_effect = (
+            lambda start, end, detailed: windows[start])
+
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.usage_mock.list.assert_has_calls([
+            mock.call(datetime.datetime(2016, 11, 1),
+                      datetime.datetime(2016, 11, 5), detailed=True),
+            mock.call(datetime.datetime(2016, 11, 5),
+                      datetime.datetime(2016, 11, 9), detailed=True),
+            mock.call(datetime.datetime(2016, 11, 9),
+                      datetime.datetime(2016, 11, 11), detailed=True),
+        ], any_order=True)
+        self.assertEqual(3, self.usage_mock.list.call_count)
+        self.assertEqual(self.columns, columns)
+        data = list(data)
+        self.assertEqual(1, len(data))
+        self.assertEqual(
+            [{'instance_id': 's1', 'hours': 2.0},
+             {'instance_id': 's2', 'hours': 2.0}],
+            data[0][1].machine_readable())
+        self.assertEqual(2, data[0][1].human_readable())
+        self.assertEqual(1536.0, data[0][2].machine_readable())
+
+    def test_usage_list_window_days_invalid(self):
+        arglist = [
+            '--window-days', '0',
+        ]
+        verifylist = [
+            ('window_days', 0),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        self.assertRaises(exceptions.CommandError, self.cmd.take_action,
+                          parsed_args)
+
+    def test_usage_list_no_server_usages(self):
+        arglist = [
+            '--no-server-usages',
+            '-f', 'json',
+        ]
+        verifylist = [
+            ('no_server_usages', True),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.usage_mock.list.assert_called_once_with(
+            mock.ANY, mock.ANY, detailed=False)
+        self.projects_mock.list.assert_not_called()
+        self.assertEqual(
+            ("Project", "RAM MB-Hours", "CPU Hours", "Disk GB-Hours"),
+            columns)
+        self.assertEqual([(
+            usage_cmds.ProjectColumn(self.usages[0].tenant_id),
+            usage_cmds.FloatColumn(self.usages[0].total_memory_mb_usage),
+            usage_cmds.FloatColumn(self.usages[0].total_vcpus_usage),
+            usage_cmds.FloatColumn(self.usages[0].total_local_gb_usage),
+        )], list(data))
+
+    def test_usage_list_no_server_usages_pagination(self):
+        self.app.client_manager.compute.api_version = api_versions.APIVersion(
+            '2.40')
+        arglist = [
+            '--no-server-usages',
+        ]
+        verifylist = [
+            ('no_server_usages', True),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        self.assertRaises(exceptions.CommandError, self.cmd.take_action,
+                          parsed_args)
+        self.usage_mock.list.assert_not_called()
+
 
 class TestUsageShow(TestUsage):
 
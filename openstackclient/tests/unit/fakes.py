@@ -72,6 +72,9 @@ class FakeStdout(object):
     def write(self, text):
         self.content.append(text)
 
+    def flush(self):
+        pass
+
     def make_string(self):
         result = ''
         for line in self.content:
@@ -142,6 +145,7 @@ class FakeClientManager(object):
         self.network_endpoint_enabled = True
         self.compute_endpoint_enabled = True
         self.volume_endpoint_enabled = True
+        self.network_extensions = {}
 
     def get_configuration(self):
         return {
@@ -154,9 +158,22 @@ class FakeClientManager(object):
             'identity_api_version': VERSION,
         }
 
+    def load_cache(self, name):
+        return None
+
+    def save_cache(self, name, value):
+        pass
+
     def is_network_endpoint_enabled(self):
         return self.network_endpoint_enabled
 
+    def find_network_extension(self, name_or_id, **kwargs):
+        # Like ClientManager, only discover each extension once
+        if name_or_id not in self.network_extensions:
+            self.network_extensions[name_or_id] = (
+                self.network.find_extension(name_or_id, **kwargs))
+        return self.network_extensions[name_or_id]
+
     def is_compute_endpoint_enabled(self):
         return self.compute_endpoint_enabled
 
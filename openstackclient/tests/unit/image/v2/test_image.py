@@ -13,11 +13,14 @@
 #   under the License.
 
 import copy
+import hashlib
 import io
+import json
 import os
 import tempfile
 from unittest import mock
 
+import fixtures
 from openstack import exceptions as sdk_exceptions
 from osc_lib.cli import format_columns
 from osc_lib import exceptions
@@ -25,6 +28,7 @@ from osc_lib import exceptions
 from openstackclient.image.v2 import image
 from openstackclient.tests.unit.identity.v3 import fakes as identity_fakes
 from openstackclient.tests.unit.image.v2 import fakes as image_fakes
+from openstackclient.tests.unit import utils
 
 
 class TestImage(image_fakes.TestImagev2):
@@ -249,6 +253,107 @@ class TestImageCreate(TestImage):
             self.expected_data,
             data)
 
+    def _create_with_upload(self, checksum):
+        content = b'image data' * 100
+        imagefile = tempfile.NamedTemporaryFile(delete=False)
+        self.addCleanup(os.unlink, imagefile.name)
+        imagefile.write(content)
+        imagefile.close()
+
+        def _create_image(**kwargs):
+            # Consume the data like the upload would
+            while kwargs['data'].read(64):
+                pass
+            return self.new_image
+
+        self.client.create_image.side_effect = _create_image
+        uploaded = image_fakes.create_one_image(
+            {'id': self.new_image.id, 'checksum': checksum(content)})
+        self.client.get_image.return_value = uploaded
+
+        arglist = [
+            '--file', imagefile.name,
+            '--progress',
+            self.new_image.name,
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, [])
+        return uploaded, parsed_args
+
+    def test_image_create_file_checksum(self):
+        uploaded, parsed_args = self._create_with_upload(
+            lambda content: hashlib.md5(content).hexdigest())
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.client.get_image.assert_called_once_with(self.new_image.id)
+        self.assertCountEqual(
+            tuple(zip(*sorted(image._format_image(uploaded).items())))[1],
+            data)
+
+    def test_image_create_file_checksum_mismatch(self):
+        uploaded, parsed_args = self._create_with_upload(
+            lambda content: hashlib.md5(b'other').hexdigest())
+
+        self.assertRaises(
+            exceptions.CommandError,
+            self.cmd.take_action,
+            parsed_args,
+        )
+
+    @mock.patch('osc_lib.utils.get_password', return_value='')
+    @mock.patch('openstack.image.image_signer.ImageSigner')
+    def test_image_create_file_signed(self, mock_signer, mock_password):
+        content = b'image data' * 100
+        imagefile = tempfile.NamedTemporaryFile(delete=False)
+        self.addCleanup(os.unlink, imagefile.name)
+        imagefile.write(content)
+        imagefile.close()
+
+        def _generate_signature(file_obj):
+            # Read the data and rewind like ImageSigner does
+            file_obj.seek(0)
+            while file_obj.read(64):
+                pass
+            file_obj.seek(0)
+            return b'signature'
+
+        signer = mock_signer.return_value
+        signer.generate_signature.side_effect = _generate_signature
+        signer.hash_method = 'SHA-256'
+        signer.padding_method = 'RSA-PSS'
+        uploaded = image_fakes.create_one_image(
+            {'id': self.new_image.id,
+             'checksum': hashlib.md5(content).hexdigest()})
+        self.client.get_image.return_value = uploaded
+
+        arglist = [
+            '--file', imagefile.name,
+            '--sign-key-path', 'key.pem',
+            '--sign-cert-id', 'cert-id',
+            self.new_image.name,
+        ]
+        verifylist = [
+            ('file', imagefile.name),
+            ('sign_key_path', 'key.pem'),
+            ('sign_cert_id', 'cert-id'),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        signer.load_private_key.assert_called_once_with(
+            'key.pem', password=None)
+        kwargs = self.client.create_image.call_args[1]
+        self.assertEqual(hashlib.md5(content).hexdigest(), kwargs['md5'])
+        self.assertEqual(
+            hashlib.sha256(content).hexdigest(), kwargs['sha256'])
+        self.assertEqual(b'c2lnbmF0dXJl', kwargs['img_signature'])
+        self.assertEqual(
+            'cert-id', kwargs['img_signature_certificate_uuid'])
+        self.assertEqual('SHA-256', kwargs['img_signature_hash_method'])
+        self.assertEqual('RSA-PSS', kwargs['img_signature_key_type'])
+        self.client.get_image.assert_called_once_with(self.new_image.id)
+
     def test_image_create_dead_options(self):
 
         arglist = [
@@ -495,6 +600,7 @@ class TestImageList(TestImage):
         # containing the data to be listed.
         columns, data = self.cmd.take_action(parsed_args)
         self.client.images.assert_called_with(
+            sort='name:asc',
             # marker=self._image.id,
         )
 
@@ -520,6 +626,7 @@ class TestImageList(TestImage):
         columns, data = self.cmd.take_action(parsed_args)
         self.client.images.assert_called_with(
             visibility='public',
+            sort='name:asc',
         )
 
         self.assertEqual(self.columns, columns)
@@ -544,6 +651,7 @@ class TestImageList(TestImage):
         columns, data = self.cmd.take_action(parsed_args)
         self.client.images.assert_called_with(
             visibility='private',
+            sort='name:asc',
         )
 
         self.assertEqual(self.columns, columns)
@@ -568,6 +676,7 @@ class TestImageList(TestImage):
         columns, data = self.cmd.take_action(parsed_args)
         self.client.images.assert_called_with(
             visibility='community',
+            sort='name:asc',
         )
 
         self.assertEqual(self.columns, columns)
@@ -592,6 +701,7 @@ class TestImageList(TestImage):
         columns, data = self.cmd.take_action(parsed_args)
         self.client.images.assert_called_with(
             visibility='shared',
+            sort='name:asc',
         )
 
         self.assertEqual(self.columns, columns)
@@ -619,6 +729,7 @@ class TestImageList(TestImage):
         self.client.images.assert_called_with(
             visibility='shared',
             member_status='all',
+            sort='name:asc',
         )
 
         self.assertEqual(self.columns, columns)
@@ -653,6 +764,7 @@ class TestImageList(TestImage):
         # containing the data to be listed.
         columns, data = self.cmd.take_action(parsed_args)
         self.client.images.assert_called_with(
+            sort='name:asc',
         )
 
         collist = (
@@ -702,7 +814,11 @@ class TestImageList(TestImage):
         # containing the data to be listed.
         columns, data = self.cmd.take_action(parsed_args)
         self.client.images.assert_called_with(
+            sort='name:asc',
         )
+
+        self.assertEqual(self.columns, columns)
+        self.assertCountEqual(self.datalist, tuple(data))
         sf_mock.assert_called_with(
             [self._image],
             attr='a',
@@ -710,15 +826,54 @@ class TestImageList(TestImage):
             property_field='properties',
         )
 
+    @mock.patch('osc_lib.api.utils.simple_filter')
+    def test_image_list_property_server_side_option(self, sf_mock):
+        arglist = [
+            '--property', 'owner=abc',
+            '--property', 'visibility=public',
+        ]
+        verifylist = [
+            ('property', {'owner': 'abc', 'visibility': 'public'}),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        columns, data = self.cmd.take_action(parsed_args)
+
         self.assertEqual(self.columns, columns)
         self.assertCountEqual(self.datalist, tuple(data))
+        self.client.images.assert_called_with(
+            owner='abc',
+            visibility='public',
+            sort='name:asc',
+        )
+        sf_mock.assert_not_called()
+
+    def test_image_list_property_filter_by_page(self):
+        matching = [
+            image_fakes.create_one_image({'properties': {'a': '1'}})
+            for _ in range(3)
+        ]
+        others = [
+            image_fakes.create_one_image({'properties': {'a': '2'}})
+            for _ in range(3)
+        ]
+        self.client.images.side_effect = None
+        self.client.images.return_value = iter([
+            matching[0], others[0], others[1],
+            matching[1], others[2], matching[2],
+        ])
+
+        filtered = image._filter_images(self.client.images(), {'a': '1'})
+
+        self.assertEqual(matching[0], next(filtered))
+        self.assertEqual(matching[1], next(filtered))
+        self.assertEqual(matching[2], next(filtered))
+        self.assertRaises(StopIteration, next, filtered)
 
     @mock.patch('osc_lib.utils.sort_items')
     def test_image_list_sort_option(self, si_mock):
-        si_mock.return_value = [copy.deepcopy(self._image)]
-
-        arglist = ['--sort', 'name:asc']
-        verifylist = [('sort', 'name:asc')]
+        arglist = ['--sort', 'size:desc,name']
+        verifylist = [('sort', 'size:desc,name')]
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
 
         # In base command class Lister in cliff, abstract method take_action()
@@ -726,10 +881,25 @@ class TestImageList(TestImage):
         # containing the data to be listed.
         columns, data = self.cmd.take_action(parsed_args)
         self.client.images.assert_called_with(
+            sort='size:desc,name:asc',
         )
+        si_mock.assert_not_called()
+        self.assertEqual(self.columns, columns)
+        self.assertCountEqual(self.datalist, tuple(data))
+
+    @mock.patch('osc_lib.utils.sort_items')
+    def test_image_list_sort_client_side_option(self, si_mock):
+        si_mock.return_value = [copy.deepcopy(self._image)]
+
+        arglist = ['--sort', 'visibility:asc']
+        verifylist = [('sort', 'visibility:asc')]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        columns, data = self.cmd.take_action(parsed_args)
+        self.client.images.assert_called_with()
         si_mock.assert_called_with(
             [self._image],
-            'name:asc',
+            'visibility:asc',
             str,
         )
         self.assertEqual(self.columns, columns)
@@ -748,7 +918,8 @@ class TestImageList(TestImage):
         columns, data = self.cmd.take_action(parsed_args)
         self.client.images.assert_called_with(
             limit=ret_limit,
-            paginated=False
+            paginated=False,
+            sort='name:asc',
             # marker=None
         )
 
@@ -785,6 +956,7 @@ class TestImageList(TestImage):
         columns, data = self.cmd.take_action(parsed_args)
         self.client.images.assert_called_with(
             marker=self._image.id,
+            sort='name:asc',
         )
 
         self.client.find_image.assert_called_with('graven')
@@ -801,6 +973,7 @@ class TestImageList(TestImage):
         columns, data = self.cmd.take_action(parsed_args)
         self.client.images.assert_called_with(
             name='abc',
+            sort='name:asc',
             # marker=self._image.id
         )
 
@@ -815,7 +988,8 @@ class TestImageList(TestImage):
 
         columns, data = self.cmd.take_action(parsed_args)
         self.client.images.assert_called_with(
-            status='active'
+            status='active',
+            sort='name:asc',
         )
 
     def test_image_list_hidden_option(self):
@@ -829,7 +1003,8 @@ class TestImageList(TestImage):
 
         columns, data = self.cmd.take_action(parsed_args)
         self.client.images.assert_called_with(
-            is_hidden=True
+            is_hidden=True,
+            sort='name:asc',
         )
 
     def test_image_list_tag_option(self):
@@ -843,7 +1018,8 @@ class TestImageList(TestImage):
 
         columns, data = self.cmd.take_action(parsed_args)
         self.client.images.assert_called_with(
-            tag='abc'
+            tag='abc',
+            sort='name:asc',
         )
 
 
@@ -1687,6 +1863,242 @@ class TestImageSave(TestImage):
             output='/path/to/file')
 
 
+class TestImageSaveParallel(TestImage):
+
+    data = bytes(range(256)) * 10
+
+    def setUp(self):
+        super(TestImageSaveParallel, self).setUp()
+
+        self.image = image_fakes.create_one_image({
+            'size': len(self.data),
+            'hash_algo': 'sha512',
+            'hash_value': hashlib.sha512(self.data).hexdigest(),
+        })
+        self.client.find_image.return_value = self.image
+        self.client.get = mock.Mock(side_effect=self._get)
+
+        self.path = os.path.join(
+            self.useFixture(fixtures.TempDir()).path, 'image')
+
+        # Get the command object to test
+        self.cmd = image.SaveImage(self.app, None)
+
+    def _get(self, url, headers, stream):
+        self.assertEqual('/images/%s/file' % self.image.id, url)
+        self.assertTrue(stream)
+        start, end = headers['Range'][len('bytes='):].split('-')
+        segment = self.data[int(start):int(end) + 1]
+        response = mock.Mock(status_code=206, headers={
+            'Content-Range': 'bytes %s-%s/%d' % (start, end, len(self.data)),
+        })
+        response.iter_content.return_value = [
+            segment[i:i + 100] for i in range(0, len(segment), 100)
+        ]
+        return response
+
+    def _ranges(self):
+        return sorted(
+            c[1]['headers']['Range'] for c in self.client.get.call_args_list
+        )
+
+    def _save(self, parallel, resume=False):
+        # Use 1000 byte segments hashed in 300 byte chunks
+        with mock.patch.object(image, 'DOWNLOAD_CHUNK_SIZE', 300):
+            return image._download_image_segments(
+                self.client, self.image, self.path, parallel, 1000,
+                resume=resume,
+            )
+
+    def test_save_parallel(self):
+        arglist = ['--file', self.path, '--parallel', '4', self.image.id]
+        verifylist = [
+            ('file', self.path),
+            ('parallel', 4),
+            ('segment_size', 64),
+            ('resume', False),
+            ('image', self.image.id),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        self.cmd.take_action(parsed_args)
+
+        self.client.get.assert_called_once_with(
+            '/images/%s/file' % self.image.id,
+            headers={'Range': 'bytes=0-%d' % (len(self.data) - 1)},
+            stream=True,
+        )
+        self.client.download_image.assert_not_called()
+        with open(self.path, 'rb') as f:
+            self.assertEqual(self.data, f.read())
+        self.assertFalse(os.path.exists(self.path + '.part'))
+
+    def test_save_parallel_segments(self):
+        self.assertTrue(self._save(3))
+
+        self.assertEqual(
+            ['bytes=0-999', 'bytes=1000-1999', 'bytes=2000-2559'],
+            self._ranges(),
+        )
+        with open(self.path, 'rb') as f:
+            self.assertEqual(self.data, f.read())
+
+    def test_save_parallel_resume(self):
+        with open(self.path, 'wb') as f:
+            f.write(self.data[:1000] + b'\0' * (len(self.data) - 1000))
+        with open(self.path + '.part', 'w') as f:
+            json.dump({
+                'image_id': self.image.id,
+                'size': len(self.data),
+                'segment_size': 1000,
+                'done': [0],
+            }, f)
+
+        self.assertTrue(self._save(2, resume=True))
+
+        self.assertEqual(
+            ['bytes=1000-1999', 'bytes=2000-2559'],
+            self._ranges(),
+        )
+        with open(self.path, 'rb') as f:
+            self.assertEqual(self.data, f.read())
+        self.assertFalse(os.path.exists(self.path + '.part'))
+
+    def test_save_parallel_checksum_mismatch(self):
+        self.image.hash_value = 'bad'
+
+        self.assertRaises(
+            exceptions.CommandError,
+            self._save, 2,
+        )
+
+    def test_save_parallel_checksum_legacy(self):
+        self.image.hash_algo = None
+        self.image.hash_value = None
+        self.image.checksum = hashlib.md5(self.data).hexdigest()
+
+        self.assertTrue(self._save(2))
+
+    def test_save_parallel_no_range_support(self):
+        self.client.get = mock.Mock(
+            return_value=mock.Mock(status_code=200))
+
+        arglist = ['--file', self.path, '--parallel', '4', self.image.id]
+        parsed_args = self.check_parser(self.cmd, arglist, [])
+
+        self.cmd.take_action(parsed_args)
+
+        self.client.download_image.assert_called_once_with(
+            self.image.id,
+            stream=True,
+            output=self.path)
+
+    def test_save_parallel_wrong_range(self):
+        get = self.client.get.side_effect
+
+        def _get(url, headers, stream):
+            response = get(url, headers, stream)
+            response.headers['Content-Range'] = 'bytes 0-2559/2560'
+            return response
+
+        self.client.get.side_effect = _get
+
+        self.assertFalse(self._save(2))
+        self.assertEqual(1, self.client.get.call_count)
+
+    def test_save_parallel_segment_not_partial(self):
+        get = self.client.get.side_effect
+
+        def _get(url, headers, stream):
+            response = get(url, headers, stream)
+            if headers['Range'] == 'bytes=2000-2559':
+                response.status_code = 200
+            return response
+
+        self.client.get.side_effect = _get
+
+        self.assertRaises(exceptions.CommandError, self._save, 1)
+        with open(self.path + '.part') as f:
+            self.assertEqual([0, 1], json.load(f)['done'])
+
+    def test_save_parallel_without_file(self):
+        arglist = ['--parallel', '4', self.image.id]
+        parsed_args = self.check_parser(self.cmd, arglist, [])
+
+        self.assertRaises(
+            exceptions.CommandError,
+            self.cmd.take_action,
+            parsed_args,
+        )
+
+
+class TestHashingFileWrapper(utils.TestCase):
+
+    data = b'X' * 4096
+
+    def test_read(self):
+        wrapper = image._HashingFileWrapper(
+            io.BytesIO(self.data), ('md5', 'sha256'))
+
+        while wrapper.read(1000):
+            pass
+
+        self.assertEqual(
+            hashlib.md5(self.data).hexdigest(), wrapper.hexdigest())
+        self.assertEqual(
+            hashlib.sha256(self.data).hexdigest(),
+            wrapper.hexdigest('sha256'))
+
+    def test_readinto(self):
+        wrapper = image._HashingFileWrapper(io.BytesIO(self.data))
+        buffer = bytearray(1000)
+
+        while wrapper.readinto(buffer):
+            pass
+
+        self.assertEqual(
+            hashlib.md5(self.data).hexdigest(), wrapper.hexdigest())
+
+    def test_incomplete(self):
+        wrapper = image._HashingFileWrapper(io.BytesIO(self.data))
+
+        wrapper.read(1000)
+
+        self.assertIsNone(wrapper.hexdigest())
+
+    def test_seek(self):
+        wrapper = image._HashingFileWrapper(io.BytesIO(self.data))
+
+        wrapper.read(1000)
+        wrapper.seek(0)
+        wrapper.read()
+        wrapper.read()
+
+        self.assertEqual(
+            hashlib.md5(self.data).hexdigest(), wrapper.hexdigest())
+
+    def test_seek_invalid(self):
+        wrapper = image._HashingFileWrapper(io.BytesIO(self.data))
+
+        wrapper.read(1000)
+        wrapper.seek(10)
+        wrapper.read()
+
+        self.assertIsNone(wrapper.hexdigest())
+
+    def test_seek_complete(self):
+        wrapper = image._HashingFileWrapper(io.BytesIO(self.data))
+
+        wrapper.read()
+        wrapper.read()
+        wrapper.seek(0)
+        wrapper.read(1000)
+        wrapper.seek(10)
+
+        self.assertEqual(
+            hashlib.md5(self.data).hexdigest(), wrapper.hexdigest())
+
+
 class TestImageGetData(TestImage):
 
     def setUp(self):
@@ -15,6 +15,9 @@ import argparse
 from unittest import mock
 
 import openstack
+from openstack.network.v2 import network as network_resource
+from openstack.network.v2 import port as port_resource
+from openstack.network.v2 import security_group as security_group_resource
 from osc_lib import exceptions
 
 from openstackclient.network import common
@@ -326,3 +329,42 @@ class TestNeutronCommandWithExtraArgs(utils.TestCommand):
         self.network.test_create_action.assert_called_with(
             known_attribute='known-value',
             extra_name={'n1': 'v1', 'n2': 'v2'})
+
+
+class TestGetListFields(utils.TestCase):
+
+    column_headers = ('ID', 'Name', 'Security Groups')
+    columns = ('id', 'name', 'security_group_ids')
+
+    def test_get_list_fields(self):
+        parsed_args = argparse.Namespace(columns=[])
+
+        self.assertEqual(
+            {'fields': ('id', 'name', 'security_groups')},
+            common.get_list_fields(
+                port_resource.Port, self.column_headers, self.columns,
+                parsed_args))
+
+    def test_get_list_fields_selected_columns(self):
+        parsed_args = argparse.Namespace(columns=['Security Groups'])
+
+        self.assertEqual(
+            {'fields': ('security_groups', 'id')},
+            common.get_list_fields(
+                port_resource.Port, self.column_headers, self.columns,
+                parsed_args, required=('id',)))
+
+    def test_get_fields_query_security_group(self):
+        self.assertEqual(
+            {'fields': ('id', 'name')},
+            common.get_fields_query(
+                security_group_resource.SecurityGroup, ('id', 'name')))
+
+    def test_get_list_fields_not_supported(self):
+        parsed_args = argparse.Namespace(columns=['ID'])
+
+        self.assertEqual(
+            {},
+            common.get_list_fields(
+                network_resource.Network, self.column_headers, self.columns,
+                parsed_args))
@@ -633,6 +633,108 @@ class TestListFloatingIPNetwork(TestFloatingIPNetwork):
         self.assertEqual(self.data, list(data))
 
 
+class TestListFloatingIPNetworkResolve(TestFloatingIPNetwork):
+
+    fip_with_details = network_fakes.FakeFloatingIP.create_one_floating_ip({
+        'port_id': 'port-id-1',
+        'port_details': {
+            'device_id': 'server-id-1',
+            'device_owner': 'compute:nova',
+        },
+    })
+    fip_without_details = \
+        network_fakes.FakeFloatingIP.create_one_floating_ip({
+            'port_id': 'port-id-2',
+            'port_details': None,
+        })
+    fip_router = network_fakes.FakeFloatingIP.create_one_floating_ip({
+        'port_id': 'port-id-3',
+        'port_details': None,
+    })
+    fip_unbound = network_fakes.FakeFloatingIP.create_one_floating_ip({
+        'port_id': None,
+        'port_details': None,
+    })
+    floating_ips = [
+        fip_with_details,
+        fip_without_details,
+        fip_router,
+        fip_unbound,
+    ]
+
+    columns = (
+        'ID',
+        'Floating IP Address',
+        'Fixed IP Address',
+        'Port',
+        'Floating Network',
+        'Project',
+        'Server ID',
+        'Server Name',
+    )
+
+    def setUp(self):
+        super(TestListFloatingIPNetworkResolve, self).setUp()
+
+        self.network.ips = mock.Mock(return_value=self.floating_ips)
+        self.network.ports = mock.Mock(return_value=[
+            network_fakes.FakePort.create_one_port({
+                'id': 'port-id-2',
+                'device_id': 'server-id-2',
+                'device_owner': 'compute:az1',
+            }),
+            network_fakes.FakePort.create_one_port({
+                'id': 'port-id-3',
+                'device_id': 'router-id',
+                'device_owner': 'network:router_interface',
+            }),
+        ])
+
+        self.app.client_manager.compute = mock.Mock()
+        self.servers_mock = self.app.client_manager.compute.servers
+        self.servers_mock.get.side_effect = self._get_server
+
+        # Get the command object to test
+        self.cmd = fip.ListFloatingIP(self.app, self.namespace)
+
+    def _get_server(self, server_id):
+        if server_id == 'server-id-2':
+            raise exceptions.NotFound(404)
+        server = mock.Mock(id=server_id)
+        server.name = 'server-name-1'
+        return server
+
+    def test_floating_ip_list_resolve(self):
+        arglist = [
+            '--resolve',
+        ]
+        verifylist = [
+            ('resolve', True),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.network.ips.assert_called_once_with()
+        self.network.ports.assert_called_once_with(
+            id=['port-id-2', 'port-id-3'],
+            fields=('id', 'device_id', 'device_owner'))
+        self.servers_mock.get.assert_has_calls(
+            [call('server-id-1'), call('server-id-2')], any_order=True)
+        self.assertEqual(2, self.servers_mock.get.call_count)
+        self.assertEqual(self.columns, columns)
+        self.assertEqual([
+            (ip.id, ip.floating_ip_address, ip.fixed_ip_address,
+             ip.port_id, ip.floating_network_id, ip.project_id) + resolved
+            for ip, resolved in zip(self.floating_ips, [
+                ('server-id-1', 'server-name-1'),
+                ('server-id-2', ''),
+                ('', ''),
+                ('', ''),
+            ])
+        ], list(data))
+
+
 class TestShowFloatingIPNetwork(TestFloatingIPNetwork):
 
     # The floating ip to display.
@@ -16,6 +16,7 @@ from unittest import mock
 from osc_lib.cli import format_columns
 
 from openstackclient.network.v2 import ip_availability
+from openstackclient.network.v2 import subnet as subnet_v2
 from openstackclient.tests.unit.identity.v3 import fakes as identity_fakes
 from openstackclient.tests.unit.network.v2 import fakes as network_fakes
 from openstackclient.tests.unit import utils as tests_utils
@@ -113,6 +114,137 @@ class TestListIPAvailability(TestIPAvailability):
         self.assertEqual(self.columns, columns)
         self.assertCountEqual(self.data, list(data))
 
+    def test_list_threshold(self):
+        arglist = [
+            '--threshold', '2.5',
+        ]
+        verifylist = [
+            ('threshold', 2.5),
+        ]
+
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.assertEqual(
+            self.columns + ('Utilization (%)', 'Above Threshold'), columns)
+        self.assertCountEqual(
+            [row + (2.4, False) for row in self.data], list(data))
+
+
+class TestListIPAvailabilityDetail(TestIPAvailability):
+
+    _subnet = network_fakes.FakeSubnet.create_one_subnet(
+        attrs={'allocation_pools': [
+            {'start': '10.0.0.2', 'end': '10.0.0.101'},
+        ]})
+    _ip_availability = network_fakes.create_one_ip_availability(attrs={
+        'total_ips': 100,
+        'used_ips': 95,
+        'subnet_ip_availability': [
+            {
+                'subnet_id': _subnet.id,
+                'subnet_name': _subnet.name,
+                'cidr': '10.0.0.0/24',
+                'ip_version': 4,
+                'total_ips': 100,
+                'used_ips': 95,
+            },
+            {
+                'subnet_id': 'subnet-id-without-pools',
+                'subnet_name': 'subnet-without-pools',
+                'cidr': '10.0.1.0/24',
+                'ip_version': 4,
+                'total_ips': 0,
+                'used_ips': 0,
+            },
+        ],
+    })
+    columns = (
+        'Network ID',
+        'Network Name',
+        'Subnet ID',
+        'Subnet Name',
+        'CIDR',
+        'Allocation Pools',
+        'Total IPs',
+        'Used IPs',
+        'Utilization (%)',
+    )
+    data = [
+        (
+            _ip_availability.network_id,
+            _ip_availability.network_name,
+            _subnet.id,
+            _subnet.name,
+            '10.0.0.0/24',
+            subnet_v2.AllocationPoolsColumn(_subnet.allocation_pools),
+            100,
+            95,
+            95.0,
+        ),
+        (
+            _ip_availability.network_id,
+            _ip_availability.network_name,
+            'subnet-id-without-pools',
+            'subnet-without-pools',
+            '10.0.1.0/24',
+            subnet_v2.AllocationPoolsColumn([]),
+            0,
+            0,
+            100.0,
+        ),
+    ]
+
+    def setUp(self):
+        super(TestListIPAvailabilityDetail, self).setUp()
+
+        self.cmd = ip_availability.ListIPAvailability(
+            self.app, self.namespace)
+        self.network.network_ip_availabilities = mock.Mock(
+            return_value=[self._ip_availability])
+        self.network.subnets = mock.Mock(return_value=[self._subnet])
+
+    def test_list_detail(self):
+        arglist = [
+            '--detail',
+            '--project', self.project.name,
+        ]
+        verifylist = [
+            ('detail', True),
+            ('project', self.project.name),
+        ]
+
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        columns, data = self.cmd.take_action(parsed_args)
+        filters = {'project_id': self.project.id,
+                   'ip_version': 4}
+
+        self.network.network_ip_availabilities.assert_called_once_with(
+            **filters)
+        self.assertEqual(self.columns, columns)
+        self.assertEqual(self.data, list(data))
+        self.network.subnets.assert_called_once_with(**filters)
+
+    def test_list_detail_threshold(self):
+        arglist = [
+            '--detail',
+            '--threshold', '95',
+        ]
+        verifylist = [
+            ('detail', True),
+            ('threshold', 95.0),
+        ]
+
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.assertEqual(self.columns + ('Above Threshold',), columns)
+        self.assertEqual(
+            [row + (True,) for row in self.data], list(data))
+
 
 class TestShowIPAvailability(TestIPAvailability):
 
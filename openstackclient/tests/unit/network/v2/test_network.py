@@ -11,10 +11,12 @@
 #   under the License.
 #
 
+import os
 import random
 from unittest import mock
 from unittest.mock import call
 
+import fixtures
 from osc_lib.cli import format_columns
 from osc_lib import exceptions
 
@@ -426,6 +428,59 @@ class TestCreateNetworkIdentityV2(TestNetwork):
         )
 
 
+class TestCreateNetworkBulk(TestNetwork):
+
+    def setUp(self):
+        super(TestCreateNetworkBulk, self).setUp()
+
+        self._networks = network_fakes.create_networks(count=2)
+        self.network.set_tags = mock.Mock(return_value=None)
+        self.qos_policy = \
+            network_fakes.FakeNetworkQosPolicy.create_one_qos_policy()
+        self.network.find_qos_policy = mock.Mock(
+            return_value=self.qos_policy)
+
+        self.path = os.path.join(
+            self.useFixture(fixtures.TempDir()).path, 'networks')
+        with open(self.path, 'w') as f:
+            f.write(
+                '--qos-policy qos net1\n'
+                '--qos-policy qos --tag red --disable net2\n'
+            )
+
+        self.cmd = network.CreateNetworkBulk(self.app, self.namespace)
+
+    def test_bulk_create(self):
+        parsed_args = self.check_parser(self.cmd, [self.path], [])
+
+        with mock.patch.object(
+                network.network_resource.Network, 'bulk_create',
+                return_value=iter(self._networks)) as bulk_create:
+            columns, data = self.cmd.take_action(parsed_args)
+
+        self.network.find_qos_policy.assert_called_once_with(
+            'qos', ignore_missing=False)
+        bulk_create.assert_called_once_with(self.network, [
+            {
+                'admin_state_up': True,
+                'name': 'net1',
+                'qos_policy_id': self.qos_policy.id,
+            },
+            {
+                'admin_state_up': False,
+                'name': 'net2',
+                'qos_policy_id': self.qos_policy.id,
+            },
+        ])
+        self.network.set_tags.assert_called_once_with(
+            self._networks[1], ['red'])
+        self.assertEqual(('Line', 'ID', 'Name', 'Result'), columns)
+        self.assertEqual([
+            (1, self._networks[0].id, 'net1', 'created'),
+            (2, self._networks[1].id, 'net2', 'created'),
+        ], data)
+
+
 class TestDeleteNetwork(TestNetwork):
 
     def setUp(self):
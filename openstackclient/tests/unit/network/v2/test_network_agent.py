@@ -344,6 +344,78 @@ class TestListNetworkAgent(TestNetworkAgent):
         self.assertCountEqual(router_agent_data, list(data))
 
 
+class TestListNetworkAgentWithResources(TestNetworkAgent):
+
+    l3_agents = network_fakes.FakeNetworkAgent.create_network_agents(
+        attrs={'agent_type': 'L3 agent'}, count=2)
+    dhcp_agent = network_fakes.FakeNetworkAgent.create_one_network_agent(
+        attrs={'agent_type': 'DHCP agent'})
+    ovs_agent = network_fakes.FakeNetworkAgent.create_one_network_agent(
+        attrs={'agent_type': 'Open vSwitch agent'})
+    network_agents = l3_agents + [dhcp_agent, ovs_agent]
+
+    columns = (
+        'ID',
+        'Agent Type',
+        'Host',
+        'Availability Zone',
+        'Alive',
+        'State',
+        'Binary',
+        'Hosted Resources',
+        'Deviation (%)',
+    )
+
+    def setUp(self):
+        super(TestListNetworkAgentWithResources, self).setUp()
+        self.network.agents = mock.Mock(return_value=self.network_agents)
+        routers = {
+            self.l3_agents[0].id: [mock.Mock()] * 3,
+            self.l3_agents[1].id: [mock.Mock()],
+        }
+        self.network.agent_hosted_routers = mock.Mock(
+            side_effect=lambda agent: routers[agent.id])
+        self.network.dhcp_agent_hosting_networks = mock.Mock(
+            return_value=[mock.Mock(), mock.Mock()])
+
+        # Get the command object to test
+        self.cmd = network_agent.ListNetworkAgent(self.app, self.namespace)
+
+    def test_network_agents_list_with_resources(self):
+        arglist = [
+            '--with-resources',
+        ]
+        verifylist = [
+            ('with_resources', True),
+        ]
+
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.network.agents.assert_called_once_with(**{})
+        self.network.agent_hosted_routers.assert_has_calls(
+            [call(agent) for agent in self.l3_agents], any_order=True)
+        self.network.dhcp_agent_hosting_networks.assert_called_once_with(
+            self.dhcp_agent)
+        self.assertEqual(self.columns, columns)
+        self.assertEqual(
+            [(3, 50), (1, -50), (2, 0), ('', '')],
+            [row[-2:] for row in data])
+
+    def test_network_agents_list_with_resources_and_network(self):
+        arglist = [
+            '--with-resources',
+            '--network', 'net',
+        ]
+        verifylist = [
+            ('with_resources', True),
+            ('network', 'net'),
+        ]
+
+        self.assertRaises(tests_utils.ParserException, self.check_parser,
+                          self.cmd, arglist, verifylist)
+
+
 class TestRemoveNetworkFromAgent(TestNetworkAgent):
 
     net = network_fakes.create_one_network()
@@ -0,0 +1,172 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+import os
+from unittest import mock
+
+import fixtures
+
+from openstackclient.network.v2 import network_topology
+from openstackclient.tests.unit import fakes
+from openstackclient.tests.unit.network.v2 import fakes as network_fakes
+
+
+def _fake(**attrs):
+    return fakes.FakeResource(info=attrs, loaded=True)
+
+
+class TestShowNetworkTopology(network_fakes.TestNetworkV2):
+
+    columns = (
+        'Source Type',
+        'Source ID',
+        'Source Name',
+        'Relation',
+        'Target Type',
+        'Target ID',
+        'Target Name',
+    )
+
+    def setUp(self):
+        super(TestShowNetworkTopology, self).setUp()
+        self.network = self.app.client_manager.network
+
+        self.network.routers = mock.Mock(return_value=[
+            _fake(id='r1', name='router1',
+                  external_gateway_info={'network_id': 'ext'}),
+        ])
+        self.network.networks = mock.Mock(return_value=[
+            _fake(id='ext', name='public'),
+            _fake(id='n1', name='private'),
+        ])
+        self.network.subnets = mock.Mock(return_value=[
+            _fake(id='s1', name='private-subnet', network_id='n1'),
+        ])
+        self.network.ports = mock.Mock(return_value=[
+            _fake(id='p1', name='', network_id='n1', device_id='r1',
+                  device_owner='network:router_interface',
+                  fixed_ips=[{'subnet_id': 's1', 'ip_address': '10.0.0.1'}]),
+            _fake(id='p2', name='gw', network_id='ext', device_id='r1',
+                  device_owner='network:router_gateway', fixed_ips=[]),
+            _fake(id='p3', name='vm', network_id='n1', device_id='vm1',
+                  device_owner='compute:nova',
+                  fixed_ips=[{'subnet_id': 's1', 'ip_address': '10.0.0.5'}]),
+        ])
+        self.network.ips = mock.Mock(return_value=[
+            _fake(id='f1', name='172.24.4.10', port_id='p3'),
+            _fake(id='f2', name='172.24.4.11', port_id=None),
+        ])
+
+        self.cmd = network_topology.ShowNetworkTopology(
+            self.app, self.namespace)
+
+    def test_topology_show(self):
+        parsed_args = self.check_parser(self.cmd, [], [])
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.assertEqual(self.columns, columns)
+        self.assertEqual([
+            ('router', 'r1', 'router1', 'gateway',
+             'network', 'ext', 'public'),
+            ('router', 'r1', 'router1', 'interface', 'port', 'p1', ''),
+            ('port', 'p1', '', 'fixed ip',
+             'subnet', 's1', 'private-subnet'),
+            ('port', 'p2', 'gw', 'network', 'network', 'ext', 'public'),
+            ('port', 'p3', 'vm', 'fixed ip',
+             'subnet', 's1', 'private-subnet'),
+            ('subnet', 's1', 'private-subnet', 'network',
+             'network', 'n1', 'private'),
+            ('port', 'p3', 'vm', 'floating ip',
+             'floating ip', 'f1', '172.24.4.10'),
+        ], list(data))
+
+        self.network.routers.assert_called_once_with()
+        self.network.networks.assert_called_once_with()
+        self.network.subnets.assert_called_once_with()
+        self.network.ips.assert_called_once_with()
+        self.network.ports.assert_called_once_with(
+            fields=('id', 'name', 'network_id', 'device_id',
+                    'device_owner', 'fixed_ips'))
+
+    def test_topology_show_router_interface_owners(self):
+        self.network.ports.return_value = [
+            _fake(id='p1', name='', network_id='n1', device_id='r1',
+                  device_owner='network:router_interface_distributed',
+                  fixed_ips=[]),
+            _fake(id='p2', name='', network_id='n1', device_id='r1',
+                  device_owner='network:ha_router_replicated_interface',
+                  fixed_ips=[]),
+            _fake(id='p3', name='', network_id='n1', device_id='r1',
+                  device_owner='network:router_ha_interface',
+                  fixed_ips=[]),
+            _fake(id='p4', name='', network_id='n1', device_id='r1',
+                  device_owner='network:router_centralized_snat',
+                  fixed_ips=[]),
+        ]
+
+        parsed_args = self.check_parser(self.cmd, [], [])
+        columns, data = self.cmd.take_action(parsed_args)
+
+        interfaces = [row[5] for row in data if row[3] == 'interface']
+        self.assertEqual(['p1', 'p2'], interfaces)
+
+    @mock.patch(
+        'openstackclient.identity.common.find_project',
+        return_value=mock.Mock(id='project-id'),
+    )
+    def test_topology_show_project(self, find_project):
+        arglist = [
+            '--project', 'demo',
+            '--project-domain', 'default',
+        ]
+        verifylist = [
+            ('project', 'demo'),
+            ('project_domain', 'default'),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+        self.cmd.take_action(parsed_args)
+
+        find_project.assert_called_once_with(
+            self.app.client_manager.identity, 'demo', 'default')
+        self.network.routers.assert_called_once_with(project_id='project-id')
+        self.network.networks.assert_called_once_with(
+            project_id='project-id')
+        self.network.subnets.assert_called_once_with(project_id='project-id')
+        self.network.ips.assert_called_once_with(project_id='project-id')
+        self.network.ports.assert_called_once_with(
+            project_id='project-id',
+            fields=('id', 'name', 'network_id', 'device_id',
+                    'device_owner', 'fixed_ips'))
+
+    def test_topology_show_dot_file(self):
+        dot_file = os.path.join(
+            self.useFixture(fixtures.TempDir()).path, 'topology.dot')
+        arglist = [
+            '--dot-file', dot_file,
+        ]
+        verifylist = [
+            ('dot_file', dot_file),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+        columns, data = self.cmd.take_action(parsed_args)
+
+        with open(dot_file) as f:
+            dot = f.read()
+        self.assertTrue(dot.startswith('digraph topology {\n'))
+        self.assertTrue(dot.endswith('}\n'))
+        self.assertIn('"router:r1" [label="router\\nrouter1"];', dot)
+        self.assertIn('"port:p1" [label="port\\np1"];', dot)
+        self.assertIn(
+            '"router:r1" -> "network:ext" [label="gateway"];', dot)
+        self.assertIn(
+            '"port:p3" -> "floating ip:f1" [label="floating ip"];', dot)
@@ -12,9 +12,11 @@
 #
 
 import argparse
+import os
 from unittest import mock
 from unittest.mock import call
 
+import fixtures
 from osc_lib.cli import format_columns
 from osc_lib import exceptions
 from osc_lib import utils
@@ -27,7 +29,7 @@ from openstackclient.tests.unit import utils as tests_utils
 
 
 LIST_FIELDS_TO_RETRIEVE = ('id', 'name', 'mac_address', 'fixed_ips', 'status')
-LIST_FIELDS_TO_RETRIEVE_LONG = ('security_group_ids', 'device_owner', 'tags')
+LIST_FIELDS_TO_RETRIEVE_LONG = ('security_groups', 'device_owner', 'tags')
 
 
 class TestPort(network_fakes.TestNetworkV2):
@@ -767,6 +769,123 @@ class TestCreatePort(TestPort):
         self.assertCountEqual(self.data, data)
 
 
+class TestCreatePortBulk(TestPort):
+
+    def setUp(self):
+        super(TestCreatePortBulk, self).setUp()
+
+        self.ports = network_fakes.FakePort.create_ports(count=3)
+        self.network.create_ports = mock.Mock(
+            side_effect=[self.ports[:2], self.ports[2:]])
+        self.network.set_tags = mock.Mock(return_value=None)
+        self.fake_net = network_fakes.create_one_network()
+        self.network.find_network = mock.Mock(return_value=self.fake_net)
+        self.network.find_extension = mock.Mock(return_value=[])
+        self.project = identity_fakes.FakeProject.create_one_project()
+        self.projects_mock.get.return_value = self.project
+
+        self.temp_dir = self.useFixture(fixtures.TempDir()).path
+        self.cmd = port.CreatePortBulk(self.app, self.namespace)
+
+    def _write_file(self, content):
+        path = os.path.join(self.temp_dir, 'ports')
+        with open(path, 'w') as f:
+            f.write(content)
+        return path
+
+    def test_bulk_create(self):
+        path = self._write_file(
+            '# ports of the test network\n'
+            '--network net port1\n'
+            '\n'
+            '--network net --project %s port2\n'
+            '--network net --project %s "port 3"\n' % (
+                self.project.name, self.project.name)
+        )
+        arglist = [path, '--chunk-size', '2']
+        verifylist = [
+            ('file', path),
+            ('chunk_size', 2),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.network.find_network.assert_called_once_with(
+            'net', ignore_missing=False)
+        self.network.find_extension.assert_called_once_with(
+            'tag-ports-during-bulk-creation')
+        self.projects_mock.get.assert_called_once_with(self.project.name)
+        self.network.create_ports.assert_has_calls([
+            call([
+                {
+                    'admin_state_up': True,
+                    'network_id': self.fake_net.id,
+                    'name': 'port1',
+                },
+                {
+                    'admin_state_up': True,
+                    'network_id': self.fake_net.id,
+                    'name': 'port2',
+                    'project_id': self.project.id,
+                },
+            ]),
+            call([
+                {
+                    'admin_state_up': True,
+                    'network_id': self.fake_net.id,
+                    'name': 'port 3',
+                    'project_id': self.project.id,
+                },
+            ]),
+        ])
+        self.assertEqual(('Line', 'ID', 'Name', 'Result'), columns)
+        self.assertEqual([
+            (2, self.ports[0].id, 'port1', 'created'),
+            (4, self.ports[1].id, 'port2', 'created'),
+            (5, self.ports[2].id, 'port 3', 'created'),
+        ], data)
+
+    def test_bulk_create_invalid_line(self):
+        path = self._write_file(
+            '--network net port1\n'
+            '--network unknown port2\n'
+        )
+        self.network.find_network.side_effect = [
+            self.fake_net, exceptions.CommandError('not found')]
+        parsed_args = self.check_parser(self.cmd, [path], [])
+
+        self.assertRaises(
+            exceptions.CommandError, self.cmd.take_action, parsed_args)
+        self.network.create_ports.assert_not_called()
+
+    def test_bulk_create_chunk_failure(self):
+        path = self._write_file(
+            '--network net port1\n'
+            '--network net port2\n'
+            '--network net port3\n'
+        )
+        self.network.create_ports.side_effect = [
+            exceptions.CommandError('conflict'), self.ports[2:]]
+        parsed_args = self.check_parser(
+            self.cmd, [path, '--chunk-size', '2'], [])
+
+        with mock.patch.object(self.cmd, 'produce_output') as output:
+            self.assertRaises(
+                exceptions.CommandError, self.cmd.take_action, parsed_args)
+
+        self.assertEqual(2, self.network.create_ports.call_count)
+        output.assert_called_once_with(
+            parsed_args,
+            ('Line', 'ID', 'Name', 'Result'),
+            [
+                (1, None, 'port1', 'failed'),
+                (2, None, 'port2', 'failed'),
+                (3, self.ports[2].id, 'port3', 'created'),
+            ],
+        )
+
+
 class TestDeletePort(TestPort):
 
     # Ports to delete.
@@ -778,6 +897,7 @@ class TestDeletePort(TestPort):
         self.network.delete_port = mock.Mock(return_value=None)
         self.network.find_port = network_fakes.FakePort.get_ports(
             ports=self._ports)
+        self.network.ports = mock.Mock(return_value=[])
         # Get the command object to test
         self.cmd = port.DeletePort(self.app, self.namespace)
 
@@ -812,7 +932,27 @@ class TestDeletePort(TestPort):
         calls = []
         for p in self._ports:
             calls.append(call(p))
-        self.network.delete_port.assert_has_calls(calls)
+        self.network.delete_port.assert_has_calls(calls, any_order=True)
+        self.assertIsNone(result)
+
+    def test_multi_ports_delete_prefetched(self):
+        arglist = [
+            self._ports[0].id,
+            self._ports[1].name,
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, [])
+        self.network.ports.side_effect = [
+            self._ports[:1], self._ports[1:]]
+
+        result = self.cmd.take_action(parsed_args)
+
+        self.network.ports.assert_has_calls([
+            call(id=[self._ports[0].id, self._ports[1].name]),
+            call(name=[self._ports[1].name]),
+        ])
+        self.network.find_port.assert_not_called()
+        self.network.delete_port.assert_has_calls(
+            [call(p) for p in self._ports], any_order=True)
         self.assertIsNone(result)
 
     def test_multi_ports_delete_with_exception(self):
@@ -826,7 +966,12 @@ class TestDeletePort(TestPort):
         ]
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
 
-        find_mock_result = [self._ports[0], exceptions.CommandError]
+        # Ports are deleted concurrently, so map results to names rather
+        # than to the order of the calls.
+        def find_mock_result(name, ignore_missing):
+            if name == 'unexist_port':
+                raise exceptions.CommandError
+            return self._ports[0]
         self.network.find_port = (
             mock.Mock(side_effect=find_mock_result)
         )
@@ -921,6 +1066,24 @@ class TestListPort(TestPort):
         self.assertEqual(self.columns, columns)
         self.assertCountEqual(self.data, list(data))
 
+    def test_port_list_selected_columns(self):
+        arglist = [
+            '--long',
+            '-c', 'ID',
+            '-c', 'Security Groups',
+        ]
+        verifylist = [
+            ('long', True),
+            ('columns', ['ID', 'Security Groups']),
+        ]
+
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        self.cmd.take_action(parsed_args)
+
+        self.network.ports.assert_called_once_with(
+            fields=('id', 'security_groups'))
+
     def test_port_list_router_opt(self):
         arglist = [
             '--router', 'fake-router-name',
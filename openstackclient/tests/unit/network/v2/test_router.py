@@ -749,6 +749,7 @@ class TestRemovePortFromRouter(TestRouter):
         self.cmd = router.RemovePortFromRouter(self.app, self.namespace)
         self.network.find_router = mock.Mock(return_value=self._router)
         self.network.find_port = mock.Mock(return_value=self._port)
+        self.network.ports = mock.Mock(return_value=[])
 
     def test_remove_port_no_option(self):
         arglist = []
@@ -764,7 +765,7 @@ class TestRemovePortFromRouter(TestRouter):
         ]
         verifylist = [
             ('router', self._router.id),
-            ('port', self._router.port),
+            ('port', [self._router.port]),
         ]
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
 
@@ -774,6 +775,64 @@ class TestRemovePortFromRouter(TestRouter):
             self._router, **{'port_id': self._router.port})
         self.assertIsNone(result)
 
+    def test_remove_multiple_ports(self):
+        ports = network_fakes.FakePort.create_ports(count=3)
+        self.network.ports.side_effect = [ports[:1], ports[1:]]
+        arglist = [
+            self._router.id,
+            ports[0].id,
+            ports[1].name,
+            ports[2].name,
+        ]
+        verifylist = [
+            ('router', self._router.id),
+            ('port', [ports[0].id, ports[1].name, ports[2].name]),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        result = self.cmd.take_action(parsed_args)
+
+        self.network.find_router.assert_called_once_with(
+            self._router.id, ignore_missing=False)
+        self.network.ports.assert_has_calls([
+            call(id=[ports[0].id, ports[1].name, ports[2].name]),
+            call(name=[ports[1].name, ports[2].name]),
+        ])
+        self.network.find_port.assert_not_called()
+        self.network.remove_interface_from_router.assert_has_calls([
+            call(self._router, port_id=port.id) for port in ports
+        ], any_order=True)
+        self.assertIsNone(result)
+
+    def test_remove_multiple_ports_with_exception(self):
+        self.network.find_port.side_effect = [
+            self._port, exceptions.CommandError('not found')]
+        arglist = [
+            self._router.id,
+            self._port.name,
+            'unexist_port',
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, [])
+
+        with mock.patch.object(router.concurrency, 'run_concurrently',
+                               side_effect=self._run_serially):
+            e = self.assertRaises(exceptions.CommandError,
+                                  self.cmd.take_action, parsed_args)
+
+        self.assertEqual('1 of 2 ports failed to remove.', str(e))
+        self.network.remove_interface_from_router.assert_called_once_with(
+            self._router, port_id=self._port.id)
+
+    @staticmethod
+    def _run_serially(func, items):
+        results = []
+        for item in items:
+            try:
+                results.append((item, func(item), None))
+            except Exception as e:
+                results.append((item, None, e))
+        return results
+
 
 class TestRemoveSubnetFromRouter(TestRouter):
     '''Remove subnet from Router '''
@@ -788,6 +847,7 @@ class TestRemoveSubnetFromRouter(TestRouter):
         self.cmd = router.RemoveSubnetFromRouter(self.app, self.namespace)
         self.network.find_router = mock.Mock(return_value=self._router)
         self.network.find_subnet = mock.Mock(return_value=self._subnet)
+        self.network.subnets = mock.Mock(return_value=[])
 
     def test_remove_subnet_no_option(self):
         arglist = []
@@ -802,7 +862,7 @@ class TestRemoveSubnetFromRouter(TestRouter):
             self._router.subnet,
         ]
         verifylist = [
-            ('subnet', self._router.subnet),
+            ('subnet', [self._router.subnet]),
             ('router', self._router.id),
         ]
         parsed_args = self.check_parser(self.cmd, arglist, verifylist)
@@ -812,6 +872,30 @@ class TestRemoveSubnetFromRouter(TestRouter):
             self._router, **{'subnet_id': self._router.subnet})
         self.assertIsNone(result)
 
+    def test_remove_multiple_subnets(self):
+        subnets = network_fakes.FakeSubnet.create_subnets(count=2)
+        self.network.subnets.return_value = subnets
+        arglist = [
+            self._router.id,
+            subnets[0].name,
+            subnets[1].name,
+        ]
+        verifylist = [
+            ('subnet', [subnets[0].name, subnets[1].name]),
+            ('router', self._router.id),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        result = self.cmd.take_action(parsed_args)
+
+        self.network.subnets.assert_called_once_with(
+            name=[subnets[0].name, subnets[1].name])
+        self.network.find_subnet.assert_not_called()
+        self.network.remove_interface_from_router.assert_has_calls([
+            call(self._router, subnet_id=subnet.id) for subnet in subnets
+        ], any_order=True)
+        self.assertIsNone(result)
+
 
 class TestAddExtraRoutesToRouter(TestRouter):
 
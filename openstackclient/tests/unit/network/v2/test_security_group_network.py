@@ -11,9 +11,11 @@
 #   under the License.
 #
 
+import os
 from unittest import mock
 from unittest.mock import call
 
+import fixtures
 from osc_lib import exceptions
 
 from openstackclient.network.v2 import security_group
@@ -35,6 +37,114 @@ class TestSecurityGroupNetwork(network_fakes.TestNetworkV2):
         self.domains_mock = self.app.client_manager.identity.domains
 
 
+class TestApplySecurityGroupNetwork(TestSecurityGroupNetwork):
+
+    _security_group = (
+        network_fakes.FakeSecurityGroup.create_one_security_group())
+
+    def setUp(self):
+        super(TestApplySecurityGroupNetwork, self).setUp()
+
+        sg_id = self._security_group.id
+        rule_factory = network_fakes.FakeSecurityGroupRule
+        # Rule kept as is, neutron does not store the default IP range.
+        self.ssh_rule = rule_factory.create_one_security_group_rule({
+            'security_group_id': sg_id,
+            'protocol': 'tcp',
+            'port_range_min': 22,
+            'port_range_max': 22,
+            'remote_ip_prefix': None,
+        })
+        # Rule missing from the file, to be deleted.
+        self.egress_rule = rule_factory.create_one_security_group_rule({
+            'security_group_id': sg_id,
+            'direction': 'egress',
+        })
+        self.new_rule = rule_factory.create_one_security_group_rule({
+            'security_group_id': sg_id,
+        })
+        self.network.find_security_group = mock.Mock(
+            return_value=self._security_group)
+        self.network.security_group_rules = mock.Mock(
+            return_value=[self.ssh_rule, self.egress_rule])
+        self.network.create_security_group_rules = mock.Mock(
+            return_value=[self.new_rule])
+        self.network.delete_security_group_rule = mock.Mock(
+            return_value=None)
+
+        self.path = os.path.join(
+            self.useFixture(fixtures.TempDir()).path, 'rules')
+        with open(self.path, 'w') as f:
+            f.write(
+                '--protocol tcp --dst-port 22 sg\n'
+                '--protocol tcp --dst-port 443 sg\n'
+            )
+
+        self.cmd = security_group.ApplySecurityGroup(
+            self.app, self.namespace)
+
+        self.https_attrs = {
+            'direction': 'ingress',
+            'ethertype': 'IPv4',
+            'port_range_max': 443,
+            'port_range_min': 443,
+            'protocol': 'tcp',
+            'remote_ip_prefix': '0.0.0.0/0',
+            'security_group_id': sg_id,
+        }
+        self.expected_data = [
+            ('create', self.new_rule.id, sg_id, 'ingress', 'IPv4', 'tcp',
+             443, 443, '0.0.0.0/0', '', 'created'),
+            ('delete', self.egress_rule.id, sg_id, 'egress', 'IPv4', None,
+             None, None, '0.0.0.0/0', None, 'deleted'),
+        ]
+
+    def test_apply(self):
+        parsed_args = self.check_parser(self.cmd, [self.path], [])
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.network.find_security_group.assert_called_once_with(
+            'sg', ignore_missing=False)
+        self.network.security_group_rules.assert_called_once_with(
+            security_group_id=self._security_group.id)
+        self.network.create_security_group_rules.assert_called_once_with(
+            [self.https_attrs])
+        self.network.delete_security_group_rule.assert_called_once_with(
+            self.egress_rule)
+        self.assertEqual(
+            ('Action', 'ID', 'Security Group', 'Direction', 'Ethertype',
+             'IP Protocol', 'Port Range Min', 'Port Range Max', 'IP Range',
+             'Remote Security Group', 'Result'),
+            columns)
+        self.assertEqual(self.expected_data, data)
+
+    def test_apply_dry_run(self):
+        parsed_args = self.check_parser(
+            self.cmd, [self.path, '--dry-run'], [('dry_run', True)])
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.network.create_security_group_rules.assert_not_called()
+        self.network.delete_security_group_rule.assert_not_called()
+        self.assertEqual([
+            ('create', None) + self.expected_data[0][2:-1] + ('planned',),
+            self.expected_data[1][:-1] + ('planned',),
+        ], data)
+
+    def test_apply_no_change(self):
+        self.network.security_group_rules.return_value = [self.ssh_rule]
+        with open(self.path, 'w') as f:
+            f.write('--protocol tcp --dst-port 22 sg\n')
+        parsed_args = self.check_parser(self.cmd, [self.path], [])
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.network.create_security_group_rules.assert_not_called()
+        self.network.delete_security_group_rule.assert_not_called()
+        self.assertEqual([], data)
+
+
 class TestCreateSecurityGroupNetwork(TestSecurityGroupNetwork):
 
     project = identity_fakes.FakeProject.create_one_project()
@@ -11,9 +11,11 @@
 #   under the License.
 #
 
+import os
 from unittest import mock
 from unittest.mock import call
 
+import fixtures
 from osc_lib import exceptions
 
 from openstackclient.network.v2 import security_group_rule
@@ -795,6 +797,83 @@ class TestCreateSecurityGroupRuleNetwork(TestSecurityGroupRuleNetwork):
         self.assertEqual(self.expected_data, data)
 
 
+class TestCreateSecurityGroupRuleBulkNetwork(TestSecurityGroupRuleNetwork):
+
+    _security_group = \
+        network_fakes.FakeSecurityGroup.create_one_security_group()
+
+    def setUp(self):
+        super(TestCreateSecurityGroupRuleBulkNetwork, self).setUp()
+
+        self.rules = \
+            network_fakes.FakeSecurityGroupRule.create_security_group_rules(
+                count=3)
+        self.network.create_security_group_rules = mock.Mock(
+            return_value=self.rules)
+        self.network.find_security_group = mock.Mock(
+            return_value=self._security_group)
+
+        self.path = os.path.join(
+            self.useFixture(fixtures.TempDir()).path, 'rules')
+        with open(self.path, 'w') as f:
+            f.write(
+                '--protocol tcp --dst-port 22 sg\n'
+                '--protocol tcp --dst-port 443 --remote-group sg sg\n'
+                '--protocol icmp --ethertype IPv6 --egress sg\n'
+            )
+
+        self.cmd = security_group_rule.CreateSecurityGroupRuleBulk(
+            self.app, self.namespace)
+
+    def test_bulk_create(self):
+        parsed_args = self.check_parser(self.cmd, [self.path], [])
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.network.find_security_group.assert_called_once_with(
+            'sg', ignore_missing=False)
+        self.network.create_security_group_rules.assert_called_once_with([
+            {
+                'direction': 'ingress',
+                'ethertype': 'IPv4',
+                'port_range_max': 22,
+                'port_range_min': 22,
+                'protocol': 'tcp',
+                'remote_ip_prefix': '0.0.0.0/0',
+                'security_group_id': self._security_group.id,
+            },
+            {
+                'direction': 'ingress',
+                'ethertype': 'IPv4',
+                'port_range_max': 443,
+                'port_range_min': 443,
+                'protocol': 'tcp',
+                'remote_group_id': self._security_group.id,
+                'security_group_id': self._security_group.id,
+            },
+            {
+                'direction': 'egress',
+                'ethertype': 'IPv6',
+                'protocol': 'icmp',
+                'remote_ip_prefix': '::/0',
+                'security_group_id': self._security_group.id,
+            },
+        ])
+        self.assertEqual(
+            ('Line', 'ID', 'Security Group', 'Direction', 'Ethertype',
+             'IP Protocol', 'Port Range Min', 'Port Range Max', 'IP Range',
+             'Result'),
+            columns)
+        self.assertEqual([
+            (1, self.rules[0].id, self._security_group.id, 'ingress',
+             'IPv4', 'tcp', 22, 22, '0.0.0.0/0', 'created'),
+            (2, self.rules[1].id, self._security_group.id, 'ingress',
+             'IPv4', 'tcp', 443, 443, '', 'created'),
+            (3, self.rules[2].id, self._security_group.id, 'egress',
+             'IPv6', 'icmp', '', '', '::/0', 'created'),
+        ], data)
+
+
 class TestDeleteSecurityGroupRuleNetwork(TestSecurityGroupRuleNetwork):
 
     # The security group rules to be deleted.
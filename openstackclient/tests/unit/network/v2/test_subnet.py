@@ -11,9 +11,11 @@
 #   under the License.
 #
 
+import os
 from unittest import mock
 from unittest.mock import call
 
+import fixtures
 from osc_lib.cli import format_columns
 from osc_lib import exceptions
 
@@ -544,6 +546,59 @@ class TestCreateSubnet(TestSubnet):
         self._test_create_with_tag(add_tags=False)
 
 
+class TestCreateSubnetBulk(TestSubnet):
+
+    def setUp(self):
+        super(TestCreateSubnetBulk, self).setUp()
+
+        self._subnets = network_fakes.FakeSubnet.create_subnets(count=2)
+        self._network = network_fakes.create_one_network()
+        self.network.find_network = mock.Mock(return_value=self._network)
+        self.network.set_tags = mock.Mock(return_value=None)
+
+        self.path = os.path.join(
+            self.useFixture(fixtures.TempDir()).path, 'subnets')
+        with open(self.path, 'w') as f:
+            f.write(
+                '--network net --subnet-range 10.0.0.0/24 subnet1\n'
+                '--network net --subnet-range 10.0.1.0/24 --no-dhcp '
+                'subnet2\n'
+            )
+
+        self.cmd = subnet_v2.CreateSubnetBulk(self.app, self.namespace)
+
+    def test_bulk_create(self):
+        parsed_args = self.check_parser(self.cmd, [self.path], [])
+
+        with mock.patch.object(
+                subnet_v2.subnet_resource.Subnet, 'bulk_create',
+                return_value=iter(self._subnets)) as bulk_create:
+            columns, data = self.cmd.take_action(parsed_args)
+
+        self.network.find_network.assert_called_once_with(
+            'net', ignore_missing=False)
+        bulk_create.assert_called_once_with(self.network, [
+            {
+                'cidr': '10.0.0.0/24',
+                'ip_version': 4,
+                'name': 'subnet1',
+                'network_id': self._network.id,
+            },
+            {
+                'cidr': '10.0.1.0/24',
+                'enable_dhcp': False,
+                'ip_version': 4,
+                'name': 'subnet2',
+                'network_id': self._network.id,
+            },
+        ])
+        self.assertEqual(('Line', 'ID', 'Name', 'Result'), columns)
+        self.assertEqual([
+            (1, self._subnets[0].id, 'subnet1', 'created'),
+            (2, self._subnets[1].id, 'subnet2', 'created'),
+        ], data)
+
+
 class TestDeleteSubnet(TestSubnet):
 
     # The subnets to delete.
@@ -0,0 +1,199 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+from unittest import mock
+
+from cinderclient import exceptions as cinder_exceptions
+from osc_lib import exceptions
+
+from openstackclient.tests.unit import utils as test_utils
+from openstackclient.volume import common
+
+
+class TestGetVolumeCache(test_utils.TestCase):
+
+    def setUp(self):
+        super(TestGetVolumeCache, self).setUp()
+        self.volume_client = mock.Mock()
+        self.volumes = {
+            'volume-1': mock.Mock(id='volume-1'),
+            'volume-2': mock.Mock(id='volume-2'),
+        }
+
+        def _get(volume_id):
+            if volume_id not in self.volumes:
+                raise cinder_exceptions.NotFound(404)
+            return self.volumes[volume_id]
+
+        self.volume_client.volumes.get.side_effect = _get
+
+    def test_get_volume_cache(self):
+        volume_cache = common.get_volume_cache(
+            self.volume_client,
+            ['volume-1', None, 'volume-2', 'volume-1', 'deleted-volume'])
+
+        self.assertEqual(self.volumes, volume_cache)
+        self.assertEqual(3, self.volume_client.volumes.get.call_count)
+        self.volume_client.volumes.list.assert_not_called()
+
+    def test_get_volume_cache_empty(self):
+        self.assertEqual(
+            {}, common.get_volume_cache(self.volume_client, [None]))
+        self.volume_client.volumes.get.assert_not_called()
+
+
+class TestListAllPages(test_utils.TestCase):
+
+    def test_list_all_pages(self):
+        resources = [mock.Mock(id='resource-%d' % i) for i in range(5)]
+        pages = {
+            None: resources[:2],
+            'resource-1': resources[2:4],
+            'resource-3': resources[4:],
+        }
+        list_func = mock.Mock(
+            side_effect=lambda marker, limit, **kwargs: pages[marker])
+
+        data = common.list_all_pages(
+            list_func, page_size=2, search_opts={'status': 'available'})
+
+        self.assertEqual(resources, list(data))
+        list_func.assert_has_calls([
+            mock.call(marker=None, limit=2,
+                      search_opts={'status': 'available'}),
+            mock.call(marker='resource-1', limit=2,
+                      search_opts={'status': 'available'}),
+            mock.call(marker='resource-3', limit=2,
+                      search_opts={'status': 'available'}),
+        ])
+        self.assertEqual(3, list_func.call_count)
+
+    def test_list_all_pages_full_last_page(self):
+        resources = [mock.Mock(id='resource-%d' % i) for i in range(2)]
+        list_func = mock.Mock(side_effect=[resources, []])
+
+        data = common.list_all_pages(list_func, marker='start', page_size=2)
+
+        self.assertEqual(resources, list(data))
+        list_func.assert_has_calls([
+            mock.call(marker='start', limit=2),
+            mock.call(marker='resource-1', limit=2),
+        ])
+
+
+class TestGetStatusesById(test_utils.TestCase):
+
+    def test_get_statuses_by_id(self):
+        resources = {
+            'resource-1': mock.Mock(id='resource-1', status='Available'),
+        }
+
+        def _get(resource_id):
+            if resource_id == 'resource-3':
+                raise exceptions.CommandError()
+            if resource_id not in resources:
+                raise cinder_exceptions.NotFound(404)
+            return resources[resource_id]
+
+        statuses = common.get_statuses_by_id(
+            _get, ['resource-1', 'resource-2', 'resource-3'])
+
+        self.assertEqual({
+            'resource-1': 'available',
+            'resource-2': 'deleted',
+        }, statuses)
+
+
+@mock.patch('time.sleep')
+class TestWaitForVolumes(test_utils.TestCase):
+
+    def setUp(self):
+        super(TestWaitForVolumes, self).setUp()
+        self.volume_client = mock.Mock()
+
+    def test_wait_for_volumes(self, mock_sleep):
+        self.volume_client.volumes.list.side_effect = [
+            [mock.Mock(id='volume-1', status='creating'),
+             mock.Mock(id='volume-2', status='error'),
+             mock.Mock(id='volume-3', status='creating')],
+            [mock.Mock(id='volume-1', status='available'),
+             mock.Mock(id='volume-3', status='downloading')],
+            [mock.Mock(id='volume-3', status='available')],
+        ]
+        callback = mock.Mock()
+
+        statuses = common.wait_for_volumes(
+            self.volume_client, ['volume-1', 'volume-2', 'volume-3'],
+            sleep_time=1, callback=callback)
+
+        self.assertEqual({
+            'volume-1': 'available',
+            'volume-2': 'error',
+            'volume-3': 'available',
+        }, statuses)
+        self.assertEqual(3, self.volume_client.volumes.list.call_count)
+        self.assertEqual(2, mock_sleep.call_count)
+        callback.assert_has_calls(
+            [mock.call(1, 3), mock.call(2, 3), mock.call(3, 3)])
+
+    def test_wait_for_volumes_deleted(self, mock_sleep):
+        self.volume_client.volumes.list.return_value = []
+        self.volume_client.volumes.get.side_effect = (
+            cinder_exceptions.NotFound(404))
+
+        statuses = common.wait_for_volumes(
+            self.volume_client, ['volume-1'], success_status=())
+
+        self.assertEqual({'volume-1': 'deleted'}, statuses)
+        self.volume_client.volumes.get.assert_called_once_with('volume-1')
+        mock_sleep.assert_not_called()
+
+    def test_wait_for_volumes_not_listed(self, mock_sleep):
+        # Volumes of other projects are missing from the listing
+        self.volume_client.volumes.list.return_value = []
+        self.volume_client.volumes.get.side_effect = [
+            mock.Mock(id='volume-1', status='deleting'),
+            exceptions.CommandError(),
+            cinder_exceptions.NotFound(404),
+        ]
+
+        statuses = common.wait_for_volumes(
+            self.volume_client, ['volume-1'], success_status=())
+
+        self.assertEqual({'volume-1': 'deleted'}, statuses)
+        self.assertEqual(3, self.volume_client.volumes.get.call_count)
+        self.assertEqual(2, mock_sleep.call_count)
+
+    @mock.patch('time.time')
+    def test_wait_for_volumes_timeout(self, mock_time, mock_sleep):
+        mock_time.return_value = 0
+
+        def _sleep(seconds):
+            mock_time.return_value += seconds
+
+        mock_sleep.side_effect = _sleep
+        self.volume_client.volumes.list.return_value = [
+            mock.Mock(id='volume-1', status='creating'),
+            mock.Mock(id='volume-2', status='available'),
+        ]
+
+        statuses = common.wait_for_volumes(
+            self.volume_client, ['volume-1', 'volume-2'],
+            sleep_time=5, timeout=8)
+
+        self.assertEqual({
+            'volume-1': 'creating',
+            'volume-2': 'available',
+        }, statuses)
+        self.assertEqual(2, self.volume_client.volumes.list.call_count)
+        mock_sleep.assert_called_once_with(5)
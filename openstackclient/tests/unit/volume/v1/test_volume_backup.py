@@ -304,7 +304,13 @@ class TestBackupList(TestBackup):
             "volume_id": self.volume.id,
             "all_tenants": True,
         }
-        self.volumes_mock.get.assert_called_once_with(self.volume.id)
+        # The volume of the filter, then the volumes of the listed backups
+        self.volumes_mock.get.assert_has_calls([
+            call(self.volume.id),
+            call(self.volume.display_name),
+        ])
+        self.assertEqual(2, self.volumes_mock.get.call_count)
+        self.volumes_mock.list.assert_not_called()
         self.backups_mock.list.assert_called_with(
             search_opts=search_opts,
         )
@@ -16,6 +16,9 @@ import argparse
 from unittest import mock
 from unittest.mock import call
 
+from cinderclient import api_versions
+from cinderclient import exceptions as cinder_exceptions
+import fixtures
 from osc_lib.cli import format_columns
 from osc_lib import exceptions
 from osc_lib import utils
@@ -24,6 +27,7 @@ from openstackclient.tests.unit.identity.v3 import fakes as identity_fakes
 from openstackclient.tests.unit.image.v2 import fakes as image_fakes
 from openstackclient.tests.unit import utils as tests_utils
 from openstackclient.tests.unit.volume.v2 import fakes as volume_fakes
+from openstackclient.volume import common as volume_common
 from openstackclient.volume.v2 import volume
 
 
@@ -481,6 +485,79 @@ class TestVolumeCreate(TestVolume):
         self.assertRaises(exceptions.CommandError, self.cmd.take_action,
                           parsed_args)
 
+    @mock.patch.object(utils, 'wait_for_status', return_value=True)
+    def test_volume_create_wait(self, mock_wait):
+        arglist = [
+            '--size', str(self.new_volume.size),
+            '--wait',
+            self.new_volume.name,
+        ]
+        verifylist = [
+            ('size', self.new_volume.size),
+            ('wait', True),
+            ('name', self.new_volume.name),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+        self.volumes_mock.get.return_value = self.new_volume
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        mock_wait.assert_called_once_with(
+            self.volumes_mock.get,
+            self.new_volume.id,
+            success_status=['available'],
+            error_status=['error'],
+            callback=mock.ANY,
+        )
+        self.volumes_mock.get.assert_called_once_with(self.new_volume.id)
+        self.assertEqual(self.columns, columns)
+        self.assertCountEqual(self.datalist, data)
+
+    @mock.patch('time.sleep')
+    def test_volume_create_wait_available(self, mock_sleep):
+        creating = volume_fakes.FakeVolume.create_one_volume(
+            attrs={'id': self.new_volume.id, 'status': 'creating'})
+        available = volume_fakes.FakeVolume.create_one_volume(
+            attrs={'id': self.new_volume.id, 'status': 'available'})
+        self.volumes_mock.get.side_effect = [
+            creating, available, self.new_volume]
+        arglist = [
+            '--size', str(self.new_volume.size),
+            '--wait',
+            self.new_volume.name,
+        ]
+        verifylist = [
+            ('size', self.new_volume.size),
+            ('wait', True),
+            ('name', self.new_volume.name),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.assertEqual(3, self.volumes_mock.get.call_count)
+        mock_sleep.assert_called_once_with(5)
+        self.assertEqual(self.columns, columns)
+        self.assertCountEqual(self.datalist, data)
+
+    @mock.patch.object(utils, 'wait_for_status', return_value=False)
+    def test_volume_create_wait_fails(self, mock_wait):
+        arglist = [
+            '--size', str(self.new_volume.size),
+            '--wait',
+            self.new_volume.name,
+        ]
+        verifylist = [
+            ('size', self.new_volume.size),
+            ('wait', True),
+            ('name', self.new_volume.name),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        self.assertRaises(exceptions.CommandError, self.cmd.take_action,
+                          parsed_args)
+        self.volumes_mock.get.assert_not_called()
+
     def test_volume_create_with_multi_source(self):
         arglist = [
             '--image', 'source_image',
@@ -501,6 +578,184 @@ class TestVolumeCreate(TestVolume):
                           self.cmd, arglist, verifylist)
 
 
+class TestVolumeCreateBulk(TestVolume):
+
+    columns = ('ID', 'Name', 'Status')
+
+    def setUp(self):
+        super(TestVolumeCreateBulk, self).setUp()
+
+        self.new_volumes = volume_fakes.FakeVolume.create_volumes(count=2)
+        self.volumes_mock.create.side_effect = self.new_volumes
+
+        self.cmd = volume.CreateVolumeBulk(self.app, None)
+
+    def _create_attrs(self, **kwargs):
+        attrs = {
+            'size': 1,
+            'snapshot_id': None,
+            'name': None,
+            'description': None,
+            'volume_type': None,
+            'availability_zone': None,
+            'metadata': None,
+            'imageRef': None,
+            'source_volid': None,
+            'consistencygroup_id': None,
+            'scheduler_hints': None,
+        }
+        attrs.update(kwargs)
+        return attrs
+
+    def test_volume_bulk_create_count(self):
+        arglist = [
+            '--size', '1',
+            '--image', 'image1',
+            '--count', '2',
+            'vol',
+        ]
+        verifylist = [
+            ('size', 1),
+            ('image', 'image1'),
+            ('count', 2),
+            ('name', 'vol'),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.find_image_mock.assert_called_once_with(
+            'image1', ignore_missing=False)
+        image_id = self.find_image_mock.return_value.id
+        self.volumes_mock.create.assert_has_calls([
+            call(**self._create_attrs(name='vol-1', imageRef=image_id)),
+            call(**self._create_attrs(name='vol-2', imageRef=image_id)),
+        ], any_order=True)
+        self.assertEqual(self.columns, columns)
+        self.assertCountEqual(
+            [(v.id, v.name, v.status) for v in self.new_volumes], data)
+
+    def test_volume_bulk_create_from_file(self):
+        path = self.useFixture(fixtures.TempDir()).path + '/volumes'
+        with open(path, 'w') as f:
+            f.write('# test volumes\n'
+                    '--size 1 vol1\n'
+                    '\n'
+                    '--size 2 --description "a volume" vol2\n')
+        arglist = [
+            '--from-file', path,
+        ]
+        verifylist = [
+            ('from_file', path),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.volumes_mock.create.assert_has_calls([
+            call(**self._create_attrs(name='vol1')),
+            call(**self._create_attrs(
+                name='vol2', size=2, description='a volume')),
+        ], any_order=True)
+        self.assertEqual(self.columns, columns)
+        self.assertEqual(2, len(list(data)))
+
+    def test_volume_bulk_create_from_file_invalid(self):
+        path = self.useFixture(fixtures.TempDir()).path + '/volumes'
+        with open(path, 'w') as f:
+            f.write('--size 1 vol1\n--size\n')
+        arglist = [
+            '--from-file', path,
+        ]
+        verifylist = [
+            ('from_file', path),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        with mock.patch('sys.stderr'):
+            self.assertRaises(exceptions.CommandError, self.cmd.take_action,
+                              parsed_args)
+        self.volumes_mock.create.assert_not_called()
+
+    def test_volume_bulk_create_without_name(self):
+        arglist = [
+            '--size', '1',
+        ]
+        verifylist = [
+            ('size', 1),
+            ('name', None),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        self.assertRaises(exceptions.CommandError, self.cmd.take_action,
+                          parsed_args)
+
+    def test_volume_bulk_create_with_exception(self):
+        self.volumes_mock.create.side_effect = [
+            self.new_volumes[0], exceptions.CommandError()]
+        self.cmd.produce_output = mock.Mock()
+        arglist = [
+            '--size', '1',
+            '--count', '2',
+            'vol',
+        ]
+        verifylist = [
+            ('size', 1),
+            ('count', 2),
+            ('name', 'vol'),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        ex = self.assertRaises(exceptions.CommandError,
+                               self.cmd.take_action,
+                               parsed_args)
+
+        self.assertEqual('1 of 2 volumes failed to create.', str(ex))
+        self.assertEqual(2, self.volumes_mock.create.call_count)
+        self.cmd.produce_output.assert_called_once_with(
+            parsed_args, ('ID', 'Name', 'Status'),
+            [(self.new_volumes[0].id, self.new_volumes[0].name,
+              self.new_volumes[0].status)])
+
+    @mock.patch('time.sleep')
+    def test_volume_bulk_create_wait(self, mock_sleep):
+        creating = [
+            mock.Mock(id=v.id, status='creating') for v in self.new_volumes]
+        done = [
+            mock.Mock(id=self.new_volumes[0].id, status='available'),
+            mock.Mock(id=self.new_volumes[1].id, status='error'),
+        ]
+        self.volumes_mock.list.side_effect = [creating, done]
+        self.cmd.produce_output = mock.Mock()
+        arglist = [
+            '--size', '1',
+            '--count', '2',
+            '--wait',
+            'vol',
+        ]
+        verifylist = [
+            ('size', 1),
+            ('count', 2),
+            ('wait', True),
+            ('name', 'vol'),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        ex = self.assertRaises(exceptions.CommandError,
+                               self.cmd.take_action,
+                               parsed_args)
+
+        self.assertEqual('1 of 2 volumes failed to create.', str(ex))
+        self.assertEqual(2, self.volumes_mock.list.call_count)
+        mock_sleep.assert_called_once_with(volume_common.WAIT_INTERVAL)
+        self.cmd.produce_output.assert_called_once_with(
+            parsed_args, ('ID', 'Name', 'Status'), [
+                (self.new_volumes[0].id, self.new_volumes[0].name,
+                 'available'),
+                (self.new_volumes[1].id, self.new_volumes[1].name, 'error'),
+            ])
+
+
 class TestVolumeDelete(TestVolume):
 
     def setUp(self):
@@ -544,7 +799,7 @@ class TestVolumeDelete(TestVolume):
         result = self.cmd.take_action(parsed_args)
 
         calls = [call(v.id, cascade=False) for v in volumes]
-        self.volumes_mock.delete.assert_has_calls(calls)
+        self.volumes_mock.delete.assert_has_calls(calls, any_order=True)
         self.assertIsNone(result)
 
     def test_volume_delete_multi_volumes_with_exception(self):
@@ -598,6 +853,45 @@ class TestVolumeDelete(TestVolume):
             volumes[0].id, cascade=True)
         self.assertIsNone(result)
 
+    @mock.patch('time.sleep')
+    def test_volume_delete_wait(self, mock_sleep):
+        volumes = self.setup_volumes_mock(count=2)
+        found = set()
+
+        def _get(volume_id):
+            # Volumes are found by the delete, not once deleted
+            if volume_id in found:
+                raise cinder_exceptions.NotFound(404)
+            found.add(volume_id)
+            return {volume.id: volume for volume in volumes}[volume_id]
+
+        self.volumes_mock.get = mock.Mock(side_effect=_get)
+        self.volumes_mock.list.side_effect = [
+            [mock.Mock(id=volumes[0].id, status='deleting'),
+             mock.Mock(id=volumes[1].id, status='deleting')],
+            [mock.Mock(id=volumes[1].id, status='error_deleting')],
+        ]
+
+        arglist = [
+            '--wait',
+            volumes[0].id,
+            volumes[1].id,
+        ]
+        verifylist = [
+            ('wait', True),
+            ('volumes', [volumes[0].id, volumes[1].id]),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        try:
+            self.cmd.take_action(parsed_args)
+            self.fail('CommandError should be raised.')
+        except exceptions.CommandError as e:
+            self.assertEqual('1 of 2 volumes failed to delete.', str(e))
+        self.assertEqual(2, self.volumes_mock.list.call_count)
+        self.volumes_mock.get.assert_called_with(volumes[0].id)
+        mock_sleep.assert_called_once_with(volume_common.WAIT_INTERVAL)
+
     def test_volume_delete_with_force(self):
         volumes = self.setup_volumes_mock(count=1)
 
@@ -1058,6 +1352,53 @@ class TestVolumeList(TestVolume):
         )
         self.assertCountEqual(datalist, tuple(data))
 
+    @mock.patch.object(volume_common, 'PAGE_SIZE', 1)
+    def test_volume_list_all_pages(self):
+        second_volume = volume_fakes.FakeVolume.create_one_volume()
+        self.volumes_mock.list.side_effect = [
+            [self.mock_volume], [second_volume], []]
+        arglist = [
+            "--all-pages",
+        ]
+        verifylist = [
+            ('all_pages', True),
+            ('limit', None),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.assertEqual(self.columns, columns)
+        self.assertEqual(
+            [self.mock_volume.id, second_volume.id],
+            [row[0] for row in data])
+        search_opts = {
+            'status': None,
+            'project_id': None,
+            'user_id': None,
+            'name': None,
+            'all_tenants': False,
+        }
+        self.volumes_mock.list.assert_has_calls([
+            call(search_opts=search_opts, marker=None, limit=1),
+            call(search_opts=search_opts, marker=self.mock_volume.id,
+                 limit=1),
+            call(search_opts=search_opts, marker=second_volume.id,
+                 limit=1),
+        ])
+
+    def test_volume_list_all_pages_with_limit(self):
+        arglist = [
+            "--all-pages",
+            "--limit", "2",
+        ]
+        verifylist = [
+            ('all_pages', True),
+            ('limit', 2),
+        ]
+        self.assertRaises(tests_utils.ParserException, self.check_parser,
+                          self.cmd, arglist, verifylist)
+
     def test_volume_list_negative_limit(self):
         arglist = [
             "--limit", "-2",
@@ -1455,6 +1796,126 @@ class TestVolumeShow(TestVolume):
             data)
 
 
+class TestVolumeSummary(TestVolume):
+
+    def setUp(self):
+        super(TestVolumeSummary, self).setUp()
+
+        self.volumes = [
+            volume_fakes.FakeVolume.create_one_volume(attrs={
+                'size': 1,
+                'volume_type': 'type1',
+                'availability_zone': 'zone1',
+                'os-vol-tenant-attr:tenant_id': 'project1',
+            }),
+            volume_fakes.FakeVolume.create_one_volume(attrs={
+                'size': 2,
+                'volume_type': 'type2',
+                'availability_zone': 'zone1',
+                'os-vol-tenant-attr:tenant_id': 'project1',
+            }),
+            volume_fakes.FakeVolume.create_one_volume(attrs={
+                'size': 4,
+                'volume_type': 'type1',
+                'availability_zone': 'zone1',
+                'os-vol-tenant-attr:tenant_id': 'project2',
+            }),
+        ]
+        self.volumes_mock.list.return_value = self.volumes
+
+        self.cmd = volume.VolumeSummary(self.app, None)
+
+    def test_volume_summary(self):
+        arglist = []
+        verifylist = [
+            ('all_projects', False),
+            ('group_by', []),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.assertEqual(('Total Count', 'Total Size'), columns)
+        self.assertEqual([(3, 7)], list(data))
+        self.volumes_mock.list.assert_called_once_with(
+            search_opts={'all_tenants': False},
+            marker=None,
+            limit=volume_common.PAGE_SIZE,
+        )
+        self.volumes_mock.summary.assert_not_called()
+
+    def test_volume_summary_server_side(self):
+        self.app.client_manager.volume.api_version = \
+            api_versions.APIVersion('3.12')
+        self.volumes_mock.summary.return_value = {
+            'volume-summary': {'total_count': 3, 'total_size': 7},
+        }
+        arglist = [
+            '--all-projects',
+        ]
+        verifylist = [
+            ('all_projects', True),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.assertEqual(('Total Count', 'Total Size'), columns)
+        self.assertEqual([(3, 7)], list(data))
+        self.volumes_mock.summary.assert_called_once_with(all_tenants=True)
+        self.volumes_mock.list.assert_not_called()
+
+    def test_volume_summary_group_by(self):
+        self.app.client_manager.volume.api_version = \
+            api_versions.APIVersion('3.12')
+        arglist = [
+            '--all-projects',
+            '--group-by', 'project',
+            '--group-by', 'type',
+        ]
+        verifylist = [
+            ('all_projects', True),
+            ('group_by', ['project', 'type']),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.assertEqual(
+            ('Project', 'Type', 'Total Count', 'Total Size'), columns)
+        self.assertEqual([
+            ('project1', 'type1', 1, 1),
+            ('project1', 'type2', 1, 2),
+            ('project2', 'type1', 1, 4),
+        ], list(data))
+        self.volumes_mock.summary.assert_not_called()
+
+    def test_volume_summary_group_by_availability_zone(self):
+        arglist = [
+            '--group-by', 'availability-zone',
+        ]
+        verifylist = [
+            ('group_by', ['availability-zone']),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.assertEqual(
+            ('Availability Zone', 'Total Count', 'Total Size'), columns)
+        self.assertEqual([('zone1', 3, 7)], list(data))
+
+    def test_volume_summary_no_volumes(self):
+        self.volumes_mock.list.return_value = []
+        arglist = []
+        verifylist = []
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.assertEqual([(0, 0)], list(data))
+
+
 class TestVolumeUnset(TestVolume):
 
     def setUp(self):
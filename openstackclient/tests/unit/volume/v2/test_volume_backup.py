@@ -16,10 +16,14 @@ from unittest import mock
 from unittest.mock import call
 
 from cinderclient import api_versions
+from cinderclient import exceptions as cinder_exceptions
+import fixtures
 from osc_lib import exceptions
 from osc_lib import utils
 
+from openstackclient.tests.unit import utils as tests_utils
 from openstackclient.tests.unit.volume.v2 import fakes as volume_fakes
+from openstackclient.volume import common as volume_common
 from openstackclient.volume.v2 import volume_backup
 
 
@@ -240,6 +244,221 @@ class TestBackupCreate(TestBackup):
         self.assertEqual(self.data, data)
 
 
+class TestBackupCreateBulk(TestBackup):
+
+    columns = ('Volume', 'Backup ID', 'Incremental', 'Status')
+
+    def setUp(self):
+        super(TestBackupCreateBulk, self).setUp()
+
+        self.volumes = volume_fakes.FakeVolume.create_volumes(count=2)
+        self.volumes_mock.get.side_effect = lambda v: {
+            volume.id: volume for volume in self.volumes}[v]
+        self.new_backups = {
+            volume.id: mock.Mock(id='backup-' + volume.id)
+            for volume in self.volumes
+        }
+        self.backups_mock.create.side_effect = (
+            lambda volume_id, **kwargs: self.new_backups[volume_id])
+
+        self.path = self.useFixture(fixtures.TempDir()).path + '/volumes'
+        with open(self.path, 'w') as f:
+            f.write('# volumes\n')
+            for volume in self.volumes:
+                f.write(volume.id + '\n')
+
+        self.cmd = volume_backup.CreateVolumeBackupBulk(self.app, None)
+
+    def _backup(self, volume, status):
+        return mock.Mock(id='backup-' + volume.id, status=status)
+
+    @mock.patch('time.sleep')
+    def test_backup_bulk_create_from_file(self, mock_sleep):
+        self.backups_mock.get.side_effect = [
+            self._backup(self.volumes[0], 'creating'),
+            self._backup(self.volumes[0], 'available'),
+            self._backup(self.volumes[1], 'available'),
+        ]
+        arglist = [
+            '--volumes-from-file', self.path,
+            '--max-running', '1',
+            '--force',
+        ]
+        verifylist = [
+            ('volumes_from_file', self.path),
+            ('max_running', 1),
+            ('force', True),
+            ('incremental', False),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.backups_mock.create.assert_has_calls([
+            call(self.volumes[0].id, container=None, force=True,
+                 incremental=False),
+            call(self.volumes[1].id, container=None, force=True,
+                 incremental=False),
+        ])
+        self.backups_mock.get.assert_has_calls([
+            call('backup-' + self.volumes[0].id),
+            call('backup-' + self.volumes[0].id),
+            call('backup-' + self.volumes[1].id),
+        ])
+        self.backups_mock.list.assert_not_called()
+        mock_sleep.assert_called_once_with(volume_common.WAIT_INTERVAL)
+        self.assertEqual(self.columns, columns)
+        self.assertEqual([
+            (self.volumes[0].id, 'backup-' + self.volumes[0].id, False,
+             'available'),
+            (self.volumes[1].id, 'backup-' + self.volumes[1].id, False,
+             'available'),
+        ], data)
+
+    @mock.patch('time.sleep')
+    def test_backup_bulk_create_failed(self, mock_sleep):
+        self.backups_mock.get.side_effect = [
+            self._backup(self.volumes[0], 'available'),
+            cinder_exceptions.NotFound(404),
+        ]
+        self.cmd.produce_output = mock.Mock()
+        arglist = [
+            '--volumes-from-file', self.path,
+        ]
+        verifylist = [
+            ('volumes_from_file', self.path),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        ex = self.assertRaises(exceptions.CommandError,
+                               self.cmd.take_action,
+                               parsed_args)
+
+        self.assertEqual('1 of 2 backups failed.', str(ex))
+        mock_sleep.assert_not_called()
+        self.cmd.produce_output.assert_called_once_with(
+            parsed_args, self.columns, [
+                (self.volumes[0].id, 'backup-' + self.volumes[0].id, False,
+                 'available'),
+                (self.volumes[1].id, 'backup-' + self.volumes[1].id, False,
+                 'deleted'),
+            ])
+
+    @mock.patch('time.sleep')
+    def test_backup_bulk_create_from_file_auto_incremental(self, mock_sleep):
+        self.backups_mock.list.side_effect = lambda search_opts, limit: (
+            [mock.Mock(id='old-backup')]
+            if search_opts['volume_id'] == self.volumes[1].id else [])
+        self.backups_mock.get.side_effect = lambda backup_id: mock.Mock(
+            id=backup_id, status='available')
+        arglist = [
+            '--volumes-from-file', self.path,
+            '--auto-incremental',
+        ]
+        verifylist = [
+            ('volumes_from_file', self.path),
+            ('auto_incremental', True),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.backups_mock.list.assert_has_calls([
+            call(search_opts={'all_tenants': True,
+                              'volume_id': volume.id,
+                              'status': 'available'},
+                 limit=1)
+            for volume in self.volumes
+        ], any_order=True)
+        self.assertEqual(2, self.backups_mock.list.call_count)
+        self.assertEqual([
+            (self.volumes[0].id, 'backup-' + self.volumes[0].id, False,
+             'available'),
+            (self.volumes[1].id, 'backup-' + self.volumes[1].id, True,
+             'available'),
+        ], data)
+
+    @mock.patch('time.sleep')
+    def test_backup_bulk_create_project_auto_incremental(self, mock_sleep):
+        project = mock.Mock(id='project-id')
+        self.app.client_manager.identity.projects.get.return_value = project
+        self.volumes_mock.list.return_value = self.volumes
+        self.backups_mock.list.return_value = [
+            mock.Mock(id='old-backup', volume_id=self.volumes[1].id)]
+        self.backups_mock.get.side_effect = lambda backup_id: mock.Mock(
+            id=backup_id, status='available')
+        arglist = [
+            '--project', project.id,
+            '--auto-incremental',
+        ]
+        verifylist = [
+            ('project', project.id),
+            ('auto_incremental', True),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.volumes_mock.list.assert_called_once_with(
+            search_opts={'all_tenants': True, 'project_id': project.id},
+            marker=None, limit=volume_common.PAGE_SIZE)
+        self.backups_mock.create.assert_has_calls([
+            call(self.volumes[0].id, container=None, force=False,
+                 incremental=False),
+            call(self.volumes[1].id, container=None, force=False,
+                 incremental=True),
+        ], any_order=True)
+        self.backups_mock.list.assert_called_once_with(
+            search_opts={'all_tenants': True, 'project_id': project.id,
+                         'status': 'available'},
+            marker=None, limit=volume_common.PAGE_SIZE)
+        self.backups_mock.get.assert_has_calls([
+            call('backup-' + self.volumes[0].id),
+            call('backup-' + self.volumes[1].id),
+        ], any_order=True)
+        mock_sleep.assert_not_called()
+        self.assertEqual([
+            (self.volumes[0].id, 'backup-' + self.volumes[0].id, False,
+             'available'),
+            (self.volumes[1].id, 'backup-' + self.volumes[1].id, True,
+             'available'),
+        ], data)
+
+    def test_backup_bulk_create_with_exception(self):
+        with open(self.path, 'a') as f:
+            f.write('unexist_volume\n')
+        self.volumes_mock.find.side_effect = exceptions.NotFound(404)
+        self.backups_mock.create.side_effect = [
+            exceptions.CommandError(), exceptions.CommandError()]
+        self.cmd.produce_output = mock.Mock()
+        arglist = [
+            '--volumes-from-file', self.path,
+        ]
+        verifylist = [
+            ('volumes_from_file', self.path),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        ex = self.assertRaises(exceptions.CommandError,
+                               self.cmd.take_action,
+                               parsed_args)
+
+        self.assertEqual('3 of 3 backups failed.', str(ex))
+        self.backups_mock.get.assert_not_called()
+        self.cmd.produce_output.assert_called_once_with(
+            parsed_args, self.columns, [
+                ('unexist_volume', '', False, 'error'),
+                (self.volumes[0].id, '', False, 'error'),
+                (self.volumes[1].id, '', False, 'error'),
+            ])
+
+    def test_backup_bulk_create_without_source(self):
+        arglist = []
+        verifylist = []
+        self.assertRaises(tests_utils.ParserException, self.check_parser,
+                          self.cmd, arglist, verifylist)
+
+
 class TestBackupDelete(TestBackup):
 
     backups = volume_fakes.FakeBackup.create_backups(count=2)
@@ -299,7 +518,7 @@ class TestBackupDelete(TestBackup):
         calls = []
         for b in self.backups:
             calls.append(call(b.id, False))
-        self.backups_mock.delete.assert_has_calls(calls)
+        self.backups_mock.delete.assert_has_calls(calls, any_order=True)
         self.assertIsNone(result)
 
     def test_delete_multiple_backups_with_exception(self):
@@ -414,6 +633,33 @@ class TestBackupList(TestBackup):
         self.assertEqual(self.columns, columns)
         self.assertCountEqual(self.data, list(data))
 
+    def test_backup_list_all_pages(self):
+        arglist = [
+            "--all-pages",
+            "--marker", self.backups[0].name,
+        ]
+        verifylist = [
+            ("all_pages", True),
+            ("marker", self.backups[0].name),
+            ("limit", None),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.assertEqual(self.columns, columns)
+        self.assertCountEqual(self.data, list(data))
+        self.backups_mock.list.assert_called_once_with(
+            search_opts={
+                "name": None,
+                "status": None,
+                "volume_id": None,
+                'all_tenants': False,
+            },
+            marker=self.backups[0].id,
+            limit=volume_common.PAGE_SIZE,
+        )
+
     def test_backup_list_with_options(self):
         arglist = [
             "--long",
@@ -443,7 +689,13 @@ class TestBackupList(TestBackup):
             "volume_id": self.volume.id,
             'all_tenants': True,
         }
-        self.volumes_mock.get.assert_called_once_with(self.volume.id)
+        # The volume of the filter, then the volumes of the listed backups
+        self.volumes_mock.get.assert_has_calls([
+            call(self.volume.id),
+            call(self.volume.name),
+        ])
+        self.assertEqual(2, self.volumes_mock.get.call_count)
+        self.volumes_mock.list.assert_not_called()
         self.backups_mock.get.assert_called_once_with(self.backups[0].id)
         self.backups_mock.list.assert_called_with(
             search_opts=search_opts,
@@ -22,6 +22,7 @@ from osc_lib import utils
 from openstackclient.tests.unit.identity.v3 import fakes as project_fakes
 from openstackclient.tests.unit import utils as tests_utils
 from openstackclient.tests.unit.volume.v2 import fakes as volume_fakes
+from openstackclient.volume import common as volume_common
 from openstackclient.volume.v2 import volume_snapshot
 
 
@@ -237,7 +238,7 @@ class TestVolumeSnapshotDelete(TestVolumeSnapshot):
         calls = []
         for s in self.snapshots:
             calls.append(mock.call(s.id, False))
-        self.snapshots_mock.delete.assert_has_calls(calls)
+        self.snapshots_mock.delete.assert_has_calls(calls, any_order=True)
         self.assertIsNone(result)
 
     def test_delete_multiple_snapshots_with_exception(self):
@@ -347,6 +348,31 @@ class TestVolumeSnapshotList(TestVolumeSnapshot):
         self.assertEqual(self.columns, columns)
         self.assertEqual(self.data, list(data))
 
+    def test_snapshot_list_all_pages(self):
+        arglist = [
+            '--all-pages',
+        ]
+        verifylist = [
+            ('all_pages', True),
+            ('limit', None),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.assertEqual(self.columns, columns)
+        self.assertEqual(self.data, list(data))
+        self.snapshots_mock.list.assert_called_once_with(
+            limit=volume_common.PAGE_SIZE, marker=None,
+            search_opts={
+                'all_tenants': False,
+                'name': None,
+                'status': None,
+                'project_id': None,
+                'volume_id': None
+            }
+        )
+
     def test_snapshot_list_with_options(self):
         arglist = [
             "--long",
@@ -376,6 +402,44 @@ class TestVolumeSnapshotList(TestVolumeSnapshot):
                 'volume_id': None
             }
         )
+        self.volumes_mock.get.assert_called_once_with(self.volume.name)
+        self.volumes_mock.list.assert_not_called()
+        self.assertEqual(self.columns_long, columns)
+        self.assertEqual(self.data_long, list(data))
+
+    def test_snapshot_list_long_without_volume_column(self):
+        arglist = [
+            "--long",
+            "-c", "ID",
+            "-c", "Created At",
+        ]
+        verifylist = [
+            ("long", True),
+            ("columns", ["ID", "Created At"]),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.volumes_mock.get.assert_not_called()
+        self.volumes_mock.list.assert_not_called()
+        self.assertEqual(self.columns_long, columns)
+        self.assertEqual(self.data_long, list(data))
+
+    def test_snapshot_list_long_machine_readable(self):
+        arglist = [
+            "--long",
+            "-f", "json",
+        ]
+        verifylist = [
+            ("long", True),
+            ("formatter", "json"),
+        ]
+        parsed_args = self.check_parser(self.cmd, arglist, verifylist)
+
+        columns, data = self.cmd.take_action(parsed_args)
+
+        self.volumes_mock.get.assert_not_called()
         self.assertEqual(self.columns_long, columns)
         self.assertEqual(self.data_long, list(data))
 
@@ -0,0 +1,206 @@
+#   Licensed under the Apache License, Version 2.0 (the "License"); you may
+#   not use this file except in compliance with the License. You may obtain
+#   a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#   WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#   License for the specific language governing permissions and limitations
+#   under the License.
+#
+
+"""Common code shared by volume commands"""
+
+import concurrent.futures
+import logging
+import time
+
+from cinderclient import exceptions as cinder_exceptions
+from osc_lib import utils
+
+from openstackclient.common import concurrency
+
+
+LOG = logging.getLogger(__name__)
+
+# Seconds between two polls of the status of volumes
+WAIT_INTERVAL = 5
+# Seconds after which waiting for volumes stops
+WAIT_TIMEOUT = 3600
+# Number of resources requested per page when listing all the pages
+PAGE_SIZE = 1000
+
+
+def is_column_displayed(parsed_args, column_headers, columns, column):
+    """Check whether a column is displayed in human readable form
+
+    Only the table formatter displays the human readable form of formatted
+    columns, other formatters output their raw value.
+
+    :param parsed_args: parsed arguments of a Lister command
+    :param column_headers: headers of the columns of the listing
+    :param columns: attributes of the columns of the listing
+    :param column: attribute of the column to check
+    """
+    if getattr(parsed_args, 'formatter', 'table') != 'table':
+        return False
+    _headers, attrs = utils.calculate_header_and_attrs(
+        column_headers, columns, parsed_args)
+    return column in attrs
+
+
+def get_volume_cache(volume_client, volume_ids):
+    """Fetch the volumes with the given IDs concurrently
+
+    Volumes that cannot be fetched are left out, callers display their ID
+    instead of their name.
+
+    :param volume_client: volume client (any API version)
+    :param volume_ids: IDs of the volumes, may hold duplicates and ``None``
+    :returns: a dict mapping volume IDs to volumes
+    """
+    volume_ids = [
+        volume_id for volume_id in dict.fromkeys(volume_ids) if volume_id
+    ]
+    if not volume_ids:
+        return {}
+
+    volume_cache = {}
+    for volume_id, volume, e in concurrency.run_concurrently(
+            volume_client.volumes.get, volume_ids):
+        if e is not None:
+            LOG.debug('Failed to get volume %s: %s', volume_id, e)
+        else:
+            volume_cache[volume_id] = volume
+    return volume_cache
+
+
+def list_all_pages(list_func, marker=None, page_size=None, **kwargs):
+    """Walk through all the pages of a listing
+
+    The listing is requested page after page, each page starting after the
+    last resource of the previous one. The next page is fetched while the
+    resources of the current page are consumed.
+
+    :param list_func: listing method of a manager, taking ``marker`` and
+        ``limit`` arguments
+    :param marker: ID of the resource to start after
+    :param page_size: number of resources requested per page, defaults to
+        ``PAGE_SIZE``
+    :param kwargs: other arguments of the listing method
+    :returns: a generator of the resources
+    """
+    page_size = page_size or PAGE_SIZE
+    with concurrent.futures.ThreadPoolExecutor(1) as executor:
+        future = executor.submit(
+            list_func, marker=marker, limit=page_size, **kwargs)
+        while future is not None:
+            page = list(future.result())
+            future = None
+            if page and len(page) >= page_size:
+                future = executor.submit(
+                    list_func, marker=page[-1].id, limit=page_size, **kwargs)
+            for resource in page:
+                yield resource
+
+
+def get_statuses(list_func, resource_ids, **kwargs):
+    """Get the status of many resources with a single listing
+
+    :param list_func: listing method of a manager
+    :param resource_ids: IDs of the resources
+    :param kwargs: arguments of the listing method
+    :returns: a dict mapping the resource IDs to their lower case status,
+        ``deleted`` for resources missing from the listing
+    """
+    listed = {
+        resource.id: resource.status.lower()
+        for resource in list_func(**kwargs)
+    }
+    return {
+        resource_id: listed.get(resource_id, 'deleted')
+        for resource_id in resource_ids
+    }
+
+
+def get_statuses_by_id(get_func, resource_ids,
+                       max_workers=concurrency.BULK_CONCURRENCY):
+    """Get the status of resources with one concurrent request per resource
+
+    :param get_func: method of a manager getting a resource by ID
+    :param resource_ids: IDs of the resources
+    :param max_workers: maximum number of requests sent in parallel
+    :returns: a dict mapping the resource IDs to their lower case status,
+        ``deleted`` for resources which are not found. Resources which
+        could not be fetched for another reason are left out.
+    """
+    statuses = {}
+    for resource_id, resource, e in concurrency.run_concurrently(
+            get_func, resource_ids, max_workers=max_workers):
+        if e is None:
+            statuses[resource_id] = resource.status.lower()
+        elif isinstance(e, cinder_exceptions.NotFound):
+            statuses[resource_id] = 'deleted'
+        else:
+            LOG.warning('Failed to get the status of %s: %s', resource_id, e)
+    return statuses
+
+
+def wait_for_volumes(volume_client, volume_ids, success_status=('available',),
+                     error_status=('error',), sleep_time=WAIT_INTERVAL,
+                     timeout=WAIT_TIMEOUT, callback=None):
+    """Wait for many volumes to reach a final status
+
+    All the volumes are polled with a single (paginated) volume listing
+    per interval rather than one request per volume. The listing only holds
+    the volumes of the current project, volumes missing from it are fetched
+    one by one and considered deleted, which is final, if they are not
+    found.
+
+    :param volume_client: volume client (any API version)
+    :param volume_ids: IDs of the volumes to wait for
+    :param success_status: statuses considered successful
+    :param error_status: statuses considered failed
+    :param sleep_time: seconds between two polls
+    :param timeout: seconds after which waiting stops, volumes still
+        pending are then returned with their last known status
+    :param callback: called after each poll with the number of volumes
+        having reached a final status and the number of volumes
+    :returns: a dict mapping volume IDs to their final status, ``deleted``
+        for volumes which no longer exist
+    """
+    deadline = time.time() + timeout
+    pending = set(volume_ids)
+    last_statuses = {}
+    statuses = {}
+    while pending:
+        polled = get_statuses(volume_client.volumes.list, pending)
+        missing = [
+            volume_id for volume_id, status in polled.items()
+            if status == 'deleted'
+        ]
+        if missing:
+            # Volumes which could not be fetched are polled again
+            for volume_id in missing:
+                del polled[volume_id]
+            polled.update(get_statuses_by_id(
+                volume_client.volumes.get, missing))
+        for volume_id, status in polled.items():
+            last_statuses[volume_id] = status
+            if (status == 'deleted' or status in success_status or
+                    status in error_status):
+                statuses[volume_id] = status
+                pending.discard(volume_id)
+        if callback:
+            callback(len(statuses), len(statuses) + len(pending))
+        if pending and time.time() + sleep_time > deadline:
+            LOG.warning('Timed out waiting for volumes: %s',
+                        ', '.join(sorted(pending)))
+            for volume_id in pending:
+                statuses[volume_id] = last_statuses.get(volume_id, 'unknown')
+            break
+        if pending:
+            time.sleep(sleep_time)
+    return statuses
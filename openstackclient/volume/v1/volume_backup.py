@@ -25,6 +25,7 @@ from osc_lib import exceptions
 from osc_lib import utils
 
 from openstackclient.i18n import _
+from openstackclient.volume import common as volume_common
 
 
 LOG = logging.getLogger(__name__)
@@ -186,17 +187,6 @@ class ListVolumeBackup(command.Lister):
             columns = ['ID', 'Name', 'Description', 'Status', 'Size']
             column_headers = columns
 
-        # Cache the volume list
-        volume_cache = {}
-        try:
-            for s in volume_client.volumes.list():
-                volume_cache[s.id] = s
-        except Exception:
-            # Just forget it if there's any trouble
-            pass
-        VolumeIdColumnWithCache = functools.partial(VolumeIdColumn,
-                                                    volume_cache=volume_cache)
-
         filter_volume_id = None
         if parsed_args.volume:
             filter_volume_id = utils.find_resource(volume_client.volumes,
@@ -211,6 +201,16 @@ class ListVolumeBackup(command.Lister):
             search_opts=search_opts,
         )
 
+        # Resolve the names of the volumes of the listed backups
+        volume_cache = {}
+        if volume_common.is_column_displayed(
+                parsed_args, column_headers, columns, 'Volume ID'):
+            data = list(data)
+            volume_cache = volume_common.get_volume_cache(
+                volume_client, (s.volume_id for s in data))
+        VolumeIdColumnWithCache = functools.partial(VolumeIdColumn,
+                                                    volume_cache=volume_cache)
+
         return (column_headers,
                 (utils.get_item_properties(
                     s, columns,
@@ -27,6 +27,7 @@ from osc_lib import exceptions
 from osc_lib import utils
 
 from openstackclient.i18n import _
+from openstackclient.volume import common as volume_common
 
 
 LOG = logging.getLogger(__name__)
@@ -205,17 +206,6 @@ class ListVolumeSnapshot(command.Lister):
         column_headers[1] = 'Name'
         column_headers[2] = 'Description'
 
-        # Cache the volume list
-        volume_cache = {}
-        try:
-            for s in volume_client.volumes.list():
-                volume_cache[s.id] = s
-        except Exception:
-            # Just forget it if there's any trouble
-            pass
-        VolumeIdColumnWithCache = functools.partial(VolumeIdColumn,
-                                                    volume_cache=volume_cache)
-
         volume_id = None
         if parsed_args.volume:
             volume_id = utils.find_resource(
@@ -230,6 +220,17 @@ class ListVolumeSnapshot(command.Lister):
 
         data = volume_client.volume_snapshots.list(
             search_opts=search_opts)
+
+        # Resolve the names of the volumes of the listed snapshots
+        volume_cache = {}
+        if volume_common.is_column_displayed(
+                parsed_args, column_headers, columns, 'Volume ID'):
+            data = list(data)
+            volume_cache = volume_common.get_volume_cache(
+                volume_client, (s.volume_id for s in data))
+        VolumeIdColumnWithCache = functools.partial(VolumeIdColumn,
+                                                    volume_cache=volume_cache)
+
         return (column_headers,
                 (utils.get_item_properties(
                     s, columns,
@@ -19,6 +19,7 @@ import copy
 import functools
 import logging
 
+from cinderclient import api_versions
 from cliff import columns as cliff_columns
 from osc_lib.cli import format_columns
 from osc_lib.cli import parseractions
@@ -26,8 +27,11 @@ from osc_lib.command import command
 from osc_lib import exceptions
 from osc_lib import utils
 
+from openstackclient.common import bulk
+from openstackclient.common import concurrency
 from openstackclient.i18n import _
 from openstackclient.identity import common as identity_common
+from openstackclient.volume import common as volume_common
 
 
 LOG = logging.getLogger(__name__)
@@ -78,6 +82,169 @@ def _check_size_arg(args):
         raise exceptions.CommandError(msg)
 
 
+def _add_create_arguments(parser):
+    """Add the options describing a new volume, except its name"""
+    parser.add_argument(
+        "--size",
+        metavar="<size>",
+        type=int,
+        help=_("Volume size in GB (Required unless --snapshot or "
+               "--source is specified)"),
+    )
+    parser.add_argument(
+        "--type",
+        metavar="<volume-type>",
+        help=_("Set the type of volume"),
+    )
+    source_group = parser.add_mutually_exclusive_group()
+    source_group.add_argument(
+        "--image",
+        metavar="<image>",
+        help=_("Use <image> as source of volume (name or ID)"),
+    )
+    source_group.add_argument(
+        "--snapshot",
+        metavar="<snapshot>",
+        help=_("Use <snapshot> as source of volume (name or ID)"),
+    )
+    source_group.add_argument(
+        "--source",
+        metavar="<volume>",
+        help=_("Volume to clone (name or ID)"),
+    )
+    source_group.add_argument(
+        "--source-replicated",
+        metavar="<replicated-volume>",
+        help=argparse.SUPPRESS,
+    )
+    parser.add_argument(
+        "--description",
+        metavar="<description>",
+        help=_("Volume description"),
+    )
+    parser.add_argument(
+        "--availability-zone",
+        metavar="<availability-zone>",
+        help=_("Create volume in <availability-zone>"),
+    )
+    parser.add_argument(
+        "--consistency-group",
+        metavar="consistency-group>",
+        help=_("Consistency group where the new volume belongs to"),
+    )
+    parser.add_argument(
+        "--property",
+        metavar="<key=value>",
+        action=parseractions.KeyValueAction,
+        help=_("Set a property to this volume "
+               "(repeat option to set multiple properties)"),
+    )
+    parser.add_argument(
+        "--hint",
+        metavar="<key=value>",
+        action=parseractions.KeyValueAction,
+        help=_("Arbitrary scheduler hint key-value pairs to help boot "
+               "an instance (repeat option to set multiple hints)"),
+    )
+    bootable_group = parser.add_mutually_exclusive_group()
+    bootable_group.add_argument(
+        "--bootable",
+        action="store_true",
+        help=_("Mark volume as bootable")
+    )
+    bootable_group.add_argument(
+        "--non-bootable",
+        action="store_true",
+        help=_("Mark volume as non-bootable (default)")
+    )
+    readonly_group = parser.add_mutually_exclusive_group()
+    readonly_group.add_argument(
+        "--read-only",
+        action="store_true",
+        help=_("Set volume to read-only access mode")
+    )
+    readonly_group.add_argument(
+        "--read-write",
+        action="store_true",
+        help=_("Set volume to read-write access mode (default)")
+    )
+
+
+def _get_create_attrs(client_manager, parsed_args):
+    """Resolve the options describing a new volume
+
+    :returns: the keyword arguments of ``volumes.create``
+    """
+    _check_size_arg(parsed_args)
+    volume_client = client_manager.volume
+    image_client = client_manager.image
+
+    source_volume = None
+    if parsed_args.source:
+        source_volume = utils.find_resource(
+            volume_client.volumes,
+            parsed_args.source).id
+
+    consistency_group = None
+    if parsed_args.consistency_group:
+        consistency_group = utils.find_resource(
+            volume_client.consistencygroups,
+            parsed_args.consistency_group).id
+
+    image = None
+    if parsed_args.image:
+        image = image_client.find_image(parsed_args.image,
+                                        ignore_missing=False).id
+
+    size = parsed_args.size
+
+    snapshot = None
+    if parsed_args.snapshot:
+        snapshot_obj = utils.find_resource(
+            volume_client.volume_snapshots,
+            parsed_args.snapshot)
+        snapshot = snapshot_obj.id
+        # Cinder requires a value for size when creating a volume
+        # even if creating from a snapshot. Cinder will create the
+        # volume with at least the same size as the snapshot anyway,
+        # so since we have the object here, just override the size
+        # value if it's either not given or is smaller than the
+        # snapshot size.
+        size = max(size or 0, snapshot_obj.size)
+
+    return {
+        'size': size,
+        'snapshot_id': snapshot,
+        'name': parsed_args.name,
+        'description': parsed_args.description,
+        'volume_type': parsed_args.type,
+        'availability_zone': parsed_args.availability_zone,
+        'metadata': parsed_args.property,
+        'imageRef': image,
+        'source_volid': source_volume,
+        'consistencygroup_id': consistency_group,
+        'scheduler_hints': parsed_args.hint,
+    }
+
+
+def _set_create_flags(volume_client, volume_id, parsed_args):
+    """Apply the bootable and read-only options of a new volume"""
+    if parsed_args.bootable or parsed_args.non_bootable:
+        try:
+            volume_client.volumes.set_bootable(
+                volume_id, parsed_args.bootable)
+        except Exception as e:
+            LOG.error(_("Failed to set volume bootable property: %s"), e)
+    if parsed_args.read_only or parsed_args.read_write:
+        try:
+            volume_client.volumes.update_readonly_flag(
+                volume_id,
+                parsed_args.read_only)
+        except Exception as e:
+            LOG.error(_("Failed to set volume read-only access "
+                        "mode flag: %s"), e)
+
+
 class CreateVolume(command.ShowOne):
     _description = _("Create new volume")
 
@@ -88,158 +255,41 @@ class CreateVolume(command.ShowOne):
             metavar="<name>",
             help=_("Volume name"),
         )
+        _add_create_arguments(parser)
         parser.add_argument(
-            "--size",
-            metavar="<size>",
-            type=int,
-            help=_("Volume size in GB (Required unless --snapshot or "
-                   "--source is specified)"),
-        )
-        parser.add_argument(
-            "--type",
-            metavar="<volume-type>",
-            help=_("Set the type of volume"),
-        )
-        source_group = parser.add_mutually_exclusive_group()
-        source_group.add_argument(
-            "--image",
-            metavar="<image>",
-            help=_("Use <image> as source of volume (name or ID)"),
-        )
-        source_group.add_argument(
-            "--snapshot",
-            metavar="<snapshot>",
-            help=_("Use <snapshot> as source of volume (name or ID)"),
-        )
-        source_group.add_argument(
-            "--source",
-            metavar="<volume>",
-            help=_("Volume to clone (name or ID)"),
-        )
-        source_group.add_argument(
-            "--source-replicated",
-            metavar="<replicated-volume>",
-            help=argparse.SUPPRESS,
-        )
-        parser.add_argument(
-            "--description",
-            metavar="<description>",
-            help=_("Volume description"),
-        )
-        parser.add_argument(
-            "--availability-zone",
-            metavar="<availability-zone>",
-            help=_("Create volume in <availability-zone>"),
-        )
-        parser.add_argument(
-            "--consistency-group",
-            metavar="consistency-group>",
-            help=_("Consistency group where the new volume belongs to"),
-        )
-        parser.add_argument(
-            "--property",
-            metavar="<key=value>",
-            action=parseractions.KeyValueAction,
-            help=_("Set a property to this volume "
-                   "(repeat option to set multiple properties)"),
-        )
-        parser.add_argument(
-            "--hint",
-            metavar="<key=value>",
-            action=parseractions.KeyValueAction,
-            help=_("Arbitrary scheduler hint key-value pairs to help boot "
-                   "an instance (repeat option to set multiple hints)"),
-        )
-        bootable_group = parser.add_mutually_exclusive_group()
-        bootable_group.add_argument(
-            "--bootable",
-            action="store_true",
-            help=_("Mark volume as bootable")
-        )
-        bootable_group.add_argument(
-            "--non-bootable",
+            "--wait",
             action="store_true",
-            help=_("Mark volume as non-bootable (default)")
-        )
-        readonly_group = parser.add_mutually_exclusive_group()
-        readonly_group.add_argument(
-            "--read-only",
-            action="store_true",
-            help=_("Set volume to read-only access mode")
-        )
-        readonly_group.add_argument(
-            "--read-write",
-            action="store_true",
-            help=_("Set volume to read-write access mode (default)")
+            help=_("Wait for the volume to become available"),
         )
         return parser
 
     def take_action(self, parsed_args):
-        _check_size_arg(parsed_args)
+
+        def _show_progress(progress):
+            if progress:
+                self.app.stdout.write('\rProgress: %s' % progress)
+                self.app.stdout.flush()
+
         volume_client = self.app.client_manager.volume
-        image_client = self.app.client_manager.image
-
-        source_volume = None
-        if parsed_args.source:
-            source_volume = utils.find_resource(
-                volume_client.volumes,
-                parsed_args.source).id
-
-        consistency_group = None
-        if parsed_args.consistency_group:
-            consistency_group = utils.find_resource(
-                volume_client.consistencygroups,
-                parsed_args.consistency_group).id
-
-        image = None
-        if parsed_args.image:
-            image = image_client.find_image(parsed_args.image,
-                                            ignore_missing=False).id
-
-        size = parsed_args.size
-
-        snapshot = None
-        if parsed_args.snapshot:
-            snapshot_obj = utils.find_resource(
-                volume_client.volume_snapshots,
-                parsed_args.snapshot)
-            snapshot = snapshot_obj.id
-            # Cinder requires a value for size when creating a volume
-            # even if creating from a snapshot. Cinder will create the
-            # volume with at least the same size as the snapshot anyway,
-            # so since we have the object here, just override the size
-            # value if it's either not given or is smaller than the
-            # snapshot size.
-            size = max(size or 0, snapshot_obj.size)
 
         volume = volume_client.volumes.create(
-            size=size,
-            snapshot_id=snapshot,
-            name=parsed_args.name,
-            description=parsed_args.description,
-            volume_type=parsed_args.type,
-            availability_zone=parsed_args.availability_zone,
-            metadata=parsed_args.property,
-            imageRef=image,
-            source_volid=source_volume,
-            consistencygroup_id=consistency_group,
-            scheduler_hints=parsed_args.hint,
-        )
-
-        if parsed_args.bootable or parsed_args.non_bootable:
-            try:
-                volume_client.volumes.set_bootable(
-                    volume.id, parsed_args.bootable)
-            except Exception as e:
-                LOG.error(_("Failed to set volume bootable property: %s"), e)
-        if parsed_args.read_only or parsed_args.read_write:
-            try:
-                volume_client.volumes.update_readonly_flag(
-                    volume.id,
-                    parsed_args.read_only)
-            except Exception as e:
-                LOG.error(_("Failed to set volume read-only access "
-                            "mode flag: %s"), e)
+            **_get_create_attrs(self.app.client_manager, parsed_args))
+
+        _set_create_flags(volume_client, volume.id, parsed_args)
+
+        if parsed_args.wait:
+            if utils.wait_for_status(
+                volume_client.volumes.get,
+                volume.id,
+                success_status=['available'],
+                error_status=['error'],
+                callback=_show_progress,
+            ):
+                self.app.stdout.write('\n')
+                volume = volume_client.volumes.get(volume.id)
+            else:
+                msg = _('Error creating volume: %s') % volume.id
+                raise exceptions.CommandError(msg)
 
         # Remove key links from being displayed
         volume._info.update(
@@ -253,6 +303,132 @@ class CreateVolume(command.ShowOne):
         return zip(*sorted(volume._info.items()))
 
 
+class CreateVolumeBulk(command.Lister):
+    _description = _("Create new volumes in bulk")
+
+    def get_parser(self, prog_name):
+        parser = super(CreateVolumeBulk, self).get_parser(prog_name)
+        parser.add_argument(
+            "name",
+            metavar="<name>",
+            nargs="?",
+            help=_("Name of the volumes, suffixed with their number when "
+                   "--count is greater than one (required unless "
+                   "--from-file is specified)"),
+        )
+        _add_create_arguments(parser)
+        parser.add_argument(
+            "--count",
+            metavar="<count>",
+            type=int,
+            default=1,
+            help=_("Number of volumes to create (for each line of "
+                   "--from-file when specified, default: 1)"),
+        )
+        parser.add_argument(
+            "--from-file",
+            metavar="<file>",
+            help=_("File holding the arguments of 'volume create' for one "
+                   "volume per line, '-' to read standard input. Empty "
+                   "lines and comments starting with '#' are ignored. "
+                   "Other volume options are ignored when specified."),
+        )
+        parser.add_argument(
+            "--wait",
+            action="store_true",
+            help=_("Wait for all the volumes to become available"),
+        )
+        return parser
+
+    def _get_specs(self, parsed_args):
+        if not parsed_args.from_file:
+            if parsed_args.name is None:
+                msg = _("<name> is required if --from-file is not "
+                        "specified.")
+                raise exceptions.CommandError(msg)
+            return [parsed_args]
+
+        line_parser = argparse.ArgumentParser(prog='volume create')
+        line_parser.add_argument("name", metavar="<name>")
+        _add_create_arguments(line_parser)
+        specs = []
+        for number, args in bulk.read_argument_lines(
+                parsed_args.from_file):
+            try:
+                specs.append(line_parser.parse_args(args))
+            except SystemExit:
+                msg = _("Invalid volume arguments at line %(line)s of "
+                        "%(file)s")
+                raise exceptions.CommandError(
+                    msg % {'line': number, 'file': parsed_args.from_file})
+        return specs
+
+    def take_action(self, parsed_args):
+
+        def _show_progress(done, total):
+            self.app.stdout.write('\rProgress: %s/%s' % (done, total))
+            self.app.stdout.flush()
+
+        if parsed_args.count < 1:
+            msg = _("--count must be greater than 0")
+            raise exceptions.CommandError(msg)
+
+        volume_client = self.app.client_manager.volume
+
+        # Resolve the sources of each volume once, whatever the count
+        requests = []
+        for spec in self._get_specs(parsed_args):
+            attrs = _get_create_attrs(self.app.client_manager, spec)
+            for i in range(1, parsed_args.count + 1):
+                volume_attrs = dict(attrs)
+                if parsed_args.count > 1:
+                    volume_attrs['name'] = '%s-%d' % (spec.name, i)
+                requests.append((spec, volume_attrs))
+
+        def _create(request):
+            spec, attrs = request
+            volume = volume_client.volumes.create(**attrs)
+            _set_create_flags(volume_client, volume.id, spec)
+            return volume
+
+        volumes = []
+        result = 0
+        for (spec, attrs), volume, e in concurrency.run_concurrently(
+                _create, requests):
+            if e is not None:
+                result += 1
+                LOG.error(_("Failed to create volume '%(volume)s': %(e)s"),
+                          {'volume': attrs['name'], 'e': e})
+            else:
+                volumes.append(volume)
+
+        statuses = {}
+        if parsed_args.wait and volumes:
+            statuses = volume_common.wait_for_volumes(
+                volume_client, [volume.id for volume in volumes],
+                callback=_show_progress)
+            self.app.stdout.write('\n')
+            for volume in volumes:
+                if statuses[volume.id] != 'available':
+                    result += 1
+                    LOG.error(_("Volume '%(volume)s' ended in %(status)s "
+                                "status"), {'volume': volume.id,
+                                            'status': statuses[volume.id]})
+
+        columns = ('ID', 'Name', 'Status')
+        data = [
+            (volume.id, volume.name, statuses.get(volume.id, volume.status))
+            for volume in volumes
+        ]
+        if result > 0:
+            # Show the created volumes so that they can be cleaned up
+            self.produce_output(parsed_args, columns, data)
+            msg = (_("%(result)s of %(total)s volumes failed "
+                   "to create.") % {'result': result, 'total': len(requests)})
+            raise exceptions.CommandError(msg)
+        return (columns, data)
+
+
 class DeleteVolume(command.Command):
     _description = _("Delete volume(s)")
 
@@ -277,26 +453,45 @@ class DeleteVolume(command.Command):
             help=_("Remove any snapshots along with volume(s) "
                    "(defaults to False)")
         )
+        parser.add_argument(
+            "--wait",
+            action="store_true",
+            help=_("Wait for the volume(s) to be deleted"),
+        )
         return parser
 
     def take_action(self, parsed_args):
         volume_client = self.app.client_manager.volume
         result = 0
 
-        for i in parsed_args.volumes:
-            try:
-                volume_obj = utils.find_resource(
-                    volume_client.volumes, i)
-                if parsed_args.force:
-                    volume_client.volumes.force_delete(volume_obj.id)
-                else:
-                    volume_client.volumes.delete(volume_obj.id,
-                                                 cascade=parsed_args.purge)
-            except Exception as e:
+        def _delete(volume):
+            volume_obj = utils.find_resource(volume_client.volumes, volume)
+            if parsed_args.force:
+                volume_client.volumes.force_delete(volume_obj.id)
+            else:
+                volume_client.volumes.delete(volume_obj.id,
+                                             cascade=parsed_args.purge)
+            return volume_obj.id
+
+        deleted = []
+        for i, volume_id, e in concurrency.run_concurrently(
+                _delete, parsed_args.volumes):
+            if e is not None:
                 result += 1
                 LOG.error(_("Failed to delete volume with "
                             "name or ID '%(volume)s': %(e)s"),
                           {'volume': i, 'e': e})
+            else:
+                deleted.append(volume_id)
+
+        if parsed_args.wait and deleted:
+            statuses = volume_common.wait_for_volumes(
+                volume_client, deleted, success_status=(),
+                error_status=('error_deleting',))
+            for volume_id, status in statuses.items():
+                if status != 'deleted':
+                    result += 1
+                    LOG.error(_("Failed to delete volume '%s'"), volume_id)
 
         if result > 0:
             total = len(parsed_args.volumes)
@@ -349,13 +544,21 @@ class ListVolume(command.Lister):
             metavar='<volume>',
             help=_('The last volume ID of the previous page'),
         )
-        parser.add_argument(
+        pagination_group = parser.add_mutually_exclusive_group()
+        pagination_group.add_argument(
             '--limit',
             type=int,
             action=parseractions.NonNegativeAction,
             metavar='<num-volumes>',
             help=_('Maximum number of volumes to display'),
         )
+        pagination_group.add_argument(
+            '--all-pages',
+            action='store_true',
+            default=False,
+            help=_('List all the volumes page after page, fetching the '
+                   'next page while the current one is displayed'),
+        )
         return parser
 
     def take_action(self, parsed_args):
@@ -425,11 +628,18 @@ class ListVolume(command.Lister):
             'status': parsed_args.status,
         }
 
-        data = volume_client.volumes.list(
-            search_opts=search_opts,
-            marker=parsed_args.marker,
-            limit=parsed_args.limit,
-        )
+        if parsed_args.all_pages:
+            data = volume_common.list_all_pages(
+                volume_client.volumes.list,
+                search_opts=search_opts,
+                marker=parsed_args.marker,
+            )
+        else:
+            data = volume_client.volumes.list(
+                search_opts=search_opts,
+                marker=parsed_args.marker,
+                limit=parsed_args.limit,
+            )
         column_headers = utils.backward_compat_col_lister(
             column_headers, parsed_args.columns, {'Display Name': 'Name'})
 
@@ -754,6 +964,86 @@ class ShowVolume(command.ShowOne):
         return zip(*sorted(volume._info.items()))
 
 
+# Volume attributes the volumes can be summarized by, with their headers
+_SUMMARY_GROUPS = {
+    'project': ('Project', 'os-vol-tenant-attr:tenant_id'),
+    'type': ('Type', 'volume_type'),
+    'availability-zone': ('Availability Zone', 'availability_zone'),
+}
+
+
+def _summarize_volumes(volumes, group_by):
+    """Count the volumes and sum their sizes by group
+
+    Only the counters of each group are kept, so ``volumes`` can be a
+    generator streaming a listing of any size.
+
+    :param volumes: iterable of volumes
+    :param group_by: keys of ``_SUMMARY_GROUPS`` to group the volumes by
+    :returns: a dict mapping tuples of group values to ``[count, size]``
+    """
+    attrs = [_SUMMARY_GROUPS[group][1] for group in group_by]
+    summary = {}
+    for volume in volumes:
+        key = tuple(getattr(volume, attr, None) or '' for attr in attrs)
+        counters = summary.setdefault(key, [0, 0])
+        counters[0] += 1
+        counters[1] += volume.size or 0
+    return summary
+
+
+class VolumeSummary(command.Lister):
+    _description = _("Show the number and total size of volumes")
+
+    def get_parser(self, prog_name):
+        parser = super(VolumeSummary, self).get_parser(prog_name)
+        parser.add_argument(
+            '--all-projects',
+            action='store_true',
+            default=False,
+            help=_('Include all projects (admin only)'),
+        )
+        parser.add_argument(
+            '--group-by',
+            metavar='<group>',
+            action='append',
+            choices=list(_SUMMARY_GROUPS),
+            default=[],
+            help=_('Summarize volumes by group (repeat option to group by '
+                   'multiple fields). The supported options are: %s') %
+            ', '.join(_SUMMARY_GROUPS),
+        )
+        return parser
+
+    def take_action(self, parsed_args):
+        volume_client = self.app.client_manager.volume
+
+        group_by = list(dict.fromkeys(parsed_args.group_by))
+        column_headers = tuple(
+            _SUMMARY_GROUPS[group][0] for group in group_by
+        ) + ('Total Count', 'Total Size')
+
+        if (not group_by and volume_client.api_version >=
+                api_versions.APIVersion('3.12')):
+            summary = volume_client.volumes.summary(
+                all_tenants=parsed_args.all_projects)['volume-summary']
+            return (column_headers,
+                    [(summary['total_count'], summary['total_size'])])
+
+        # Cinder can't group summaries, so walk through the volumes
+        # instead, keeping one page in memory at a time
+        volumes = volume_common.list_all_pages(
+            volume_client.volumes.list,
+            search_opts={'all_tenants': parsed_args.all_projects},
+        )
+        summary = _summarize_volumes(volumes, group_by)
+        if not group_by and not summary:
+            summary = {(): [0, 0]}
+
+        return (column_headers,
+                (key + tuple(summary[key]) for key in sorted(summary)))
+
+
 class UnsetVolume(command.Command):
     _description = _("Unset volume properties")
 
@@ -17,6 +17,7 @@
 import copy
 import functools
 import logging
+import time
 
 from cinderclient import api_versions
 from cliff import columns as cliff_columns
@@ -25,7 +26,11 @@ from osc_lib.command import command
 from osc_lib import exceptions
 from osc_lib import utils
 
+from openstackclient.common import bulk
+from openstackclient.common import concurrency
 from openstackclient.i18n import _
+from openstackclient.identity import common as identity_common
+from openstackclient.volume import common as volume_common
 
 
 LOG = logging.getLogger(__name__)
@@ -174,6 +179,215 @@ class CreateVolumeBackup(command.ShowOne):
         return zip(*sorted(backup._info.items()))
 
 
+class CreateVolumeBackupBulk(command.Lister):
+    _description = _("Create backups of many volumes")
+
+    def get_parser(self, prog_name):
+        parser = super().get_parser(prog_name)
+        source_group = parser.add_mutually_exclusive_group(required=True)
+        source_group.add_argument(
+            "--volumes-from-file",
+            metavar="<file>",
+            help=_("File holding one volume to backup (name or ID) per "
+                   "line, '-' to read standard input. Empty lines and "
+                   "comments starting with '#' are ignored."),
+        )
+        source_group.add_argument(
+            "--project",
+            metavar="<project>",
+            help=_("Backup all the volumes of this project (name or ID) "
+                   "(admin only)"),
+        )
+        identity_common.add_project_domain_option_to_parser(parser)
+        parser.add_argument(
+            "--container",
+            metavar="<container>",
+            help=_("Optional backup container name")
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            default=False,
+            help=_("Allow to back up in-use volumes")
+        )
+        incremental_group = parser.add_mutually_exclusive_group()
+        incremental_group.add_argument(
+            '--incremental',
+            action='store_true',
+            default=False,
+            help=_("Perform incremental backups")
+        )
+        incremental_group.add_argument(
+            '--auto-incremental',
+            action='store_true',
+            default=False,
+            help=_("Perform an incremental backup of the volumes having an "
+                   "available backup and a full backup of the others")
+        )
+        parser.add_argument(
+            '--max-running',
+            metavar='<count>',
+            type=int,
+            default=concurrency.BULK_CONCURRENCY,
+            help=_("Maximum number of backups being created at the same "
+                   "time (default: %s)") % concurrency.BULK_CONCURRENCY,
+        )
+        return parser
+
+    def _get_volume_ids(self, parsed_args, project_id):
+        """Return the IDs of the volumes to backup and the failed lookups"""
+        volume_client = self.app.client_manager.volume
+
+        if project_id:
+            volumes = volume_common.list_all_pages(
+                volume_client.volumes.list,
+                search_opts={'all_tenants': True, 'project_id': project_id},
+            )
+            return [volume.id for volume in volumes], []
+
+        volumes = []
+        for number, args in bulk.read_argument_lines(
+                parsed_args.volumes_from_file):
+            if len(args) != 1:
+                msg = _("Invalid volume at line %(line)s of %(file)s")
+                raise exceptions.CommandError(msg % {
+                    'line': number, 'file': parsed_args.volumes_from_file})
+            volumes.append(args[0])
+
+        volume_ids = []
+        failures = []
+        for volume, volume_obj, e in concurrency.run_concurrently(
+                lambda v: utils.find_resource(volume_client.volumes, v),
+                dict.fromkeys(volumes)):
+            if e is not None:
+                LOG.error(_("Failed to find volume with name or ID "
+                            "'%(volume)s': %(e)s"), {'volume': volume, 'e': e})
+                failures.append(volume)
+            else:
+                volume_ids.append(volume_obj.id)
+        return list(dict.fromkeys(volume_ids)), failures
+
+    def _get_backed_up_volume_ids(self, volume_ids, project_id, max_workers):
+        """Return the IDs of the volumes having an available backup
+
+        The backups of the project are listed at once, otherwise only the
+        backups of the given volumes are looked up.
+        """
+        backups_list = self.app.client_manager.volume.backups.list
+
+        if project_id:
+            backups = volume_common.list_all_pages(
+                backups_list,
+                search_opts={'all_tenants': True,
+                             'project_id': project_id,
+                             'status': 'available'})
+            return set(backup.volume_id for backup in backups)
+
+        def _has_backup(volume_id):
+            return bool(backups_list(
+                search_opts={'all_tenants': True,
+                             'volume_id': volume_id,
+                             'status': 'available'},
+                limit=1))
+
+        backed_up = set()
+        for volume_id, has_backup, e in concurrency.run_concurrently(
+                _has_backup, volume_ids, max_workers=max_workers):
+            if e is not None:
+                LOG.warning(_("Failed to list the backups of volume "
+                              "'%(volume)s', doing a full backup: %(e)s"),
+                            {'volume': volume_id, 'e': e})
+            elif has_backup:
+                backed_up.add(volume_id)
+        return backed_up
+
+    def take_action(self, parsed_args):
+        volume_client = self.app.client_manager.volume
+
+        if parsed_args.max_running < 1:
+            msg = _("--max-running must be greater than 0")
+            raise exceptions.CommandError(msg)
+
+        project_id = None
+        if parsed_args.project:
+            project_id = identity_common.find_project(
+                self.app.client_manager.identity,
+                parsed_args.project,
+                parsed_args.project_domain,
+            ).id
+        volume_ids, failures = self._get_volume_ids(parsed_args, project_id)
+
+        incremental = dict.fromkeys(volume_ids, parsed_args.incremental)
+        if parsed_args.auto_incremental:
+            for volume_id in self._get_backed_up_volume_ids(
+                    volume_ids, project_id, parsed_args.max_running):
+                if volume_id in incremental:
+                    incremental[volume_id] = True
+
+        def _create(volume_id):
+            return volume_client.backups.create(
+                volume_id,
+                container=parsed_args.container,
+                force=parsed_args.force,
+                incremental=incremental[volume_id],
+            )
+
+        # Keep at most --max-running backups being created, submitting new
+        # ones as the running ones complete. Only the running backups are
+        # polled, listing the backups would return every backup of the
+        # cloud with --project.
+        pending = list(volume_ids)
+        running = {}
+        results = {}
+        while pending or running:
+            slots = parsed_args.max_running - len(running)
+            batch, pending = pending[:slots], pending[slots:]
+            for volume_id, backup, e in concurrency.run_concurrently(
+                    _create, batch, max_workers=parsed_args.max_running):
+                if e is not None:
+                    LOG.error(_("Failed to backup volume '%(volume)s': "
+                                "%(e)s"), {'volume': volume_id, 'e': e})
+                    results[volume_id] = ('', 'error')
+                else:
+                    running[backup.id] = volume_id
+            if not running:
+                continue
+
+            statuses = volume_common.get_statuses_by_id(
+                volume_client.backups.get, list(running),
+                max_workers=parsed_args.max_running)
+            for backup_id, status in statuses.items():
+                if status in ('error', 'deleted'):
+                    LOG.error(_("Backup %(backup)s of volume '%(volume)s' "
+                                "ended in %(status)s status"),
+                              {'backup': backup_id,
+                               'volume': running[backup_id],
+                               'status': status})
+                if status in ('available', 'error', 'deleted'):
+                    results[running.pop(backup_id)] = (backup_id, status)
+            if running and (not pending or
+                            len(running) >= parsed_args.max_running):
+                time.sleep(volume_common.WAIT_INTERVAL)
+
+        columns = ('Volume', 'Backup ID', 'Incremental', 'Status')
+        data = [
+            (volume, '', parsed_args.incremental, 'error')
+            for volume in failures
+        ] + [
+            (volume_id, results[volume_id][0], incremental[volume_id],
+             results[volume_id][1])
+            for volume_id in volume_ids
+        ]
+
+        failed = sum(1 for row in data if row[3] != 'available')
+        if failed:
+            self.produce_output(parsed_args, columns, data)
+            msg = _("%(failed)s of %(total)s backups failed.") % {
+                'failed': failed, 'total': len(data)}
+            raise exceptions.CommandError(msg)
+        return (columns, data)
+
+
 class DeleteVolumeBackup(command.Command):
     _description = _("Delete volume backup(s)")
 
@@ -197,13 +411,15 @@ class DeleteVolumeBackup(command.Command):
         volume_client = self.app.client_manager.volume
         result = 0
 
-        for i in parsed_args.backups:
-            try:
-                backup_id = utils.find_resource(
-                    volume_client.backups, i,
-                ).id
-                volume_client.backups.delete(backup_id, parsed_args.force)
-            except Exception as e:
+        def _delete(backup):
+            backup_id = utils.find_resource(
+                volume_client.backups, backup,
+            ).id
+            volume_client.backups.delete(backup_id, parsed_args.force)
+
+        for i, _result, e in concurrency.run_concurrently(
+                _delete, parsed_args.backups):
+            if e is not None:
                 result += 1
                 LOG.error(_("Failed to delete backup with "
                             "name or ID '%(backup)s': %(e)s")
@@ -258,13 +474,21 @@ class ListVolumeBackup(command.Lister):
             metavar='<volume-backup>',
             help=_('The last backup of the previous page (name or ID)'),
         )
-        parser.add_argument(
+        pagination_group = parser.add_mutually_exclusive_group()
+        pagination_group.add_argument(
             '--limit',
             type=int,
             action=parseractions.NonNegativeAction,
             metavar='<num-backups>',
             help=_('Maximum number of backups to display'),
         )
+        pagination_group.add_argument(
+            '--all-pages',
+            action='store_true',
+            default=False,
+            help=_('List all the backups page after page, fetching the '
+                   'next page while the current one is displayed'),
+        )
         parser.add_argument(
             '--all-projects',
             action='store_true',
@@ -296,18 +520,6 @@ class ListVolumeBackup(command.Lister):
             columns += ('availability_zone', 'volume_id', 'container')
             column_headers += ('Availability Zone', 'Volume', 'Container')
 
-        # Cache the volume list
-        volume_cache = {}
-        try:
-            for s in volume_client.volumes.list():
-                volume_cache[s.id] = s
-        except Exception:
-            # Just forget it if there's any trouble
-            pass
-
-        _VolumeIdColumn = functools.partial(
-            VolumeIdColumn, volume_cache=volume_cache)
-
         filter_volume_id = None
         if parsed_args.volume:
             try:
@@ -334,11 +546,28 @@ class ListVolumeBackup(command.Lister):
             'volume_id': filter_volume_id,
             'all_tenants': parsed_args.all_projects,
         }
-        data = volume_client.backups.list(
-            search_opts=search_opts,
-            marker=marker_backup_id,
-            limit=parsed_args.limit,
-        )
+        if parsed_args.all_pages:
+            data = volume_common.list_all_pages(
+                volume_client.backups.list,
+                search_opts=search_opts,
+                marker=marker_backup_id,
+            )
+        else:
+            data = volume_client.backups.list(
+                search_opts=search_opts,
+                marker=marker_backup_id,
+                limit=parsed_args.limit,
+            )
+
+        # Resolve the names of the volumes of the listed backups
+        volume_cache = {}
+        if volume_common.is_column_displayed(
+                parsed_args, column_headers, columns, 'volume_id'):
+            data = list(data)
+            volume_cache = volume_common.get_volume_cache(
+                volume_client, (s.volume_id for s in data))
+        _VolumeIdColumn = functools.partial(
+            VolumeIdColumn, volume_cache=volume_cache)
 
         return (
             column_headers,
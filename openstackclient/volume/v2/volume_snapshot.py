@@ -25,8 +25,10 @@ from osc_lib.command import command
 from osc_lib import exceptions
 from osc_lib import utils
 
+from openstackclient.common import concurrency
 from openstackclient.i18n import _
 from openstackclient.identity import common as identity_common
+from openstackclient.volume import common as volume_common
 
 
 LOG = logging.getLogger(__name__)
@@ -165,13 +167,15 @@ class DeleteVolumeSnapshot(command.Command):
         volume_client = self.app.client_manager.volume
         result = 0
 
-        for i in parsed_args.snapshots:
-            try:
-                snapshot_id = utils.find_resource(
-                    volume_client.volume_snapshots, i).id
-                volume_client.volume_snapshots.delete(
-                    snapshot_id, parsed_args.force)
-            except Exception as e:
+        def _delete(snapshot):
+            snapshot_id = utils.find_resource(
+                volume_client.volume_snapshots, snapshot).id
+            volume_client.volume_snapshots.delete(
+                snapshot_id, parsed_args.force)
+
+        for i, _result, e in concurrency.run_concurrently(
+                _delete, parsed_args.snapshots):
+            if e is not None:
                 result += 1
                 LOG.error(_("Failed to delete snapshot with "
                             "name or ID '%(snapshot)s': %(e)s")
@@ -212,13 +216,21 @@ class ListVolumeSnapshot(command.Lister):
             metavar='<volume-snapshot>',
             help=_('The last snapshot ID of the previous page'),
         )
-        parser.add_argument(
+        pagination_group = parser.add_mutually_exclusive_group()
+        pagination_group.add_argument(
             '--limit',
             type=int,
             action=parseractions.NonNegativeAction,
             metavar='<num-snapshots>',
             help=_('Maximum number of snapshots to display'),
         )
+        pagination_group.add_argument(
+            '--all-pages',
+            action='store_true',
+            default=False,
+            help=_('List all the snapshots page after page, fetching the '
+                   'next page while the current one is displayed'),
+        )
         parser.add_argument(
             '--name',
             metavar='<name>',
@@ -256,17 +268,6 @@ class ListVolumeSnapshot(command.Lister):
             columns = ['ID', 'Name', 'Description', 'Status', 'Size']
             column_headers = copy.deepcopy(columns)
 
-        # Cache the volume list
-        volume_cache = {}
-        try:
-            for s in volume_client.volumes.list():
-                volume_cache[s.id] = s
-        except Exception:
-            # Just forget it if there's any trouble
-            pass
-        _VolumeIdColumn = functools.partial(VolumeIdColumn,
-                                            volume_cache=volume_cache)
-
         volume_id = None
         if parsed_args.volume:
             volume_id = utils.find_resource(
@@ -291,11 +292,29 @@ class ListVolumeSnapshot(command.Lister):
             'volume_id': volume_id,
         }
 
-        data = volume_client.volume_snapshots.list(
-            search_opts=search_opts,
-            marker=parsed_args.marker,
-            limit=parsed_args.limit,
-        )
+        if parsed_args.all_pages:
+            data = volume_common.list_all_pages(
+                volume_client.volume_snapshots.list,
+                search_opts=search_opts,
+                marker=parsed_args.marker,
+            )
+        else:
+            data = volume_client.volume_snapshots.list(
+                search_opts=search_opts,
+                marker=parsed_args.marker,
+                limit=parsed_args.limit,
+            )
+
+        # Resolve the names of the volumes of the listed snapshots
+        volume_cache = {}
+        if volume_common.is_column_displayed(
+                parsed_args, column_headers, columns, 'Volume ID'):
+            data = list(data)
+            volume_cache = volume_common.get_volume_cache(
+                volume_client, (s.volume_id for s in data))
+        _VolumeIdColumn = functools.partial(VolumeIdColumn,
+                                            volume_cache=volume_cache)
+
         return (column_headers,
                 (utils.get_item_properties(
                     s, columns,